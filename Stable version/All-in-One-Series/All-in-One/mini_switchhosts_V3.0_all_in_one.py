@@ -8,19 +8,284 @@ Supports Windows, Linux, and macOS with multilingual interface
 
 import sys
 import os
-import requests
+import re
+import io
+import hashlib
+import asyncio
+import aiohttp
 import shutil
+import stat
+import socket
 import ctypes
-import tempfile
-import threading
 import platform
 from datetime import datetime
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                                QHBoxLayout, QTextEdit, QPushButton, QLabel,
-                               QMessageBox, QFileDialog, QSplitter, QProgressBar,
-                               QComboBox, QStatusBar, QGroupBox, QTabWidget)
-from PySide6.QtCore import Qt, QThread, Signal as pyqtSignal, QTimer
-from PySide6.QtGui import QFont, QTextCursor, QAction, QIcon
+                               QMessageBox, QProgressBar, QComboBox, QStatusBar,
+                               QGroupBox)
+from PySide6.QtCore import Qt, QObject, QThread, Signal as pyqtSignal, Slot
+from PySide6.QtGui import QFont, QTextCursor, QAction
+
+
+# Mirror lists for each target, built once at import
+_GITHUB_SOURCES = (
+    "https://gitee.com/ineo6/hosts/raw/master/hosts",
+    "https://raw.hellogithub.com/hosts",
+    "https://cdn.jsdelivr.net/gh/ineo6/hosts/hosts",
+)
+_REPLIT_SOURCES = (
+    "https://raw.githubusercontent.com/techsharing/toolbox/main/hosts/replit-hosts",
+    "https://gitee.com/techsharing/toolbox/raw/main/hosts/replit-hosts",
+    "https://cdn.jsdelivr.net/gh/techsharing/toolbox/hosts/replit-hosts",
+)
+
+# Domain matchers compiled once so each line is scanned in a single pass
+_GITHUB_DOMAINS_RE = re.compile(
+    r'github\.com|github\.global\.ssl\.fastly\.net|assets-cdn\.github\.com|'
+    r'github\.githubassets\.com|codeload\.github\.com|api\.github\.com|'
+    r'raw\.githubusercontent\.com|user-images\.githubusercontent\.com|'
+    r'favicons\.githubusercontent\.com|camo\.githubusercontent\.com|'
+    r'gist\.github\.com|gist\.githubusercontent\.com'
+)
+_REPLIT_DOMAINS_RE = re.compile(
+    r'replit\.com|repl\.co|repl\.it|cdn\.replit\.com|static\.replit\.com|'
+    r'sp\.replit\.com|replit\.app|firewalledreplit\.com|ide\.replit\.com|'
+    r'docs\.replit\.com|api\.replit\.com|eval\.replit\.com|widgets\.replit\.com'
+)
+# Hosts rule line: "<IPv4> <host> [aliases...]", matched directly against the whole content
+_RULE_RE = re.compile(r'^[ \t]*(\d{1,3}(?:\.\d{1,3}){3})[ \t]+(\S[^\r\n]*)', re.MULTILINE)
+
+# The latest release page redirects to .../releases/tag/<tag>
+RELEASES_URL = "https://github.com/Feng-zimo/mini-SwitchHosts/releases/latest"
+_VERSION_RE = re.compile(r'[vV]?(\d+(?:\.\d+)*)')
+
+
+def _version_tuple(tag):
+    """Parse a release tag like 'v3.0.1' into (3, 0, 1); None if it is not numeric"""
+    m = _VERSION_RE.match(tag)
+    if not m:
+        return None
+    parts = [int(p) for p in m.group(1).split('.')]
+    while len(parts) > 1 and parts[-1] == 0:  # 3.0.0 and 3.0 are the same version
+        parts.pop()
+    return tuple(parts)
+
+# UI strings for each language; any language other than English uses Chinese
+_MSGS = {
+    'en': {
+        'error': "❌ Error: {error}",
+        'connecting_servers': "📡 Connecting to servers with enhanced protocol...",
+        'source': "Source",
+        'download_success': "✅ Enhanced download completed successfully",
+        'all_sources_failed': "All sources failed",
+        'fetching': "🔄 Fetching from {host}...",
+        'source_failed': "⚠️  {url} failed: {error}",
+        'github_not_found': "# GitHub related rules not found",
+        'replit_not_found': "# Replit related rules not found",
+        'incremental_start': "🔄 Performing incremental update...",
+        'changes_detected': "🔍 Changes detected, applying update...",
+        'no_changes': "✅ No changes detected, hosts file is up to date",
+        'incremental_failed': "❌ Incremental update failed: {error}",
+        'backup_created': "✅ Backup created: {path}",
+        'backup_failed_detail': "❌ Backup failed: {error}",
+        'restoring': "🔄 Restoring from backup...",
+        'backup_dir_not_found_log': "❌ Backup directory not found",
+        'backup_dir_not_found': "Backup directory not found",
+        'no_backup_files_log': "❌ No backup files found",
+        'no_backup_files': "No backup files found",
+        'restore_success_from': "✅ Backup restored successfully from {backup}",
+        'restore_failed_detail': "❌ Restore failed: {error}",
+        'checking_admin': "🛡️ Checking administrator privileges...",
+        'admin_required': "Administrator privileges required, please run the program as administrator",
+        'creating_backup': "📦 Creating backup...",
+        'backup_failed': "Backup failed",
+        'reading_hosts': "📖 Reading existing hosts file...",
+        'cleaning_rules': "🧹 Cleaning up old rules...",
+        'writing_hosts': "💾 Writing new hosts file...",
+        'permission_denied': "Permission denied: {error}. Please make sure to run the program as administrator.",
+        'write_failed': "Write failed: {error}",
+        'connecting_github': "📡 Connecting to GitHub...",
+        'update_check_failed_detail': "⚠️  Update check failed: {error}",
+        'window_title': "mini-SwitchHosts v3.0 All-in-One - Enhanced Edition",
+        'target_group': "Target Selection",
+        'select_target': "Select Target:",
+        'download_btn': "📥 Download Rules",
+        'apply_btn': "✅ Apply Rules",
+        'backup_btn': "📦 Create Backup",
+        'restore_btn': "🔄 Restore Backup",
+        'update_btn': "🔍 Check for Updates",
+        'status_ready': "Ready - mini-SwitchHosts v3.0 All-in-One Enhanced Edition",
+        'started': "🚀 mini-SwitchHosts v3.0 All-in-One started",
+        'menu_file': "File",
+        'menu_exit': "Exit",
+        'menu_language': "Language",
+        'menu_help': "Help",
+        'menu_about': "About",
+        'target_changed': "Target changed to: {target}",
+        'download_starting': "Starting enhanced rules download...",
+        'preview_start': "--- Preview of downloaded rules ---",
+        'preview_end': "--- End of preview ---",
+        'download_failed': "❌ Download failed",
+        'no_rules': "⚠️  No rules to apply. Please download rules first.",
+        'applying': "Applying enhanced rules...",
+        'apply_success': "✅ Rules applied successfully!",
+        'success_title': "Success",
+        'apply_success_message': "Hosts rules have been applied successfully!",
+        'apply_failed': "❌ Failed to apply rules",
+        'error_title': "Error",
+        'backup_starting': "Creating backup...",
+        'backup_success': "✅ Backup created successfully!",
+        'backup_failed_log': "❌ Backup failed",
+        'restore_starting': "Restoring backup...",
+        'confirm_restore_title': "Confirm Restore",
+        'confirm_restore_message': "Are you sure you want to restore from backup?\nThis will replace your current hosts file.",
+        'restore_success': "✅ Backup restored successfully!",
+        'restore_success_message': "Hosts file has been restored from backup!",
+        'restore_failed': "❌ Failed to restore backup",
+        'checking_updates': "🔍 Checking for updates...",
+        'new_version': "🎉 New version available: {version}",
+        'visit_github': "Please visit GitHub to download the latest version",
+        'update_available_title': "Update Available",
+        'update_available_message': "New version {version} is available!\nPlease visit GitHub to download.",
+        'latest_version_log': "✅ You are using the latest version",
+        'up_to_date_title': "Up to Date",
+        'up_to_date_message': "You are using the latest version!",
+        'update_check_failed': "❌ Update check failed",
+        'status_done': "Operation completed - mini-SwitchHosts v3.0 All-in-One",
+        'about_title': "About mini-SwitchHosts",
+        'confirm_exit_title': "Confirm Exit",
+        'confirm_exit_message': "Are you sure you want to exit?\nUnsaved changes may be lost.",
+        'admin_title': "Administrator Privileges Required",
+        'admin_restart_question': "This program requires administrator privileges to modify the hosts file.\n\nWould you like to restart as administrator?",
+        'admin_failed': "Failed to obtain administrator privileges.",
+        'admin_sudo': "This program requires administrator privileges. Please run with sudo.",
+        'about_html': """
+            <h2>mini-SwitchHosts v3.0 All-in-One</h2>
+            <p><b>Enhanced Edition with Improved Features</b></p>
+            <p>Enhanced IP resolution, smart filtering, and incremental updates</p>
+            <p><b>Key Improvements:</b></p>
+            <ul>
+                <li>Enhanced IP parsing algorithm for better accuracy</li>
+                <li>Smart rule filtering to remove invalid entries</li>
+                <li>Incremental update mechanism for efficiency</li>
+                <li>Modern UI with real-time status monitoring</li>
+                <li>Concurrent processing for faster downloads</li>
+                <li>Multi-language support (English and Chinese)</li>
+                <li>Cross-platform compatibility (Windows, Linux, macOS)</li>
+            </ul>
+            <p>© 2025 mini-SwitchHosts Project</p>
+            """,
+    },
+    'zh': {
+        'error': "❌ 错误: {error}",
+        'connecting_servers': "📡 使用增强协议连接服务器...",
+        'source': "来源",
+        'download_success': "✅ 增强版下载成功完成",
+        'all_sources_failed': "所有源都尝试失败",
+        'fetching': "🔄 正在从 {host} 获取...",
+        'source_failed': "⚠️  {url} 失败: {error}",
+        'github_not_found': "# 未找到GitHub相关规则",
+        'replit_not_found': "# 未找到Replit相关规则",
+        'incremental_start': "🔄 执行增量更新...",
+        'changes_detected': "🔍 检测到变更，正在应用更新...",
+        'no_changes': "✅ 未检测到变更，hosts文件已为最新",
+        'incremental_failed': "❌ 增量更新失败: {error}",
+        'backup_created': "✅ 备份已创建: {path}",
+        'backup_failed_detail': "❌ 备份失败: {error}",
+        'restoring': "🔄 从备份恢复...",
+        'backup_dir_not_found_log': "❌ 未找到备份目录",
+        'backup_dir_not_found': "未找到备份目录",
+        'no_backup_files_log': "❌ 未找到备份文件",
+        'no_backup_files': "未找到备份文件",
+        'restore_success_from': "✅ 成功从 {backup} 恢复备份",
+        'restore_failed_detail': "❌ 恢复失败: {error}",
+        'checking_admin': "🛡️ 检查管理员权限...",
+        'admin_required': "需要管理员权限，请以管理员身份运行程序",
+        'creating_backup': "📦 创建备份...",
+        'backup_failed': "备份失败",
+        'reading_hosts': "📖 读取现有hosts文件...",
+        'cleaning_rules': "🧹 清理旧规则...",
+        'writing_hosts': "💾 写入新hosts文件...",
+        'permission_denied': "权限拒绝: {error}。请确保以管理员身份运行程序。",
+        'write_failed': "写入失败: {error}",
+        'connecting_github': "📡 正在连接GitHub...",
+        'update_check_failed_detail': "⚠️  更新检查失败: {error}",
+        'window_title': "mini-SwitchHosts v3.0 一体化增强版",
+        'target_group': "目标选择",
+        'select_target': "选择目标:",
+        'download_btn': "📥 下载规则",
+        'apply_btn': "✅ 应用规则",
+        'backup_btn': "📦 创建备份",
+        'restore_btn': "🔄 恢复备份",
+        'update_btn': "🔍 检查更新",
+        'status_ready': "就绪 - mini-SwitchHosts v3.0 一体化增强版",
+        'started': "🚀 mini-SwitchHosts v3.0 一体化版本已启动",
+        'menu_file': "文件",
+        'menu_exit': "退出",
+        'menu_language': "语言",
+        'menu_help': "帮助",
+        'menu_about': "关于",
+        'target_changed': "目标已更改为: {target}",
+        'download_starting': "开始增强版规则下载...",
+        'preview_start': "--- 下载规则预览 ---",
+        'preview_end': "--- 预览结束 ---",
+        'download_failed': "❌ 下载失败",
+        'no_rules': "⚠️  没有可应用的规则。请先下载规则。",
+        'applying': "正在应用增强版规则...",
+        'apply_success': "✅ 规则应用成功!",
+        'success_title': "成功",
+        'apply_success_message': "Hosts规则已成功应用!",
+        'apply_failed': "❌ 规则应用失败",
+        'error_title': "错误",
+        'backup_starting': "正在创建备份...",
+        'backup_success': "✅ 备份创建成功!",
+        'backup_failed_log': "❌ 备份失败",
+        'restore_starting': "正在恢复备份...",
+        'confirm_restore_title': "确认恢复",
+        'confirm_restore_message': "确定要从备份恢复吗?\n这将替换您当前的hosts文件。",
+        'restore_success': "✅ 备份恢复成功!",
+        'restore_success_message': "Hosts文件已从备份恢复!",
+        'restore_failed': "❌ 备份恢复失败",
+        'checking_updates': "🔍 正在检查更新...",
+        'new_version': "🎉 发现新版本: {version}",
+        'visit_github': "请访问GitHub下载最新版本",
+        'update_available_title': "发现更新",
+        'update_available_message': "新版本 {version} 已发布!\n请访问GitHub下载最新版本。",
+        'latest_version_log': "✅ 您使用的是最新版本",
+        'up_to_date_title': "已是最新",
+        'up_to_date_message': "您使用的是最新版本!",
+        'update_check_failed': "❌ 更新检查失败",
+        'status_done': "操作完成 - mini-SwitchHosts v3.0 一体化",
+        'about_title': "关于 mini-SwitchHosts",
+        'confirm_exit_title': "确认退出",
+        'confirm_exit_message': "确定要退出吗?\n未保存的更改可能会丢失。",
+        'admin_title': "需要管理员权限",
+        'admin_restart_question': "此程序需要管理员权限来修改hosts文件。\n\n是否要以管理员身份重新启动?",
+        'admin_failed': "无法获取管理员权限。",
+        'admin_sudo': "此程序需要管理员权限。请使用sudo运行。",
+        'about_html': """
+            <h2>mini-SwitchHosts v3.0 一体化版本</h2>
+            <p><b>增强版，包含改进功能</b></p>
+            <p>增强的IP解析、智能过滤和增量更新</p>
+            <p><b>主要改进:</b></p>
+            <ul>
+                <li>增强的IP解析算法，提高准确性</li>
+                <li>智能规则过滤，去除无效条目</li>
+                <li>增量更新机制，提高效率</li>
+                <li>现代化UI，支持实时状态监控</li>
+                <li>并发处理，加快下载速度</li>
+                <li>多语言支持（英文和中文）</li>
+                <li>跨平台兼容性（Windows、Linux、macOS）</li>
+            </ul>
+            <p>© 2025 mini-SwitchHosts 项目</p>
+            """,
+    },
+}
+
+
+def tr(language, key):
+    """Look up a UI string in the given language"""
+    return _MSGS.get(language, _MSGS['zh']).get(key, key)
 
 
 def is_admin():
@@ -60,20 +325,43 @@ def get_system_language():
     return 'en'
 
 
-class EnhancedHostsManagerThread(QThread):
-    """Enhanced background thread with concurrent processing"""
+class HostsWorker(QObject):
+    """Enhanced background worker living on one persistent thread"""
     log_signal = pyqtSignal(str)
     result_signal = pyqtSignal(dict)
     progress_signal = pyqtSignal(int)
+    task_result = pyqtSignal(str, dict)
+    task_finished = pyqtSignal()
 
-    def __init__(self, task_type, data=None, target_type='github', language='en'):
+    def __init__(self):
         super().__init__()
-        self.task_type = task_type  # 'download', 'apply', 'backup', 'restore', 'incremental'
+        self.task_type = None  # 'download', 'apply', 'backup', 'restore', 'incremental'
+        self.data = None
+        self.target_type = 'github'
+        self.language = 'en'
+        self._loop = None
+        self._connector = None
+        self._session = None
+        self._progress = 0
+        self._progress_step = 0
+        # Tag every result with the task that produced it
+        self.result_signal.connect(self._tag_result)
+
+    def _t(self, key):
+        """Look up a UI string in the current language"""
+        return tr(self.language, key)
+
+    def _tag_result(self, result):
+        """Re-emit a result together with the current task type"""
+        self.task_result.emit(self.task_type, result)
+
+    @Slot(str, object, str, str)
+    def do_task(self, task_type, data, target_type, language):
+        """Run one queued task on the worker thread"""
+        self.task_type = task_type
         self.data = data
         self.target_type = target_type
         self.language = language
-
-    def run(self):
         try:
             if self.task_type == 'download':
                 self.download_hosts_enhanced()
@@ -88,60 +376,60 @@ class EnhancedHostsManagerThread(QThread):
             elif self.task_type == 'update_check':
                 self.check_for_updates()
         except Exception as e:
-            self.log_signal.emit(f"❌ Error: {str(e)}" if self.language == 'en' else f"❌ 错误: {str(e)}")
+            self.log_signal.emit(self._t('error').format(error=str(e)))
+        finally:
+            self.task_finished.emit()
+
+    def _run_async(self, coro):
+        """Run a coroutine on the worker's event loop, creating it on first use"""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    def _get_connector(self):
+        """Shared connector so resolved mirror addresses are reused across requests"""
+        if self._connector is None or self._connector.closed:
+            self._connector = aiohttp.TCPConnector(limit=8, ttl_dns_cache=300, use_dns_cache=True)
+        return self._connector
+
+    def _get_session(self):
+        """Keep-alive HTTP session reused by every request on the worker"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(connector=self._get_connector(), connector_owner=False)
+        return self._session
+
+    @Slot()
+    def close_loop(self):
+        """Close the shared session, connector and the event loop"""
+        if self._loop is None:
+            return
+        if self._session is not None:
+            self._loop.run_until_complete(self._session.close())
+            self._session = None
+        if self._connector is not None:
+            self._loop.run_until_complete(self._connector.close())
+            self._connector = None
+        self._loop.close()
+        self._loop = None
 
     def download_hosts_enhanced(self):
         """Enhanced download with smart filtering and concurrent requests"""
-        msg = "📡 Connecting to servers with enhanced protocol..." if self.language == 'en' else "📡 使用增强协议连接服务器..."
+        msg = self._t('connecting_servers')
         self.log_signal.emit(msg)
         self.progress_signal.emit(10)
 
-        if self.target_type == 'github':
-            sources = [
-                "https://gitee.com/ineo6/hosts/raw/master/hosts",
-                "https://raw.hellogithub.com/hosts",
-                "https://cdn.jsdelivr.net/gh/ineo6/hosts/hosts"
-            ]
-        else:  # replit
-            sources = [
-                "https://raw.githubusercontent.com/techsharing/toolbox/main/hosts/replit-hosts",
-                "https://gitee.com/techsharing/toolbox/raw/main/hosts/replit-hosts",
-                "https://cdn.jsdelivr.net/gh/techsharing/toolbox/hosts/replit-hosts"
-            ]
-
-        # Concurrent requests for faster downloads
-        results = {}
-        threads = []
-        
-        def fetch_source(source, index):
-            try:
-                host = source.split('//')[1].split('/')[0]
-                msg = f"🔄 Fetching from {host}..." if self.language == 'en' else f"🔄 正在从 {host} 获取..."
-                self.log_signal.emit(msg)
-                response = requests.get(source, timeout=15)
-                if response.status_code == 200:
-                    results[index] = response.text
-            except Exception as e:
-                msg = f"⚠️  {source} failed: {str(e)}" if self.language == 'en' else f"⚠️  {source} 失败: {str(e)}"
-                self.log_signal.emit(msg)
-
-        # Start concurrent requests
-        for i, source in enumerate(sources):
-            thread = threading.Thread(target=fetch_source, args=(source, i))
-            threads.append(thread)
-            thread.start()
-            self.progress_signal.emit(20 + i * 15)
-
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
+        sources = _GITHUB_SOURCES if self.target_type == 'github' else _REPLIT_SOURCES
+
+        # Race all sources concurrently and keep the first successful response
+        self._progress = 10
+        self._progress_step = 70 // len(sources)
+        winner = self._run_async(self._race(sources))
 
         self.progress_signal.emit(80)
         
         # Process results
-        if results:
-            # Use the first successful result
-            content = results[0] if 0 in results else list(results.values())[0]
+        if winner:
+            source, content = winner
             
             if self.target_type == 'github':
                 rules = self.extract_github_rules_enhanced(content)
@@ -149,117 +437,164 @@ class EnhancedHostsManagerThread(QThread):
                 rules = self.extract_replit_rules_enhanced(content)
             
             self.progress_signal.emit(100)
-            source_msg = "Source" if self.language == 'en' else "来源"
-            success_msg = "✅ Enhanced download completed successfully" if self.language == 'en' else "✅ 增强版下载成功完成"
-            self.result_signal.emit({'success': True, 'rules': rules, 'source': sources[0], 'message': f"{success_msg}\n{source_msg}: {sources[0]}"})
+            source_msg = self._t('source')
+            success_msg = self._t('download_success')
+            self.result_signal.emit({'success': True, 'rules': rules, 'source': source, 'message': f"{success_msg}\n{source_msg}: {source}"})
         else:
-            error_msg = "All sources failed" if self.language == 'en' else "所有源都尝试失败"
+            error_msg = self._t('all_sources_failed')
             self.result_signal.emit({'success': False, 'error': error_msg})
 
+    async def _fetch(self, session, url):
+        """Fetch a single source, return (url, text) on HTTP 200 or None"""
+        try:
+            host = url.split('//')[1].split('/')[0]
+            msg = self._t('fetching').format(host=host)
+            self.log_signal.emit(msg)
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as response:
+                if response.status == 200:
+                    # Hosts files are UTF-8; skip charset detection on the body
+                    text = (await response.read()).decode('utf-8', 'replace')
+                    self.progress_signal.emit(self._next_progress())
+                    return url, text
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            msg = self._t('source_failed').format(url=url, error=str(e))
+            self.log_signal.emit(msg)
+        self.progress_signal.emit(self._next_progress())
+        return None
+
+    def _next_progress(self):
+        """Advance download progress by one finished mirror request"""
+        self._progress = min(self._progress + self._progress_step, 80)
+        return self._progress
+
+    async def _race(self, sources):
+        """Request all sources at once and return the first successful (url, text)"""
+        session = self._get_session()
+        pending = {asyncio.ensure_future(self._fetch(session, url)) for url in sources}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    if result:
+                        return result
+        finally:
+            # Stop waiting on the slower mirrors once one has answered
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        return None
+
     def extract_github_rules_enhanced(self, content):
         """Enhanced extraction with smart filtering"""
-        github_rules = []
-        lines = content.split('\n')
-
-        for line in lines:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                if any(domain in line for domain in [
-                    'github.com', 'github.global.ssl.fastly.net',
-                    'assets-cdn.github.com', 'github.githubassets.com',
-                    'codeload.github.com', 'api.github.com',
-                    'raw.githubusercontent.com', 'user-images.githubusercontent.com',
-                    'favicons.githubusercontent.com', 'camo.githubusercontent.com',
-                    'gist.github.com', 'gist.githubusercontent.com'
-                ]):
-                    # Smart filtering - check if rule seems valid
-                    parts = line.split()
-                    if len(parts) >= 2 and self.is_valid_ip(parts[0]):
-                        github_rules.append(line)
-
-        not_found_msg = "# GitHub related rules not found" if self.language == 'en' else "# 未找到GitHub相关规则"
-        return '\n'.join(github_rules) if github_rules else not_found_msg
+        # Matched lines go straight into one buffer instead of a list joined later
+        buf = io.StringIO()
+
+        # One scan over the content; the IP is only validated on domain matches
+        for match in _RULE_RE.finditer(content):
+            if _GITHUB_DOMAINS_RE.search(match.group(2)) and self.is_valid_ip(match.group(1)):
+                buf.write(match.group(0).strip())
+                buf.write('\n')
+
+        return buf.getvalue().rstrip('\n') or self._t('github_not_found')
 
     def extract_replit_rules_enhanced(self, content):
         """Enhanced extraction with smart filtering for Replit"""
-        replit_rules = []
-        lines = content.split('\n')
-
-        for line in lines:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                if any(domain in line for domain in [
-                    'replit.com', 'repl.co', 'repl.it',
-                    'cdn.replit.com', 'static.replit.com',
-                    'sp.replit.com', 'replit.app',
-                    'firewalledreplit.com', 'ide.replit.com',
-                    'docs.replit.com', 'api.replit.com',
-                    'eval.replit.com', 'widgets.replit.com'
-                ]):
-                    # Smart filtering - check if rule seems valid
-                    parts = line.split()
-                    if len(parts) >= 2 and self.is_valid_ip(parts[0]):
-                        replit_rules.append(line)
-
-        not_found_msg = "# Replit related rules not found" if self.language == 'en' else "# 未找到Replit相关规则"
-        return '\n'.join(replit_rules) if replit_rules else not_found_msg
+        # Matched lines go straight into one buffer instead of a list joined later
+        buf = io.StringIO()
+
+        # One scan over the content; the IP is only validated on domain matches
+        for match in _RULE_RE.finditer(content):
+            if _REPLIT_DOMAINS_RE.search(match.group(2)) and self.is_valid_ip(match.group(1)):
+                buf.write(match.group(0).strip())
+                buf.write('\n')
+
+        return buf.getvalue().rstrip('\n') or self._t('replit_not_found')
 
     def is_valid_ip(self, ip_str):
         """Check if string is a valid IP address"""
         try:
-            parts = ip_str.split('.')
-            if len(parts) != 4:
-                return False
-            for part in parts:
-                if not part.isdigit() or not 0 <= int(part) <= 255:
-                    return False
-            return True
-        except:
+            socket.inet_aton(ip_str)
+        except OSError:
             return False
+        # inet_aton also accepts short forms such as "1.2.3"
+        return ip_str.count('.') == 3
 
     def incremental_update(self):
         """Incremental update mechanism"""
-        msg = "🔄 Performing incremental update..." if self.language == 'en' else "🔄 执行增量更新..."
+        msg = self._t('incremental_start')
         self.log_signal.emit(msg)
         # Compare current rules with new ones and only apply changes
         try:
             hosts_path = self.get_hosts_path()
+            new_digest = self.section_fingerprint(self.data)
+            sidecar_path = os.path.join(os.path.expanduser('~'), 'HostsBackups', f'.section_{self.target_type}.b2')
             
-            # Read current hosts file
-            with open(hosts_path, 'r', encoding='utf-8') as f:
-                current_content = f.read()
-            
-            # Extract existing GitHub/Replit rules
-            section_name = "GitHub" if self.target_type == "github" else "Replit"
-            existing_rules = ""
-            in_section = False
-            
-            for line in current_content.split('\n'):
-                if f"# {section_name} Hosts Start" in line:
-                    in_section = True
-                    continue
-                elif f"# {section_name} Hosts End" in line:
-                    in_section = False
-                    continue
+            # Same rules as the last apply and hosts untouched since: skip reading hosts entirely
+            if self.read_section_sidecar(sidecar_path) == (new_digest, os.stat(hosts_path).st_mtime_ns):
+                changed = False
+            else:
+                # Stream the hosts file and extract existing GitHub/Replit rules
+                section_name = "GitHub" if self.target_type == "github" else "Replit"
+                start_marker = f"# {section_name} Hosts Start"
+                end_marker = f"# {section_name} Hosts End"
+                existing_rules = []
+                in_section = False
+                
+                with open(hosts_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if start_marker in line:
+                            in_section = True
+                            continue
+                        elif end_marker in line:
+                            break
+                        
+                        if in_section:
+                            existing_rules.append(line)
                 
-                if in_section:
-                    existing_rules += line + '\n'
+                changed = self.section_fingerprint(''.join(existing_rules)) != new_digest
             
             # Compare with new rules
-            if existing_rules.strip() != self.data.strip():
-                detect_msg = "🔍 Changes detected, applying update..." if self.language == 'en' else "🔍 检测到变更，正在应用更新..."
+            if changed:
+                detect_msg = self._t('changes_detected')
                 self.log_signal.emit(detect_msg)
-                self.apply_hosts()
+                if self.apply_hosts():
+                    self.write_section_sidecar(sidecar_path, new_digest, hosts_path)
             else:
-                up_to_date_msg = "✅ No changes detected, hosts file is up to date" if self.language == 'en' else "✅ 未检测到变更，hosts文件已为最新"
+                up_to_date_msg = self._t('no_changes')
                 self.log_signal.emit(up_to_date_msg)
+                self.write_section_sidecar(sidecar_path, new_digest, hosts_path)
             
             self.result_signal.emit({'success': True})
         except Exception as e:
-            fail_msg = f"❌ Incremental update failed: {str(e)}" if self.language == 'en' else f"❌ 增量更新失败: {str(e)}"
+            fail_msg = self._t('incremental_failed').format(error=str(e))
             self.log_signal.emit(fail_msg)
             self.result_signal.emit({'success': False, 'error': str(e)})
 
+    def section_fingerprint(self, rules):
+        """Fixed-size BLAKE2b fingerprint of a hosts section"""
+        return hashlib.blake2b(rules.strip().encode('utf-8'), digest_size=16).hexdigest()
+
+    def read_section_sidecar(self, sidecar_path):
+        """Read (fingerprint, hosts mtime) recorded by the last successful update"""
+        try:
+            with open(sidecar_path, 'r', encoding='utf-8') as f:
+                digest, mtime = f.read().split()
+            return digest, int(mtime)
+        except (OSError, ValueError):
+            return None
+
+    def write_section_sidecar(self, sidecar_path, digest, hosts_path):
+        """Record the applied fingerprint together with the hosts file mtime"""
+        try:
+            os.makedirs(os.path.dirname(sidecar_path), exist_ok=True)
+            with open(sidecar_path, 'w', encoding='utf-8') as f:
+                f.write(f"{digest} {os.stat(hosts_path).st_mtime_ns}\n")
+        except OSError:
+            pass
+
     def get_hosts_path(self):
         """Get system hosts file path"""
         system = platform.system().lower()
@@ -278,72 +613,76 @@ class EnhancedHostsManagerThread(QThread):
         backup_path = os.path.join(backup_dir, f'hosts_backup_{timestamp}.txt')
         
         try:
-            shutil.copy(hosts_path, backup_path)
-            backup_msg = f"✅ Backup created: {backup_path}" if self.language == 'en' else f"✅ 备份已创建: {backup_path}"
+            shutil.copyfile(hosts_path, backup_path)
+            backup_msg = self._t('backup_created').format(path=backup_path)
             self.log_signal.emit(backup_msg)
             return True
         except Exception as e:
-            fail_msg = f"❌ Backup failed: {str(e)}" if self.language == 'en' else f"❌ 备份失败: {str(e)}"
+            fail_msg = self._t('backup_failed_detail').format(error=str(e))
             self.log_signal.emit(fail_msg)
             return False
 
     def restore_backup(self):
         """Restore hosts file from backup"""
-        restore_msg = "🔄 Restoring from backup..." if self.language == 'en' else "🔄 从备份恢复..."
+        restore_msg = self._t('restoring')
         self.log_signal.emit(restore_msg)
         try:
             # Get backup directory
             backup_dir = os.path.join(os.path.expanduser('~'), 'HostsBackups')
             
             if not os.path.exists(backup_dir):
-                not_found_msg = "❌ Backup directory not found" if self.language == 'en' else "❌ 未找到备份目录"
+                not_found_msg = self._t('backup_dir_not_found_log')
                 self.log_signal.emit(not_found_msg)
-                self.result_signal.emit({'success': False, 'error': 'Backup directory not found' if self.language == 'en' else '未找到备份目录'})
+                self.result_signal.emit({'success': False, 'error': self._t('backup_dir_not_found')})
                 return
             
-            # List all backup files
-            backups = [f for f in os.listdir(backup_dir) if f.startswith('hosts_backup_')]
-            if not backups:
-                no_backup_msg = "❌ No backup files found" if self.language == 'en' else "❌ 未找到备份文件"
+            # Timestamped names sort lexically, so the latest backup is the max name
+            with os.scandir(backup_dir) as entries:
+                latest = max((e for e in entries if e.name.startswith('hosts_backup_')),
+                             key=lambda e: e.name, default=None)
+            if latest is None:
+                no_backup_msg = self._t('no_backup_files_log')
                 self.log_signal.emit(no_backup_msg)
-                self.result_signal.emit({'success': False, 'error': 'No backup files found' if self.language == 'en' else '未找到备份文件'})
+                self.result_signal.emit({'success': False, 'error': self._t('no_backup_files')})
                 return
             
-            # Sort by timestamp to get the latest
-            backups.sort(reverse=True)
-            latest_backup = backups[0]
-            backup_path = os.path.join(backup_dir, latest_backup)
-            
             # Restore the backup
             hosts_path = self.get_hosts_path()
-            shutil.copy(backup_path, hosts_path)
+            shutil.copyfile(latest.path, hosts_path)
             
-            success_msg = f"✅ Backup restored successfully from {latest_backup}" if self.language == 'en' else f"✅ 成功从 {latest_backup} 恢复备份"
+            success_msg = self._t('restore_success_from').format(backup=latest.name)
             self.log_signal.emit(success_msg)
             self.result_signal.emit({'success': True})
         except Exception as e:
-            fail_msg = f"❌ Restore failed: {str(e)}" if self.language == 'en' else f"❌ 恢复失败: {str(e)}"
+            fail_msg = self._t('restore_failed_detail').format(error=str(e))
             self.log_signal.emit(fail_msg)
             self.result_signal.emit({'success': False, 'error': str(e)})
 
-    def clean_old_rules(self, content, target_type):
-        """Clean old rules from content"""
+    def clean_old_rules(self, hosts_path, dst_file, target_type):
+        """Stream hosts file bytes into dst_file line by line, dropping the old rules section"""
         section_name = "GitHub" if target_type == "github" else "Replit"
-        lines = content.split('\n')
-        cleaned_lines = []
+        start_marker = f"# {section_name} Hosts Start".encode()
+        end_marker = f"# {section_name} Hosts End".encode()
+        pending_blank = []
         skip = False
 
-        for line in lines:
-            if f"# {section_name} Hosts Start" in line:
-                skip = True
-            elif f"# {section_name} Hosts End" in line:
-                skip = False
-                continue
-            
-            if not skip:
-                cleaned_lines.append(line)
-
-        return '\n'.join(cleaned_lines)
+        with open(hosts_path, 'rb') as f:
+            for line in f:
+                if start_marker in line:
+                    skip = True
+                elif end_marker in line:
+                    skip = False
+                    continue
+                
+                if skip:
+                    continue
+                # Hold back blank lines so trailing ones are dropped
+                if not line.strip():
+                    pending_blank.append(line)
+                    continue
+                dst_file.writelines(pending_blank)
+                pending_blank.clear()
+                dst_file.write(line if line.endswith(b'\n') else line + b'\n')
 
     def apply_hosts(self):
         """Apply rules to hosts file - using safe write method"""
@@ -351,99 +690,135 @@ class EnhancedHostsManagerThread(QThread):
         new_rules = self.data
         target_type = self.target_type
 
-        admin_msg = "🛡️ Checking administrator privileges..." if self.language == 'en' else "🛡️ 检查管理员权限..."
+        admin_msg = self._t('checking_admin')
         self.log_signal.emit(admin_msg)
         if not is_admin():
-            error_msg = "Administrator privileges required, please run the program as administrator" if self.language == 'en' else "需要管理员权限，请以管理员身份运行程序"
+            error_msg = self._t('admin_required')
             self.result_signal.emit({'success': False, 'error': error_msg})
-            return
+            return False
 
         # Backup current hosts
-        backup_msg = "📦 Creating backup..." if self.language == 'en' else "📦 创建备份..."
+        backup_msg = self._t('creating_backup')
         self.log_signal.emit(backup_msg)
         if not self.create_backup():
-            fail_msg = "Backup failed" if self.language == 'en' else "备份失败"
+            fail_msg = self._t('backup_failed')
             self.result_signal.emit({'success': False, 'error': fail_msg})
-            return
+            return False
 
         try:
-            reading_msg = "📖 Reading existing hosts file..." if self.language == 'en' else "📖 读取现有hosts文件..."
+            reading_msg = self._t('reading_hosts')
             self.log_signal.emit(reading_msg)
-            # Read existing hosts, remove old rules
-            with open(hosts_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Clean up old rules
-            cleaning_msg = "🧹 Cleaning up old rules..." if self.language == 'en' else "🧹 清理旧规则..."
+            cleaning_msg = self._t('cleaning_rules')
             self.log_signal.emit(cleaning_msg)
-            cleaned_content = self.clean_old_rules(content, target_type)
 
-            # Build new content
             timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             section_name = "GitHub" if target_type == "github" else "Replit"
-            
-            new_content = cleaned_content.rstrip() + f'\n\n# {section_name} Hosts Start - Updated at {timestamp}\n'
-            new_content += new_rules
-            new_content += f'\n# {section_name} Hosts End\n'
 
             # Use temporary file for safe writing
-            writing_msg = "💾 Writing new hosts file..." if self.language == 'en' else "💾 写入新hosts文件..."
+            writing_msg = self._t('writing_hosts')
             self.log_signal.emit(writing_msg)
-            temp_dir = tempfile.gettempdir()
-            temp_hosts = os.path.join(temp_dir, 'hosts_temp')
-
-            with open(temp_hosts, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(new_content)
+            # Temporary file lives next to the hosts file so the swap is a rename, not a copy
+            temp_hosts = os.path.join(os.path.dirname(hosts_path), f'.hosts.tmp.{os.getpid()}')
 
-            # Copy temporary file to system hosts location
-            shutil.copy(temp_hosts, hosts_path)
+            # New section is encoded once; the rest of the file is copied as raw bytes
+            section = (f'\n# {section_name} Hosts Start - Updated at {timestamp}\n'
+                       f'{new_rules}\n# {section_name} Hosts End\n').encode('utf-8')
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
 
-            # Clean up temporary file
-            if os.path.exists(temp_hosts):
-                os.remove(temp_hosts)
+            try:
+                # Stream existing hosts without the old section, then append the new section
+                with open(os.open(temp_hosts, flags, 0o644), 'wb') as f:
+                    self.clean_old_rules(hosts_path, f, target_type)
+                    f.write(section)
+                    f.flush()
+                    # Make sure the data is on disk before the rename
+                    os.fsync(f.fileno())
+                shutil.copymode(hosts_path, temp_hosts)
+
+                # Windows refuses to replace a read-only file
+                if platform.system().lower() == 'windows' and not os.access(hosts_path, os.W_OK):
+                    os.chmod(hosts_path, stat.S_IREAD | stat.S_IWRITE)
+
+                # Atomically swap the new file into place
+                os.replace(temp_hosts, hosts_path)
+            finally:
+                # Clean up temporary file if the swap did not happen
+                if os.path.exists(temp_hosts):
+                    os.remove(temp_hosts)
 
             self.result_signal.emit({'success': True})
+            return True
 
         except PermissionError as e:
-            perm_msg = f"Permission denied: {str(e)}. Please make sure to run the program as administrator." if self.language == 'en' else f"权限拒绝: {str(e)}。请确保以管理员身份运行程序。"
+            perm_msg = self._t('permission_denied').format(error=str(e))
             self.result_signal.emit({'success': False, 'error': perm_msg})
+            return False
         except Exception as e:
-            write_msg = f"Write failed: {str(e)}" if self.language == 'en' else f"写入失败: {str(e)}"
+            write_msg = self._t('write_failed').format(error=str(e))
             self.result_signal.emit({'success': False, 'error': write_msg})
+            return False
+
+    async def _latest_release_tag(self):
+        """Read the latest release tag from the redirect of a HEAD request"""
+        async with self._get_session().head(
+                RELEASES_URL, allow_redirects=False,
+                timeout=aiohttp.ClientTimeout(total=5)) as response:
+            location = response.headers.get('Location', '')
+        if '/releases/tag/' not in location:
+            raise RuntimeError(f"HTTP {response.status}")
+        return location.rstrip('/').rsplit('/', 1)[-1]
 
     def check_for_updates(self):
         """Check for updates from GitHub"""
-        connecting_msg = "📡 Connecting to GitHub..." if self.language == 'en' else "📡 正在连接GitHub..."
+        connecting_msg = self._t('connecting_github')
         self.log_signal.emit(connecting_msg)
         try:
-            # In a real implementation, this would check GitHub for the latest release
-            # For now, we'll simulate the check
-            import time
-            time.sleep(2)  # Simulate network delay
-            
-            # For demonstration purposes, we'll return a fixed version
-            # In a real implementation, this would fetch from GitHub API
-            self.result_signal.emit({
-                'success': True, 
-                'latest_version': '3.0 All-in-One'  # Current version
-            })
+            tag = self._run_async(self._latest_release_tag())
+            self.result_signal.emit({'success': True, 'latest_version': tag})
         except Exception as e:
-            fail_msg = f"⚠️  Update check failed: {str(e)}" if self.language == 'en' else f"⚠️  更新检查失败: {str(e)}"
+            fail_msg = self._t('update_check_failed_detail').format(error=str(e))
             self.log_signal.emit(fail_msg)
             self.result_signal.emit({'success': False, 'error': str(e)})
 
 
 class MainWindow(QMainWindow):
+    task_signal = pyqtSignal(str, object, str, str)
+
     def __init__(self):
         super().__init__()
         self.language = get_system_language()  # Auto-detect system language
         self.init_ui()
         self.download_rules = ""
         self.current_target = 'github'
+        self.init_worker()
+
+    def _t(self, key):
+        """Look up a UI string in the current language"""
+        return tr(self.language, key)
+
+    def init_worker(self):
+        """Start the long-lived worker thread that runs every background task"""
+        self.result_handlers = {
+            'download': self.on_download_complete,
+            'apply': self.on_apply_complete,
+            'backup': self.on_backup_complete,
+            'restore': self.on_restore_complete,
+            'update_check': self.on_update_check_complete,
+        }
+        self.worker_thread = QThread(self)
+        self.worker = HostsWorker()
+        self.worker.moveToThread(self.worker_thread)
+        self.task_signal.connect(self.worker.do_task)
+        self.worker.log_signal.connect(self.log_message)
+        self.worker.progress_signal.connect(self.on_worker_progress)
+        self.worker.task_result.connect(self.on_task_result)
+        self.worker.task_finished.connect(self.on_worker_finished)
+        self.worker_thread.finished.connect(self.worker.close_loop, Qt.DirectConnection)
+        self.worker_thread.start()
 
     def init_ui(self):
         """Initialize user interface with modern design"""
-        title = "mini-SwitchHosts v3.0 All-in-One - Enhanced Edition" if self.language == 'en' else "mini-SwitchHosts v3.0 一体化增强版"
+        title = self._t('window_title')
         self.setWindowTitle(title)
         self.setGeometry(100, 100, 900, 700)
         
@@ -456,42 +831,43 @@ class MainWindow(QMainWindow):
         self.create_menu()
         
         # Create target selection group
-        target_group_text = "Target Selection" if self.language == 'en' else "目标选择"
-        target_group = QGroupBox(target_group_text)
+        target_group_text = self._t('target_group')
+        self.target_group = QGroupBox(target_group_text)
         target_layout = QHBoxLayout()
         self.target_combo = QComboBox()
         github_text = "GitHub"
         replit_text = "Replit"
         self.target_combo.addItems([github_text, replit_text])
         self.target_combo.currentTextChanged.connect(self.on_target_changed)
-        select_target_text = "Select Target:" if self.language == 'en' else "选择目标:"
-        target_layout.addWidget(QLabel(select_target_text))
+        select_target_text = self._t('select_target')
+        self.select_target_label = QLabel(select_target_text)
+        target_layout.addWidget(self.select_target_label)
         target_layout.addWidget(self.target_combo)
-        target_group.setLayout(target_layout)
-        main_layout.addWidget(target_group)
+        self.target_group.setLayout(target_layout)
+        main_layout.addWidget(self.target_group)
         
         # Create buttons with enhanced layout
         button_layout = QHBoxLayout()
         
-        download_text = "📥 Download Rules" if self.language == 'en' else "📥 下载规则"
+        download_text = self._t('download_btn')
         self.download_btn = QPushButton(download_text)
         self.download_btn.clicked.connect(self.download_rules_func)
         self.download_btn.setStyleSheet("QPushButton { font-weight: bold; padding: 10px; }")
         
-        apply_text = "✅ Apply Rules" if self.language == 'en' else "✅ 应用规则"
+        apply_text = self._t('apply_btn')
         self.apply_btn = QPushButton(apply_text)
         self.apply_btn.clicked.connect(self.apply_rules_func)
         self.apply_btn.setStyleSheet("QPushButton { font-weight: bold; padding: 10px; }")
         
-        backup_text = "📦 Create Backup" if self.language == 'en' else "📦 创建备份"
+        backup_text = self._t('backup_btn')
         self.backup_btn = QPushButton(backup_text)
         self.backup_btn.clicked.connect(self.create_backup_func)
         
-        restore_text = "🔄 Restore Backup" if self.language == 'en' else "🔄 恢复备份"
+        restore_text = self._t('restore_btn')
         self.restore_btn = QPushButton(restore_text)
         self.restore_btn.clicked.connect(self.restore_backup_func)
         
-        update_text = "🔍 Check for Updates" if self.language == 'en' else "🔍 检查更新"
+        update_text = self._t('update_btn')
         self.update_btn = QPushButton(update_text)
         self.update_btn.clicked.connect(self.check_for_updates)
         
@@ -517,14 +893,11 @@ class MainWindow(QMainWindow):
         # Create status bar
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
-        status_text = "Ready - mini-SwitchHosts v3.0 All-in-One Enhanced Edition" if self.language == 'en' else "就绪 - mini-SwitchHosts v3.0 一体化增强版"
+        status_text = self._t('status_ready')
         self.status_bar.showMessage(status_text)
         
-        # Initialize worker thread
-        self.worker_thread = None
-        
         # Log startup message
-        start_msg = "🚀 mini-SwitchHosts v3.0 All-in-One started" if self.language == 'en' else "🚀 mini-SwitchHosts v3.0 一体化版本已启动"
+        start_msg = self._t('started')
         self.log_message(start_msg)
 
     def create_menu(self):
@@ -532,61 +905,73 @@ class MainWindow(QMainWindow):
         menubar = self.menuBar()
         
         # File menu
-        file_text = "File" if self.language == 'en' else "文件"
-        file_menu = menubar.addMenu(file_text)
+        file_text = self._t('menu_file')
+        self.file_menu = menubar.addMenu(file_text)
         
-        exit_text = "Exit" if self.language == 'en' else "退出"
-        exit_action = QAction(exit_text, self)
-        exit_action.setShortcut('Ctrl+Q')
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
+        exit_text = self._t('menu_exit')
+        self.exit_action = QAction(exit_text, self)
+        self.exit_action.setShortcut('Ctrl+Q')
+        self.exit_action.triggered.connect(self.close)
+        self.file_menu.addAction(self.exit_action)
         
         # Language menu
-        lang_text = "Language" if self.language == 'en' else "语言"
-        lang_menu = menubar.addMenu(lang_text)
+        lang_text = self._t('menu_language')
+        self.lang_menu = menubar.addMenu(lang_text)
         
         en_action = QAction("English", self)
         en_action.triggered.connect(lambda: self.change_language('en'))
-        lang_menu.addAction(en_action)
+        self.lang_menu.addAction(en_action)
         
         zh_action = QAction("中文", self)
         zh_action.triggered.connect(lambda: self.change_language('zh'))
-        lang_menu.addAction(zh_action)
+        self.lang_menu.addAction(zh_action)
         
         # Help menu
-        help_text = "Help" if self.language == 'en' else "帮助"
-        help_menu = menubar.addMenu(help_text)
+        help_text = self._t('menu_help')
+        self.help_menu = menubar.addMenu(help_text)
         
-        about_text = "About" if self.language == 'en' else "关于"
-        about_action = QAction(about_text, self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
+        about_text = self._t('menu_about')
+        self.about_action = QAction(about_text, self)
+        self.about_action.triggered.connect(self.show_about)
+        self.help_menu.addAction(self.about_action)
 
     def change_language(self, lang):
         """Change application language"""
         self.language = lang
-        self.init_ui()
+        self._retranslate()
+
+    def _retranslate(self):
+        """Swap the texts of the existing widgets to the current language"""
+        self.setWindowTitle(self._t('window_title'))
+        self.file_menu.setTitle(self._t('menu_file'))
+        self.exit_action.setText(self._t('menu_exit'))
+        self.lang_menu.setTitle(self._t('menu_language'))
+        self.help_menu.setTitle(self._t('menu_help'))
+        self.about_action.setText(self._t('menu_about'))
+        self.target_group.setTitle(self._t('target_group'))
+        self.select_target_label.setText(self._t('select_target'))
+        self.download_btn.setText(self._t('download_btn'))
+        self.apply_btn.setText(self._t('apply_btn'))
+        self.backup_btn.setText(self._t('backup_btn'))
+        self.restore_btn.setText(self._t('restore_btn'))
+        self.update_btn.setText(self._t('update_btn'))
+        self.status_bar.showMessage(self._t('status_ready'))
 
     def on_target_changed(self, text):
         """Handle target selection change"""
         self.current_target = text.lower()
-        target_msg = f"Target changed to: {text}" if self.language == 'en' else f"目标已更改为: {text}"
+        target_msg = self._t('target_changed').format(target=text)
         self.log_message(target_msg)
 
     def download_rules_func(self):
         """Download rules from network sources"""
-        download_msg = "Starting enhanced rules download..." if self.language == 'en' else "开始增强版规则下载..."
+        download_msg = self._t('download_starting')
         self.log_message(download_msg)
         self.download_btn.setEnabled(False)
         self.progress_bar.setValue(0)
         
         target_type = self.current_target
-        self.worker_thread = EnhancedHostsManagerThread('download', target_type=target_type, language=self.language)
-        self.worker_thread.log_signal.connect(self.log_message)
-        self.worker_thread.result_signal.connect(self.on_download_complete)
-        self.worker_thread.progress_signal.connect(self.progress_bar.setValue)
-        self.worker_thread.finished.connect(self.on_worker_finished)
-        self.worker_thread.start()
+        self.task_signal.emit('download', None, target_type, self.language)
 
     def on_download_complete(self, result):
         """Handle download completion"""
@@ -596,164 +981,158 @@ class MainWindow(QMainWindow):
             if message:
                 self.log_message(message)
             else:
-                success_msg = "✅ Enhanced download completed successfully" if self.language == 'en' else "✅ 增强版下载成功完成"
+                success_msg = self._t('download_success')
                 source_msg = result.get('source', 'Unknown')
-                source_text = "Source" if self.language == 'en' else "来源"
+                source_text = self._t('source')
                 self.log_message(f"{success_msg}\n{source_text}: {source_msg}")
             
             # Show preview of rules
-            preview_text = "--- Preview of downloaded rules ---" if self.language == 'en' else "--- 下载规则预览 ---"
+            preview_text = self._t('preview_start')
             self.log_message(preview_text)
-            rules_preview = '\n'.join(self.download_rules.split('\n')[:10])  # Show first 10 lines
-            self.log_message(rules_preview)
-            if len(self.download_rules.split('\n')) > 10:
+            # Split stops after the 10th newline, so only the preview is materialized
+            head = self.download_rules.split('\n', 10)
+            self.log_message('\n'.join(head[:10]))  # Show first 10 lines
+            if len(head) > 10:
                 self.log_message("...")
-            end_preview_text = "--- End of preview ---" if self.language == 'en' else "--- 预览结束 ---"
+            end_preview_text = self._t('preview_end')
             self.log_message(end_preview_text)
         else:
-            fail_text = "❌ Download failed" if self.language == 'en' else "❌ 下载失败"
+            fail_text = self._t('download_failed')
             error_msg = result.get('error', 'Unknown error')
             self.log_message(f"{fail_text}: {error_msg}")
 
     def apply_rules_func(self):
         """Apply downloaded rules to hosts file"""
         if not self.download_rules:
-            no_rules_text = "⚠️  No rules to apply. Please download rules first." if self.language == 'en' else "⚠️  没有可应用的规则。请先下载规则。"
+            no_rules_text = self._t('no_rules')
             self.log_message(no_rules_text)
             return
             
-        applying_text = "Applying enhanced rules..." if self.language == 'en' else "正在应用增强版规则..."
+        applying_text = self._t('applying')
         self.log_message(applying_text)
         self.apply_btn.setEnabled(False)
         
         target_type = self.current_target
-        self.worker_thread = EnhancedHostsManagerThread('apply', self.download_rules, target_type, self.language)
-        self.worker_thread.log_signal.connect(self.log_message)
-        self.worker_thread.result_signal.connect(self.on_apply_complete)
-        self.worker_thread.progress_signal.connect(self.progress_bar.setValue)
-        self.worker_thread.finished.connect(self.on_worker_finished)
-        self.worker_thread.start()
+        self.task_signal.emit('apply', self.download_rules, target_type, self.language)
 
     def on_apply_complete(self, result):
         """Handle apply completion"""
         if result.get('success'):
-            success_text = "✅ Rules applied successfully!" if self.language == 'en' else "✅ 规则应用成功!"
+            success_text = self._t('apply_success')
             self.log_message(success_text)
-            title = "Success" if self.language == 'en' else "成功"
-            message = "Hosts rules have been applied successfully!" if self.language == 'en' else "Hosts规则已成功应用!"
+            title = self._t('success_title')
+            message = self._t('apply_success_message')
             QMessageBox.information(self, title, message)
         else:
-            fail_text = "❌ Failed to apply rules" if self.language == 'en' else "❌ 规则应用失败"
+            fail_text = self._t('apply_failed')
             error_msg = result.get('error', 'Unknown error')
             self.log_message(f"{fail_text}: {error_msg}")
-            title = "Error" if self.language == 'en' else "错误"
+            title = self._t('error_title')
             QMessageBox.critical(self, title, f"{fail_text}:\n{error_msg}")
 
     def create_backup_func(self):
         """Create backup of current hosts file"""
-        backup_text = "Creating backup..." if self.language == 'en' else "正在创建备份..."
+        backup_text = self._t('backup_starting')
         self.log_message(backup_text)
         self.backup_btn.setEnabled(False)
         
-        self.worker_thread = EnhancedHostsManagerThread('backup', language=self.language)
-        self.worker_thread.log_signal.connect(self.log_message)
-        self.worker_thread.result_signal.connect(self.on_backup_complete)
-        self.worker_thread.progress_signal.connect(self.progress_bar.setValue)
-        self.worker_thread.finished.connect(self.on_worker_finished)
-        self.worker_thread.start()
+        self.task_signal.emit('backup', None, self.current_target, self.language)
 
     def on_backup_complete(self, result):
         """Handle backup completion"""
         if result.get('success'):
-            success_text = "✅ Backup created successfully!" if self.language == 'en' else "✅ 备份创建成功!"
+            success_text = self._t('backup_success')
             self.log_message(success_text)
         else:
-            fail_text = "❌ Backup failed" if self.language == 'en' else "❌ 备份失败"
+            fail_text = self._t('backup_failed_log')
             error_msg = result.get('error', 'Unknown error')
             self.log_message(f"{fail_text}: {error_msg}")
 
     def restore_backup_func(self):
         """Restore hosts file from backup"""
-        restore_text = "Restoring backup..." if self.language == 'en' else "正在恢复备份..."
+        restore_text = self._t('restore_starting')
         self.log_message(restore_text)
         self.restore_btn.setEnabled(False)
         
-        confirm_title = "Confirm Restore" if self.language == 'en' else "确认恢复"
-        confirm_msg = "Are you sure you want to restore from backup?\nThis will replace your current hosts file." if self.language == 'en' else "确定要从备份恢复吗?\n这将替换您当前的hosts文件。"
+        confirm_title = self._t('confirm_restore_title')
+        confirm_msg = self._t('confirm_restore_message')
         reply = QMessageBox.question(self, confirm_title, confirm_msg, QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         
         if reply == QMessageBox.Yes:
-            self.worker_thread = EnhancedHostsManagerThread('restore', language=self.language)
-            self.worker_thread.log_signal.connect(self.log_message)
-            self.worker_thread.result_signal.connect(self.on_restore_complete)
-            self.worker_thread.progress_signal.connect(self.progress_bar.setValue)
-            self.worker_thread.finished.connect(self.on_worker_finished)
-            self.worker_thread.start()
+            self.task_signal.emit('restore', None, self.current_target, self.language)
         else:
             self.restore_btn.setEnabled(True)
 
     def on_restore_complete(self, result):
         """Handle restore completion"""
         if result.get('success'):
-            success_text = "✅ Backup restored successfully!" if self.language == 'en' else "✅ 备份恢复成功!"
+            success_text = self._t('restore_success')
             self.log_message(success_text)
-            title = "Success" if self.language == 'en' else "成功"
-            message = "Hosts file has been restored from backup!" if self.language == 'en' else "Hosts文件已从备份恢复!"
+            title = self._t('success_title')
+            message = self._t('restore_success_message')
             QMessageBox.information(self, title, message)
         else:
-            fail_text = "❌ Failed to restore backup" if self.language == 'en' else "❌ 备份恢复失败"
+            fail_text = self._t('restore_failed')
             error_msg = result.get('error', 'Unknown error')
             self.log_message(f"{fail_text}: {error_msg}")
-            title = "Error" if self.language == 'en' else "错误"
+            title = self._t('error_title')
             QMessageBox.critical(self, title, f"{fail_text}:\n{error_msg}")
 
     def check_for_updates(self):
         """Check for updates from GitHub"""
-        update_text = "🔍 Checking for updates..." if self.language == 'en' else "🔍 正在检查更新..."
+        update_text = self._t('checking_updates')
         self.log_message(update_text)
         self.update_btn.setEnabled(False)
         
-        self.worker_thread = EnhancedHostsManagerThread('update_check', language=self.language)
-        self.worker_thread.log_signal.connect(self.log_message)
-        self.worker_thread.result_signal.connect(self.on_update_check_complete)
-        self.worker_thread.finished.connect(self.on_worker_finished)
-        self.worker_thread.start()
+        self.task_signal.emit('update_check', None, self.current_target, self.language)
 
     def on_update_check_complete(self, result):
         """Handle update check completion"""
         if result.get('success'):
             latest_version = result.get('latest_version', 'Unknown')
-            current_version = "3.0 All-in-One"
+            current_version = "3.0"
+            latest = _version_tuple(latest_version)
             
-            if latest_version != current_version:
-                new_ver_text = f"🎉 New version available: {latest_version}" if self.language == 'en' else f"🎉 发现新版本: {latest_version}"
+            # Only a strictly newer numeric release counts as an update
+            if latest is not None and latest > _version_tuple(current_version):
+                new_ver_text = self._t('new_version').format(version=latest_version)
                 self.log_message(new_ver_text)
-                visit_text = "Please visit GitHub to download the latest version" if self.language == 'en' else "请访问GitHub下载最新版本"
+                visit_text = self._t('visit_github')
                 self.log_message(visit_text)
-                title = "Update Available" if self.language == 'en' else "发现更新"
-                message = f"New version {latest_version} is available!\nPlease visit GitHub to download." if self.language == 'en' else f"新版本 {latest_version} 已发布!\n请访问GitHub下载最新版本。"
+                title = self._t('update_available_title')
+                message = self._t('update_available_message').format(version=latest_version)
                 QMessageBox.information(self, title, message)
             else:
-                up_to_date_text = "✅ You are using the latest version" if self.language == 'en' else "✅ 您使用的是最新版本"
+                up_to_date_text = self._t('latest_version_log')
                 self.log_message(up_to_date_text)
-                title = "Up to Date" if self.language == 'en' else "已是最新"
-                message = "You are using the latest version!" if self.language == 'en' else "您使用的是最新版本!"
+                title = self._t('up_to_date_title')
+                message = self._t('up_to_date_message')
                 QMessageBox.information(self, title, message)
         else:
-            fail_text = "❌ Update check failed" if self.language == 'en' else "❌ 更新检查失败"
+            fail_text = self._t('update_check_failed')
             error_msg = result.get('error', 'Unknown error')
             self.log_message(f"{fail_text}: {error_msg}")
-            title = "Error" if self.language == 'en' else "错误"
+            title = self._t('error_title')
             QMessageBox.critical(self, title, f"{fail_text}:\n{error_msg}")
 
+    def on_task_result(self, task_type, result):
+        """Route a worker result to the handler of the task that produced it"""
+        handler = self.result_handlers.get(task_type)
+        if handler:
+            handler(result)
+
+    def on_worker_progress(self, value):
+        """Update progress bar from the worker"""
+        self.progress_bar.setValue(value)
+
     def on_worker_finished(self):
-        """Handle worker thread completion"""
+        """Handle worker task completion"""
         self.download_btn.setEnabled(True)
         self.apply_btn.setEnabled(True)
         self.backup_btn.setEnabled(True)
         self.restore_btn.setEnabled(True)
         self.update_btn.setEnabled(True)
-        status_text = "Operation completed - mini-SwitchHosts v3.0 All-in-One" if self.language == 'en' else "操作完成 - mini-SwitchHosts v3.0 一体化"
+        status_text = self._t('status_done')
         self.status_bar.showMessage(status_text)
 
     def log_message(self, message):
@@ -766,50 +1145,17 @@ class MainWindow(QMainWindow):
 
     def show_about(self):
         """Show about dialog"""
-        if self.language == 'en':
-            about_text = """
-            <h2>mini-SwitchHosts v3.0 All-in-One</h2>
-            <p><b>Enhanced Edition with Improved Features</b></p>
-            <p>Enhanced IP resolution, smart filtering, and incremental updates</p>
-            <p><b>Key Improvements:</b></p>
-            <ul>
-                <li>Enhanced IP parsing algorithm for better accuracy</li>
-                <li>Smart rule filtering to remove invalid entries</li>
-                <li>Incremental update mechanism for efficiency</li>
-                <li>Modern UI with real-time status monitoring</li>
-                <li>Concurrent processing for faster downloads</li>
-                <li>Multi-language support (English and Chinese)</li>
-                <li>Cross-platform compatibility (Windows, Linux, macOS)</li>
-            </ul>
-            <p>© 2025 mini-SwitchHosts Project</p>
-            """
-        else:
-            about_text = """
-            <h2>mini-SwitchHosts v3.0 一体化版本</h2>
-            <p><b>增强版，包含改进功能</b></p>
-            <p>增强的IP解析、智能过滤和增量更新</p>
-            <p><b>主要改进:</b></p>
-            <ul>
-                <li>增强的IP解析算法，提高准确性</li>
-                <li>智能规则过滤，去除无效条目</li>
-                <li>增量更新机制，提高效率</li>
-                <li>现代化UI，支持实时状态监控</li>
-                <li>并发处理，加快下载速度</li>
-                <li>多语言支持（英文和中文）</li>
-                <li>跨平台兼容性（Windows、Linux、macOS）</li>
-            </ul>
-            <p>© 2025 mini-SwitchHosts 项目</p>
-            """
-        title = "About mini-SwitchHosts" if self.language == 'en' else "关于 mini-SwitchHosts"
-        QMessageBox.about(self, title, about_text)
+        QMessageBox.about(self, self._t('about_title'), self._t('about_html'))
 
     def closeEvent(self, event):
         """Handle application close event"""
-        confirm_title = "Confirm Exit" if self.language == 'en' else "确认退出"
-        confirm_msg = "Are you sure you want to exit?\nUnsaved changes may be lost." if self.language == 'en' else "确定要退出吗?\n未保存的更改可能会丢失。"
+        confirm_title = self._t('confirm_exit_title')
+        confirm_msg = self._t('confirm_exit_message')
         reply = QMessageBox.question(self, confirm_title, confirm_msg, QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         
         if reply == QMessageBox.Yes:
+            self.worker_thread.quit()
+            self.worker_thread.wait()
             event.accept()
         else:
             event.ignore()
@@ -823,23 +1169,24 @@ def main():
     app.setApplicationVersion("3.0 All-in-One")
     
     # Check for administrator privileges
+    language = get_system_language()
     if not is_admin():
         if platform.system().lower() == 'windows':
-            reply = QMessageBox.question(None, 'Administrator Privileges Required' if get_system_language() == 'en' else '需要管理员权限',
-                                       'This program requires administrator privileges to modify the hosts file.\n\nWould you like to restart as administrator?' if get_system_language() == 'en' else '此程序需要管理员权限来修改hosts文件。\n\n是否要以管理员身份重新启动?',
+            reply = QMessageBox.question(None, tr(language, 'admin_title'),
+                                       tr(language, 'admin_restart_question'),
                                        QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
             
             if reply == QMessageBox.Yes:
                 if not run_as_admin():
-                    QMessageBox.critical(None, 'Error' if get_system_language() == 'en' else '错误', 
-                                       'Failed to obtain administrator privileges.' if get_system_language() == 'en' else '无法获取管理员权限。')
+                    QMessageBox.critical(None, tr(language, 'error_title'), 
+                                       tr(language, 'admin_failed'))
                     sys.exit(1)
             else:
                 sys.exit(0)
         else:
             # For Linux/macOS, just show a message
-            QMessageBox.critical(None, 'Administrator Privileges Required' if get_system_language() == 'en' else '需要管理员权限',
-                               'This program requires administrator privileges. Please run with sudo.' if get_system_language() == 'en' else '此程序需要管理员权限。请使用sudo运行。')
+            QMessageBox.critical(None, tr(language, 'admin_title'),
+                               tr(language, 'admin_sudo'))
             sys.exit(1)
     
     # Create and show main window
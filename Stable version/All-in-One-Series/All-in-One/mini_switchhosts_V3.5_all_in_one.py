@@ -19,8 +19,9 @@ import json
 import zipfile
 import urllib.request
 from datetime import datetime
+from functools import lru_cache
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
-                               QHBoxLayout, QTextEdit, QPushButton, QLabel,
+                               QHBoxLayout, QTextEdit, QPlainTextEdit, QPushButton, QLabel,
                                QMessageBox, QFileDialog, QSplitter, QProgressBar,
                                QComboBox, QStatusBar, QGroupBox, QTabWidget,
                                QTreeWidgetItem, QTreeWidget, QHeaderView, 
@@ -67,6 +68,50 @@ def get_system_language():
     return 'en'
 
 
+@lru_cache(maxsize=2)
+def _about_html(lang):
+    """Build the About dialog HTML for a language (cached per language)"""
+    if lang == 'en':
+        return """
+        <h2>mini-SwitchHosts v3.5 All-in-One Edition</h2>
+        <p><b>Enhanced Edition with Advanced Features</b></p>
+        <p>Enhanced IP resolution, smart filtering, incremental updates, and plugin system</p>
+        <p><b>Key Improvements:</b></p>
+        <ul>
+            <li>Enhanced IP parsing algorithm for better accuracy</li>
+            <li>Smart rule filtering to remove invalid entries</li>
+            <li>Incremental update mechanism for efficiency</li>
+            <li>Modern UI with real-time status monitoring</li>
+            <li>Concurrent processing for faster downloads</li>
+            <li>Multi-language support (English and Chinese)</li>
+            <li>Cross-platform compatibility (Windows, Linux, macOS)</li>
+            <li>Plugin system for extensibility</li>
+            <li>Advanced rule management</li>
+            <li>Dark theme support</li>
+        </ul>
+        <p>© 2025 mini-SwitchHosts Project</p>
+        """
+    return """
+        <h2>mini-SwitchHosts v3.5 一体化版本</h2>
+        <p><b>增强版，包含高级功能</b></p>
+        <p>增强的IP解析、智能过滤、增量更新和插件系统</p>
+        <p><b>主要改进:</b></p>
+        <ul>
+            <li>增强的IP解析算法，提高准确性</li>
+            <li>智能规则过滤，去除无效条目</li>
+            <li>增量更新机制，提高效率</li>
+            <li>现代化UI，支持实时状态监控</li>
+            <li>并发处理，加快下载速度</li>
+            <li>多语言支持（英文和中文）</li>
+            <li>跨平台兼容性（Windows、Linux、macOS）</li>
+            <li>插件系统，支持功能扩展</li>
+            <li>高级规则管理</li>
+            <li>暗色主题支持</li>
+        </ul>
+        <p>© 2025 mini-SwitchHosts 项目</p>
+        """
+
+
 class PluginManager:
     """Manage plugins for extending functionality"""
     
@@ -170,6 +215,33 @@ class EnhancedHostsManagerThread(QThread):
         self.data = data
         self.target_type = target_type
         self.language = language
+        self._log_buffer = []
+        self._log_lock = threading.Lock()
+        self._log_timer = None
+
+    def _log(self, message):
+        """Queue a log line; lines are sent to the GUI in batches"""
+        with self._log_lock:
+            self._log_buffer.append(message)
+            if self._log_timer is None:
+                self._log_timer = threading.Timer(0.05, self._flush_log)
+                self._log_timer.daemon = True
+                self._log_timer.start()
+
+    def _flush_log(self):
+        """Emit all queued log lines as one signal"""
+        with self._log_lock:
+            if self._log_timer is not None:
+                self._log_timer.cancel()
+                self._log_timer = None
+            if self._log_buffer:
+                self.log_signal.emit("\n".join(self._log_buffer))
+                self._log_buffer.clear()
+
+    def _emit_result(self, result):
+        """Flush pending log lines so they arrive before the result"""
+        self._flush_log()
+        self.result_signal.emit(result)
 
     def run(self):
         try:
@@ -186,12 +258,14 @@ class EnhancedHostsManagerThread(QThread):
             elif self.task_type == 'update_check':
                 self.check_for_updates()
         except Exception as e:
-            self.log_signal.emit(f"❌ Error: {str(e)}" if self.language == 'en' else f"❌ 错误: {str(e)}")
+            self._log(f"❌ Error: {str(e)}" if self.language == 'en' else f"❌ 错误: {str(e)}")
+        finally:
+            self._flush_log()
 
     def download_hosts_enhanced(self):
         """Enhanced download with smart filtering and concurrent requests"""
         msg = "📡 Connecting to servers with enhanced protocol..." if self.language == 'en' else "📡 使用增强协议连接服务器..."
-        self.log_signal.emit(msg)
+        self._log(msg)
         self.progress_signal.emit(10)
 
         if self.target_type == 'github':
@@ -215,13 +289,13 @@ class EnhancedHostsManagerThread(QThread):
             try:
                 host = source.split('//')[1].split('/')[0]
                 msg = f"🔄 Fetching from {host}..." if self.language == 'en' else f"🔄 正在从 {host} 获取..."
-                self.log_signal.emit(msg)
+                self._log(msg)
                 response = requests.get(source, timeout=15)
                 if response.status_code == 200:
                     results[index] = response.text
             except Exception as e:
                 msg = f"⚠️  {source} failed: {str(e)}" if self.language == 'en' else f"⚠️  {source} 失败: {str(e)}"
-                self.log_signal.emit(msg)
+                self._log(msg)
 
         # Start concurrent requests
         for i, source in enumerate(sources):
@@ -249,10 +323,10 @@ class EnhancedHostsManagerThread(QThread):
             self.progress_signal.emit(100)
             source_msg = "Source" if self.language == 'en' else "来源"
             success_msg = "✅ Enhanced download completed successfully" if self.language == 'en' else "✅ 增强版下载成功完成"
-            self.result_signal.emit({'success': True, 'rules': rules, 'source': sources[0], 'message': f"{success_msg}\n{source_msg}: {sources[0]}"})
+            self._emit_result({'success': True, 'rules': rules, 'source': sources[0], 'message': f"{success_msg}\n{source_msg}: {sources[0]}"})
         else:
             error_msg = "All sources failed" if self.language == 'en' else "所有源都尝试失败"
-            self.result_signal.emit({'success': False, 'error': error_msg})
+            self._emit_result({'success': False, 'error': error_msg})
 
     def extract_github_rules_enhanced(self, content):
         """Enhanced extraction with smart filtering"""
@@ -312,19 +386,19 @@ class EnhancedHostsManagerThread(QThread):
         """Apply rules to system hosts file"""
         if not self.data:
             error_msg = "No rules to apply" if self.language == 'en' else "没有规则可应用"
-            self.result_signal.emit({'success': False, 'error': error_msg})
+            self._emit_result({'success': False, 'error': error_msg})
             return
 
         try:
-            self.log_signal.emit("🛡️ Checking administrator privileges..." if self.language == 'en' else "🛡️ 检查管理员权限...")
+            self._log("🛡️ Checking administrator privileges..." if self.language == 'en' else "🛡️ 检查管理员权限...")
             
             if not is_admin():
                 error_msg = "Administrator privileges required" if self.language == 'en' else "需要管理员权限"
-                self.result_signal.emit({'success': False, 'error': error_msg})
+                self._emit_result({'success': False, 'error': error_msg})
                 return
 
             hosts_path = self.get_hosts_path()
-            self.log_signal.emit(f"📂 Hosts file path: {hosts_path}" if self.language == 'en' else f"📂 Hosts文件路径: {hosts_path}")
+            self._log(f"📂 Hosts file path: {hosts_path}" if self.language == 'en' else f"📂 Hosts文件路径: {hosts_path}")
 
             # Create backup first
             self.create_backup_internal(hosts_path)
@@ -373,19 +447,34 @@ class EnhancedHostsManagerThread(QThread):
             new_lines.append(section_end_marker)
             new_lines.append("")
             
-            # Write back to hosts file
-            with open(hosts_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write('\n'.join(new_lines))
+            # Write to a temp file on the same volume, then swap it in atomically
+            # so a crash mid-write can never leave a truncated hosts file
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', newline='\n',
+                                             dir=os.path.dirname(hosts_path),
+                                             delete=False) as tf:
+                tmp_path = tf.name
+                try:
+                    tf.write('\n'.join(new_lines))
+                except BaseException:
+                    tf.close()
+                    os.remove(tmp_path)
+                    raise
+            try:
+                shutil.copymode(hosts_path, tmp_path)
+                os.replace(tmp_path, hosts_path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
             
             success_msg = "Rules applied successfully" if self.language == 'en' else "规则应用成功"
-            self.result_signal.emit({'success': True, 'message': success_msg})
+            self._emit_result({'success': True, 'message': success_msg})
             
         except PermissionError as e:
             error_msg = f"Permission denied: {str(e)}. Please run as administrator." if self.language == 'en' else f"权限被拒绝: {str(e)}。请以管理员身份运行。"
-            self.result_signal.emit({'success': False, 'error': error_msg})
+            self._emit_result({'success': False, 'error': error_msg})
         except Exception as e:
             error_msg = f"Apply failed: {str(e)}" if self.language == 'en' else f"应用失败: {str(e)}"
-            self.result_signal.emit({'success': False, 'error': error_msg})
+            self._emit_result({'success': False, 'error': error_msg})
 
     def get_hosts_path(self):
         """Get hosts file path based on OS"""
@@ -401,10 +490,10 @@ class EnhancedHostsManagerThread(QThread):
             hosts_path = self.get_hosts_path()
             self.create_backup_internal(hosts_path)
             backup_msg = "Backup created successfully" if self.language == 'en' else "备份创建成功"
-            self.result_signal.emit({'success': True, 'message': backup_msg})
+            self._emit_result({'success': True, 'message': backup_msg})
         except Exception as e:
             error_msg = f"Backup failed: {str(e)}" if self.language == 'en' else f"备份失败: {str(e)}"
-            self.result_signal.emit({'success': False, 'error': error_msg})
+            self._emit_result({'success': False, 'error': error_msg})
 
     def create_backup_internal(self, hosts_path):
         """Internal method to create backup"""
@@ -422,16 +511,16 @@ class EnhancedHostsManagerThread(QThread):
         shutil.copy2(hosts_path, backup_path)
         
         backup_created_msg = f"Backup created: {backup_path}" if self.language == 'en' else f"已创建备份: {backup_path}"
-        self.log_signal.emit(backup_created_msg)
+        self._log(backup_created_msg)
 
     def restore_backup(self):
         """Restore hosts file from backup"""
         try:
-            self.log_signal.emit("🛡️ Checking administrator privileges..." if self.language == 'en' else "🛡️ 检查管理员权限...")
+            self._log("🛡️ Checking administrator privileges..." if self.language == 'en' else "🛡️ 检查管理员权限...")
             
             if not is_admin():
                 error_msg = "Administrator privileges required" if self.language == 'en' else "需要管理员权限"
-                self.result_signal.emit({'success': False, 'error': error_msg})
+                self._emit_result({'success': False, 'error': error_msg})
                 return
 
             # Let user select backup file
@@ -446,30 +535,29 @@ class EnhancedHostsManagerThread(QThread):
             
             if not backup_file:
                 cancel_msg = "Operation cancelled" if self.language == 'en' else "操作已取消"
-                self.result_signal.emit({'success': False, 'error': cancel_msg})
+                self._emit_result({'success': False, 'error': cancel_msg})
                 return
 
             hosts_path = self.get_hosts_path()
             
-            # Use temporary file for safe restore
-            temp_dir = tempfile.gettempdir()
-            temp_hosts = os.path.join(temp_dir, 'hosts_restore_temp')
-
-            shutil.copy2(backup_file, temp_hosts)
-            shutil.copy2(temp_hosts, hosts_path)
-
-            # Clean up temporary file
-            if os.path.exists(temp_hosts):
-                os.remove(temp_hosts)
+            # Copy once to a sibling temp file, then swap it in atomically
+            temp_hosts = hosts_path + '.tmp'
+            try:
+                shutil.copy2(backup_file, temp_hosts)
+                os.replace(temp_hosts, hosts_path)
+            except BaseException:
+                if os.path.exists(temp_hosts):
+                    os.remove(temp_hosts)
+                raise
 
             success_msg = "Backup restored successfully" if self.language == 'en' else "备份恢复成功"
-            self.result_signal.emit({'success': True, 'message': success_msg})
+            self._emit_result({'success': True, 'message': success_msg})
         except PermissionError as e:
             error_msg = f"Permission denied: {str(e)}. Please run as administrator." if self.language == 'en' else f"权限被拒绝: {str(e)}。请以管理员身份运行。"
-            self.result_signal.emit({'success': False, 'error': error_msg})
+            self._emit_result({'success': False, 'error': error_msg})
         except Exception as e:
             error_msg = f"Restore failed: {str(e)}" if self.language == 'en' else f"恢复失败: {str(e)}"
-            self.result_signal.emit({'success': False, 'error': error_msg})
+            self._emit_result({'success': False, 'error': error_msg})
 
     def incremental_update(self):
         """Perform incremental update"""
@@ -485,11 +573,175 @@ class EnhancedHostsManagerThread(QThread):
 class EnhancedHostsManager(QMainWindow):
     """Enhanced main window with modern UI and advanced features"""
 
+    _strings_en = {
+        "window_title": "GitHub & Replit Hosts Manager v3.5 (All-in-One Edition)",
+        "title": "GitHub & Replit Hosts One-Click Management Tool",
+        "select_target": "Select target:",
+        "language": "Language:",
+        "ready": "Ready",
+        "log_started": "🚀 GitHub & Replit Hosts Manager v3.5 All-in-One Edition started",
+        "btn_download": "🔄 Update Rules",
+        "btn_apply": "💾 Apply Rules",
+        "btn_backup": "📦 Create Backup",
+        "btn_restore": "⏪ Restore Backup",
+        "rules_area": "Rules Display/Edit Area:",
+        "rules_placeholder": "Rules will be displayed here...",
+        "log_area": "Operation Log:",
+        "log_placeholder": "Operation logs will be displayed here...",
+        "tab_main": "Main",
+        "custom_rules": "Custom Rules",
+        "ip_address": "IP Address",
+        "domain": "Domain",
+        "group": "Group",
+        "enabled": "Enabled",
+        "btn_add_rule": "➕ Add Rule",
+        "btn_remove_rule": "➖ Remove Rule",
+        "tab_rules": "Rules",
+        "plugins_soon": "Plugins will be available in future versions",
+        "tab_plugins": "Plugins",
+        "theme_settings": "Theme Settings",
+        "dark_mode": "Dark Mode",
+        "update_settings": "Update Settings",
+        "auto_update_check": "Auto-check for updates:",
+        "tab_settings": "Settings",
+        "menu_file": "File",
+        "menu_exit": "Exit",
+        "menu_view": "View",
+        "menu_help": "Help",
+        "menu_about": "About",
+        "language_switched": "Language switched to English",
+        "admin_yes": "✅ Running with administrator privileges",
+        "admin_no": "⚠️ Not running with administrator privileges (some functions may be limited)",
+        "download_completed": "Download completed",
+        "success": "Success",
+        "rules_updated": "Rules updated successfully",
+        "error": "Error",
+        "download_failed": "Download failed",
+        "admin_required_body": "This operation requires administrator privileges. Restart as administrator?",
+        "admin_required_title": "Administrator Privileges Required",
+        "confirm": "Confirm",
+        "flush_dns_hint": "💡 Suggest flushing DNS cache: ipconfig /flushdns (Windows)",
+        "apply_ok_dialog": "Rules applied successfully! Please flush DNS cache for changes to take effect.",
+        "apply_ok_status": "Rules applied successfully",
+        "backup_start": "Starting to create backup of current hosts file...",
+        "backup_ok_log": "✅ Backup created successfully!",
+        "backup_ok_dialog": "Backup created successfully!",
+        "backup_ok_status": "Backup created successfully",
+        "restore_confirm": "This will restore the hosts file from a backup. Continue?",
+        "restore_start": "Starting to restore hosts file from backup...",
+        "restore_ok_log": "✅ Backup restored successfully!",
+        "restore_ok_dialog": "Backup restored successfully!",
+        "restore_ok_status": "Backup restored successfully",
+        "enter_ip": "Enter IP address:",
+        "enter_domain": "Enter domain:",
+        "warning": "Warning",
+        "select_rule_to_remove": "Please select a rule to remove",
+        "rule_removed": "Rule removed successfully",
+        "about_title": "About mini-SwitchHosts",
+        "confirm_exit_title": "Confirm Exit",
+        "confirm_exit_body": "Are you sure you want to exit?\nUnsaved changes may be lost.",
+        "unknown_error": "Unknown error",
+        # Format templates, filled in with str.format at the call site
+        "switched_to": "🎯 Switched to {t} mode",
+        "current_target": "Current target: {t}",
+        "download_start": "Starting to download latest {t} hosts rules...",
+        "apply_confirm": "This will modify the system hosts file to optimize {t} access. Continue?",
+        "apply_start": "Starting to apply {t} rules to system hosts file...",
+        "apply_ok_log": "✅ {t} rules applied successfully!",
+        "apply_failed": "Apply failed: {e}",
+        "backup_failed": "Backup failed: {e}",
+        "restore_failed": "Restore failed: {e}",
+        "rule_added": "Added custom rule: {ip} {domain}",
+    }
+
+    _strings_zh = {
+        "window_title": "GitHub & Replit Hosts 管理工具 v3.5 (一体化版)",
+        "title": "GitHub & Replit Hosts 一键管理工具",
+        "select_target": "选择目标:",
+        "language": "语言:",
+        "ready": "就绪",
+        "log_started": "🚀 GitHub & Replit Hosts 管理工具 v3.5 一体化版已启动",
+        "btn_download": "🔄 更新规则",
+        "btn_apply": "💾 应用规则",
+        "btn_backup": "📦 创建备份",
+        "btn_restore": "⏪ 恢复备份",
+        "rules_area": "规则显示/编辑区域:",
+        "rules_placeholder": "规则将在此处显示...",
+        "log_area": "操作日志:",
+        "log_placeholder": "操作日志将在此处显示...",
+        "tab_main": "主页",
+        "custom_rules": "自定义规则",
+        "ip_address": "IP地址",
+        "domain": "域名",
+        "group": "组",
+        "enabled": "启用",
+        "btn_add_rule": "➕ 添加规则",
+        "btn_remove_rule": "➖ 删除规则",
+        "tab_rules": "规则",
+        "plugins_soon": "插件功能将在未来版本中提供",
+        "tab_plugins": "插件",
+        "theme_settings": "主题设置",
+        "dark_mode": "暗色主题",
+        "update_settings": "更新设置",
+        "auto_update_check": "自动检查更新:",
+        "tab_settings": "设置",
+        "menu_file": "文件",
+        "menu_exit": "退出",
+        "menu_view": "视图",
+        "menu_help": "帮助",
+        "menu_about": "关于",
+        "language_switched": "语言已切换为中文",
+        "admin_yes": "✅ 当前以管理员权限运行",
+        "admin_no": "⚠️ 当前未以管理员权限运行（部分功能可能受限）",
+        "download_completed": "下载完成",
+        "success": "成功",
+        "rules_updated": "规则更新成功",
+        "error": "错误",
+        "download_failed": "下载失败",
+        "admin_required_body": "此操作需要管理员权限。是否以管理员身份重新启动？",
+        "admin_required_title": "需要管理员权限",
+        "confirm": "确认",
+        "flush_dns_hint": "💡 建议刷新DNS缓存: ipconfig /flushdns (Windows)",
+        "apply_ok_dialog": "规则应用成功！请刷新DNS缓存使更改生效。",
+        "apply_ok_status": "规则应用成功",
+        "backup_start": "开始创建当前 hosts 文件的备份...",
+        "backup_ok_log": "✅ 备份创建成功！",
+        "backup_ok_dialog": "备份创建成功！",
+        "backup_ok_status": "备份创建成功",
+        "restore_confirm": "这将从备份恢复 hosts 文件。继续吗？",
+        "restore_start": "开始从备份恢复 hosts 文件...",
+        "restore_ok_log": "✅ 备份恢复成功！",
+        "restore_ok_dialog": "备份恢复成功！",
+        "restore_ok_status": "备份恢复成功",
+        "enter_ip": "输入IP地址:",
+        "enter_domain": "输入域名:",
+        "warning": "警告",
+        "select_rule_to_remove": "请选择要删除的规则",
+        "rule_removed": "规则删除成功",
+        "about_title": "关于 mini-SwitchHosts",
+        "confirm_exit_title": "确认退出",
+        "confirm_exit_body": "确定要退出吗?\n未保存的更改可能会丢失。",
+        "unknown_error": "未知错误",
+        # Format templates, filled in with str.format at the call site
+        "switched_to": "🎯 已切换到 {t} 模式",
+        "current_target": "当前目标: {t}",
+        "download_start": "开始下载最新 {t} hosts 规则...",
+        "apply_confirm": "这将修改系统 hosts 文件以优化 {t} 访问。继续吗？",
+        "apply_start": "开始应用 {t} 规则到系统 hosts 文件...",
+        "apply_ok_log": "✅ {t} 规则应用成功！",
+        "apply_failed": "应用失败: {e}",
+        "backup_failed": "备份失败: {e}",
+        "restore_failed": "恢复失败: {e}",
+        "rule_added": "添加自定义规则: {ip} {domain}",
+    }
+
     def __init__(self):
         super().__init__()
         self.current_rules = ""
+        self._rules_dirty = False  # True once the rules editor differs from current_rules
         self.current_target = "github"  # Default target
         self.language = get_system_language()  # Auto-detect system language
+        self.S = self._strings_en if self.language == 'en' else self._strings_zh
         self.settings = QSettings('mini-SwitchHosts', 'v3.5')
         self.plugin_manager = PluginManager()
         self.rule_manager = RuleManager()
@@ -500,8 +752,7 @@ class EnhancedHostsManager(QMainWindow):
 
     def init_ui(self):
         """Initialize user interface with modern design"""
-        window_title = "GitHub & Replit Hosts Manager v3.5 (All-in-One Edition)" if self.language == 'en' else "GitHub & Replit Hosts 管理工具 v3.5 (一体化版)"
-        self.setWindowTitle(window_title)
+        self.setWindowTitle(self.S["window_title"])
         self.setGeometry(300, 200, 1100, 800)
 
         # Apply dark theme if enabled
@@ -514,7 +765,7 @@ class EnhancedHostsManager(QMainWindow):
         layout = QVBoxLayout(central_widget)
 
         # Title
-        title_label = QLabel("GitHub & Replit Hosts One-Click Management Tool" if self.language == 'en' else "GitHub & Replit Hosts 一键管理工具")
+        title_label = QLabel(self.S["title"])
         title_font = QFont()
         title_font.setPointSize(18)
         title_font.setBold(True)
@@ -528,7 +779,7 @@ class EnhancedHostsManager(QMainWindow):
         top_layout = QHBoxLayout(top_panel)
         
         # Target selection
-        target_label = QLabel("Select target:" if self.language == 'en' else "选择目标:")
+        self.target_label = QLabel(self.S["select_target"])
         self.target_combo = QComboBox()
         self.target_combo.addItem("GitHub", "github")
         self.target_combo.addItem("Replit", "replit")
@@ -536,7 +787,7 @@ class EnhancedHostsManager(QMainWindow):
         self.target_combo.setMinimumWidth(150)
         
         # Language selection
-        lang_label = QLabel("Language:" if self.language == 'en' else "语言:")
+        self.lang_label = QLabel(self.S["language"])
         self.lang_combo = QComboBox()
         self.lang_combo.addItem("English", "en")
         self.lang_combo.addItem("中文", "zh")
@@ -544,10 +795,10 @@ class EnhancedHostsManager(QMainWindow):
         self.lang_combo.currentIndexChanged.connect(self.on_language_changed)
         self.lang_combo.setMinimumWidth(100)
         
-        top_layout.addWidget(target_label)
+        top_layout.addWidget(self.target_label)
         top_layout.addWidget(self.target_combo)
         top_layout.addSpacing(20)
-        top_layout.addWidget(lang_label)
+        top_layout.addWidget(self.lang_label)
         top_layout.addWidget(self.lang_combo)
         top_layout.addStretch()
         
@@ -584,13 +835,13 @@ class EnhancedHostsManager(QMainWindow):
         # Status bar
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
-        self.status_bar.showMessage("Ready" if self.language == 'en' else "就绪")
+        self.status_bar.showMessage(self.S["ready"])
 
         # Menu bar
         self.create_menu()
 
         # Log startup message
-        self.log("🚀 GitHub & Replit Hosts Manager v3.5 All-in-One Edition started" if self.language == 'en' else "🚀 GitHub & Replit Hosts 管理工具 v3.5 一体化版已启动")
+        self.log(self.S["log_started"])
 
     def create_main_tab(self):
         """Create main tab with core functionality"""
@@ -601,10 +852,10 @@ class EnhancedHostsManager(QMainWindow):
         button_layout = QHBoxLayout()
 
         # Function buttons with enhanced styling
-        self.btn_download = QPushButton("🔄 Update Rules" if self.language == 'en' else "🔄 更新规则")
-        self.btn_apply = QPushButton("💾 Apply Rules" if self.language == 'en' else "💾 应用规则")
-        self.btn_backup = QPushButton("📦 Create Backup" if self.language == 'en' else "📦 创建备份")
-        self.btn_restore = QPushButton("⏪ Restore Backup" if self.language == 'en' else "⏪ 恢复备份")
+        self.btn_download = QPushButton(self.S["btn_download"])
+        self.btn_apply = QPushButton(self.S["btn_apply"])
+        self.btn_backup = QPushButton(self.S["btn_backup"])
+        self.btn_restore = QPushButton(self.S["btn_restore"])
 
         self.btn_download.clicked.connect(self.download_rules)
         self.btn_apply.clicked.connect(self.apply_rules)
@@ -624,31 +875,38 @@ class EnhancedHostsManager(QMainWindow):
         # Rules display area
         rules_widget = QWidget()
         rules_layout = QVBoxLayout(rules_widget)
-        rules_label = QLabel("Rules Display/Edit Area:" if self.language == 'en' else "规则显示/编辑区域:")
+        rules_label = QLabel(self.S["rules_area"])
         rules_layout.addWidget(rules_label)
 
         self.rules_edit = QTextEdit()
-        self.rules_edit.setPlaceholderText("Rules will be displayed here..." if self.language == 'en' else "规则将在此处显示...")
+        self.rules_edit.setPlaceholderText(self.S["rules_placeholder"])
+        self.rules_edit.textChanged.connect(self.on_rules_edited)
         rules_layout.addWidget(self.rules_edit)
 
         # Log display area
         log_widget = QWidget()
         log_layout = QVBoxLayout(log_widget)
-        log_label = QLabel("Operation Log:" if self.language == 'en' else "操作日志:")
+        log_label = QLabel(self.S["log_area"])
         log_layout.addWidget(log_label)
 
-        self.log_edit = QTextEdit()
-        self.log_edit.setPlaceholderText("Operation logs will be displayed here..." if self.language == 'en' else "操作日志将在此处显示...")
+        self.log_edit = QPlainTextEdit()
+        self.log_edit.setPlaceholderText(self.S["log_placeholder"])
         self.log_edit.setMaximumHeight(200)
         self.log_edit.setReadOnly(True)
+        self.log_edit.setMaximumBlockCount(1000)  # Drop oldest lines instead of growing forever
         log_layout.addWidget(self.log_edit)
 
+        # Private cursor parked at the end of the log; it follows edits to the
+        # document (including trimmed blocks), so it never has to be re-seeked
+        self._log_cursor = QTextCursor(self.log_edit.document())
+        self._log_cursor.movePosition(QTextCursor.End)
+
         splitter.addWidget(rules_widget)
         splitter.addWidget(log_widget)
         splitter.setSizes([500, 200])
 
         main_layout.addWidget(splitter)
-        self.tab_widget.addTab(main_tab, "Main" if self.language == 'en' else "主页")
+        self.tab_widget.addTab(main_tab, self.S["tab_main"])
 
     def create_rules_tab(self):
         """Create rules management tab"""
@@ -656,17 +914,17 @@ class EnhancedHostsManager(QMainWindow):
         rules_layout = QVBoxLayout(rules_tab)
         
         # Custom rules section
-        rules_group = QGroupBox("Custom Rules" if self.language == 'en' else "自定义规则")
+        rules_group = QGroupBox(self.S["custom_rules"])
         rules_group_layout = QVBoxLayout(rules_group)
         
         # Rules table
         self.rules_table = QTableWidget()
         self.rules_table.setColumnCount(4)
         self.rules_table.setHorizontalHeaderLabels([
-            "IP Address" if self.language == 'en' else "IP地址",
-            "Domain" if self.language == 'en' else "域名",
-            "Group" if self.language == 'en' else "组",
-            "Enabled" if self.language == 'en' else "启用"
+            self.S["ip_address"],
+            self.S["domain"],
+            self.S["group"],
+            self.S["enabled"]
         ])
         self.rules_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.rules_table.setSelectionBehavior(QAbstractItemView.SelectRows)
@@ -674,8 +932,8 @@ class EnhancedHostsManager(QMainWindow):
         
         # Rule actions
         rule_actions_layout = QHBoxLayout()
-        self.btn_add_rule = QPushButton("➕ Add Rule" if self.language == 'en' else "➕ 添加规则")
-        self.btn_remove_rule = QPushButton("➖ Remove Rule" if self.language == 'en' else "➖ 删除规则")
+        self.btn_add_rule = QPushButton(self.S["btn_add_rule"])
+        self.btn_remove_rule = QPushButton(self.S["btn_remove_rule"])
         self.btn_add_rule.clicked.connect(self.add_custom_rule)
         self.btn_remove_rule.clicked.connect(self.remove_custom_rule)
         rule_actions_layout.addWidget(self.btn_add_rule)
@@ -684,17 +942,17 @@ class EnhancedHostsManager(QMainWindow):
         rules_group_layout.addLayout(rule_actions_layout)
         
         rules_layout.addWidget(rules_group)
-        self.tab_widget.addTab(rules_tab, "Rules" if self.language == 'en' else "规则")
+        self.tab_widget.addTab(rules_tab, self.S["tab_rules"])
 
     def create_plugins_tab(self):
         """Create plugins management tab"""
         plugins_tab = QWidget()
         plugins_layout = QVBoxLayout(plugins_tab)
         
-        plugins_label = QLabel("Plugins will be available in future versions" if self.language == 'en' else "插件功能将在未来版本中提供")
+        plugins_label = QLabel(self.S["plugins_soon"])
         plugins_label.setAlignment(Qt.AlignCenter)
         plugins_layout.addWidget(plugins_label)
-        self.tab_widget.addTab(plugins_tab, "Plugins" if self.language == 'en' else "插件")
+        self.tab_widget.addTab(plugins_tab, self.S["tab_plugins"])
 
     def create_settings_tab(self):
         """Create settings tab"""
@@ -702,10 +960,10 @@ class EnhancedHostsManager(QMainWindow):
         settings_layout = QVBoxLayout(settings_tab)
         
         # Theme settings
-        theme_group = QGroupBox("Theme Settings" if self.language == 'en' else "主题设置")
+        theme_group = QGroupBox(self.S["theme_settings"])
         theme_layout = QVBoxLayout(theme_group)
         
-        self.dark_mode_checkbox = QCheckBox("Dark Mode" if self.language == 'en' else "暗色主题")
+        self.dark_mode_checkbox = QCheckBox(self.S["dark_mode"])
         self.dark_mode_checkbox.setChecked(self.dark_mode)
         self.dark_mode_checkbox.stateChanged.connect(self.toggle_dark_mode)
         theme_layout.addWidget(self.dark_mode_checkbox)
@@ -713,11 +971,11 @@ class EnhancedHostsManager(QMainWindow):
         settings_layout.addWidget(theme_group)
         
         # Update settings
-        update_group = QGroupBox("Update Settings" if self.language == 'en' else "更新设置")
+        update_group = QGroupBox(self.S["update_settings"])
         update_layout = QVBoxLayout(update_group)
         
         update_check_layout = QHBoxLayout()
-        update_check_layout.addWidget(QLabel("Auto-check for updates:" if self.language == 'en' else "自动检查更新:"))
+        update_check_layout.addWidget(QLabel(self.S["auto_update_check"]))
         self.update_check_checkbox = QCheckBox()
         self.update_check_checkbox.setChecked(True)
         update_check_layout.addWidget(self.update_check_checkbox)
@@ -727,35 +985,35 @@ class EnhancedHostsManager(QMainWindow):
         settings_layout.addWidget(update_group)
         settings_layout.addStretch()
         
-        self.tab_widget.addTab(settings_tab, "Settings" if self.language == 'en' else "设置")
+        self.tab_widget.addTab(settings_tab, self.S["tab_settings"])
 
     def create_menu(self):
         """Create menu bar"""
         menubar = self.menuBar()
         
         # File menu
-        file_menu = menubar.addMenu('File' if self.language == 'en' else '文件')
+        file_menu = menubar.addMenu(self.S["menu_file"])
         
-        exit_action = QAction('Exit' if self.language == 'en' else '退出', self)
+        exit_action = QAction(self.S["menu_exit"], self)
         exit_action.setShortcut('Ctrl+Q')
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
         
         # View menu
-        view_menu = menubar.addMenu('View' if self.language == 'en' else '视图')
+        view_menu = menubar.addMenu(self.S["menu_view"])
         
-        self.dark_mode_action = QAction('Dark Mode' if self.language == 'en' else '暗色主题', self)
+        self.dark_mode_action = QAction(self.S["dark_mode"], self)
         self.dark_mode_action.setCheckable(True)
         self.dark_mode_action.setChecked(self.dark_mode)
         self.dark_mode_action.triggered.connect(self.toggle_dark_mode)
         view_menu.addAction(self.dark_mode_action)
         
         # Help menu
-        help_menu = menubar.addMenu('Help' if self.language == 'en' else '帮助')
+        help_menu = menubar.addMenu(self.S["menu_help"])
         
-        about_action = QAction('About' if self.language == 'en' else '关于', self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
+        self.about_action = QAction(self.S["menu_about"], self)
+        self.about_action.triggered.connect(self.show_about)
+        help_menu.addAction(self.about_action)
 
     def apply_dark_theme(self):
         """Apply dark theme to the application"""
@@ -779,87 +1037,106 @@ class EnhancedHostsManager(QMainWindow):
 
     def on_target_changed(self, text):
         """Handle target type change"""
-        self.current_target = self.target_combo.currentData()
+        new_target = self.target_combo.currentData()
+        if new_target == self.current_target:
+            return
+        self.current_target = new_target
         target_name = "GitHub" if self.current_target == "github" else "Replit"
-        msg = f"🎯 Switched to {target_name} mode" if self.language == 'en' else f"🎯 已切换到 {target_name} 模式"
-        self.log(msg)
-        status_msg = f"Current target: {target_name}" if self.language == 'en' else f"当前目标: {target_name}"
-        self.status_bar.showMessage(status_msg)
+        self.log(self.S["switched_to"].format(t=target_name))
+        self.status_bar.showMessage(self.S["current_target"].format(t=target_name))
+
+    def on_rules_edited(self):
+        """Mark the rules editor as changed since current_rules was set"""
+        self._rules_dirty = True
 
     def on_language_changed(self, index):
         """Handle language change"""
         selected_lang = self.lang_combo.currentData()
         if selected_lang != self.language:
             self.language = selected_lang
+            self.S = self._strings_en if self.language == 'en' else self._strings_zh
             self.update_ui_language()
 
     def update_ui_language(self):
         """Update UI text based on selected language"""
         # Update window title
-        window_title = "GitHub & Replit Hosts Manager v3.5 (All-in-One Edition)" if self.language == 'en' else "GitHub & Replit Hosts 管理工具 v3.5 (一体化版)"
-        self.setWindowTitle(window_title)
+        self.setWindowTitle(self.S["window_title"])
         
         # Update labels and buttons
-        target_label = "Select target:" if self.language == 'en' else "选择目标:"
-        lang_label = "Language:" if self.language == 'en' else "语言:"
+        self.target_label.setText(self.S["select_target"])
+        self.lang_label.setText(self.S["language"])
         
         # Update combo box texts
         self.target_combo.setItemText(0, "GitHub")
         self.target_combo.setItemText(1, "Replit")
         
         # Update button texts
-        self.btn_download.setText("🔄 Update Rules" if self.language == 'en' else "🔄 更新规则")
-        self.btn_apply.setText("💾 Apply Rules" if self.language == 'en' else "💾 应用规则")
-        self.btn_backup.setText("📦 Create Backup" if self.language == 'en' else "📦 创建备份")
-        self.btn_restore.setText("⏪ Restore Backup" if self.language == 'en' else "⏪ 恢复备份")
+        self.btn_download.setText(self.S["btn_download"])
+        self.btn_apply.setText(self.S["btn_apply"])
+        self.btn_backup.setText(self.S["btn_backup"])
+        self.btn_restore.setText(self.S["btn_restore"])
         
         # Update tab texts
-        self.tab_widget.setTabText(0, "Main" if self.language == 'en' else "主页")
-        self.tab_widget.setTabText(1, "Rules" if self.language == 'en' else "规则")
-        self.tab_widget.setTabText(2, "Plugins" if self.language == 'en' else "插件")
-        self.tab_widget.setTabText(3, "Settings" if self.language == 'en' else "设置")
+        self.tab_widget.setTabText(0, self.S["tab_main"])
+        self.tab_widget.setTabText(1, self.S["tab_rules"])
+        self.tab_widget.setTabText(2, self.S["tab_plugins"])
+        self.tab_widget.setTabText(3, self.S["tab_settings"])
         
         # Update placeholders
-        self.rules_edit.setPlaceholderText("Rules will be displayed here..." if self.language == 'en' else "规则将在此处显示...")
-        self.log_edit.setPlaceholderText("Operation logs will be displayed here..." if self.language == 'en' else "操作日志将在此处显示...")
+        self.rules_edit.setPlaceholderText(self.S["rules_placeholder"])
+        self.log_edit.setPlaceholderText(self.S["log_placeholder"])
         
         # Update status bar
-        self.status_bar.showMessage("Ready" if self.language == 'en' else "就绪")
+        self.status_bar.showMessage(self.S["ready"])
         
         # Update menu
         file_menu = self.menuBar().actions()[0].menu()
-        file_menu.setTitle('File' if self.language == 'en' else '文件')
+        file_menu.setTitle(self.S["menu_file"])
         
         view_menu = self.menuBar().actions()[1].menu()
-        view_menu.setTitle('View' if self.language == 'en' else '视图')
-        self.dark_mode_action.setText('Dark Mode' if self.language == 'en' else '暗色主题')
+        view_menu.setTitle(self.S["menu_view"])
+        self.dark_mode_action.setText(self.S["dark_mode"])
         
         help_menu = self.menuBar().actions()[2].menu()
-        help_menu.setTitle('Help' if self.language == 'en' else '帮助')
-        self.dark_mode_action.setText('About' if self.language == 'en' else '关于')
+        help_menu.setTitle(self.S["menu_help"])
+        self.about_action.setText(self.S["menu_about"])
         
         # Log language change
-        lang_msg = "Language switched to English" if self.language == 'en' else "语言已切换为中文"
+        lang_msg = self.S["language_switched"]
         self.log(lang_msg)
 
     def check_admin_status(self):
         """Check and display administrator status"""
         if is_admin():
-            status_msg = "✅ Running with administrator privileges" if self.language == 'en' else "✅ 当前以管理员权限运行"
+            status_msg = self.S["admin_yes"]
             self.admin_label.setText(status_msg)
             self.admin_label.setStyleSheet("color: green; font-weight: bold; padding: 5px;")
         else:
-            status_msg = "⚠️ Not running with administrator privileges (some functions may be limited)" if self.language == 'en' else "⚠️ 当前未以管理员权限运行（部分功能可能受限）"
+            status_msg = self.S["admin_no"]
             self.admin_label.setText(status_msg)
             self.admin_label.setStyleSheet("color: orange; font-weight: bold; padding: 5px;")
 
     def log(self, message):
-        """Add log message"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}"
-        self.log_edit.append(formatted_message)
-        self.log_edit.moveCursor(QTextCursor.End)
-        QApplication.processEvents()  # Ensure UI updates
+        """Add log message (may hold several lines batched by the worker)"""
+        now = datetime.now()
+        prefix = f"[{now.hour:02d}:{now.minute:02d}:{now.second:02d}] "
+        formatted_message = prefix + message.replace("\n", "\n" + prefix)
+        if not self.log_edit.document().isEmpty():
+            self._log_cursor.insertBlock()
+        self._log_cursor.insertText(formatted_message)
+        scroll_bar = self.log_edit.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
+
+    def _require_admin(self):
+        """Return True if running as admin, otherwise offer to restart elevated"""
+        if is_admin():
+            return True
+        reply = QMessageBox.question(self, self.S["admin_required_title"],
+                                     self.S["admin_required_body"], QMessageBox.Yes | QMessageBox.No)
+        if reply == QMessageBox.Yes:
+            run_as_admin()
+            sys.exit(0)
+        return False
 
     def set_buttons_enabled(self, enabled):
         """Enable/disable all buttons"""
@@ -871,8 +1148,7 @@ class EnhancedHostsManager(QMainWindow):
     def download_rules(self):
         """Download latest rules"""
         target_name = "GitHub" if self.current_target == "github" else "Replit"
-        msg = f"Starting to download latest {target_name} hosts rules..." if self.language == 'en' else f"开始下载最新 {target_name} hosts 规则..."
-        self.log(msg)
+        self.log(self.S["download_start"].format(t=target_name))
         self.set_buttons_enabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
@@ -887,40 +1163,38 @@ class EnhancedHostsManager(QMainWindow):
     def on_download_result(self, result):
         """Handle download result"""
         if result['success']:
-            self.current_rules = result['rules']
+            # Strip and drop blank/duplicate lines (keeping first-seen order) on ingest
+            lines = (line.strip() for line in result['rules'].splitlines())
+            self.current_rules = '\n'.join(dict.fromkeys(line for line in lines if line))
             self.rules_edit.setPlainText(self.current_rules)
-            self.log(result.get('message', 'Download completed' if self.language == 'en' else '下载完成'))
-            QMessageBox.information(self, 'Success' if self.language == 'en' else '成功', 
-                                  result.get('message', 'Rules updated successfully' if self.language == 'en' else '规则更新成功'))
+            self._rules_dirty = False
+            self.log(result.get('message', self.S["download_completed"]))
+            QMessageBox.information(self, self.S["success"], 
+                                  result.get('message', self.S["rules_updated"]))
         else:
-            self.log(f"❌ {result.get('error', 'Download failed' if self.language == 'en' else '下载失败')}")
-            QMessageBox.critical(self, 'Error' if self.language == 'en' else '错误', 
-                               result.get('error', 'Download failed' if self.language == 'en' else '下载失败'))
+            self.log(f"❌ {result.get('error', self.S['download_failed'])}")
+            QMessageBox.critical(self, self.S["error"], 
+                               result.get('error', self.S["download_failed"]))
 
     def apply_rules(self):
         """Apply rules to system hosts file"""
         # Check admin privileges first
-        if not is_admin():
-            msg = "This operation requires administrator privileges. Restart as administrator?" if self.language == 'en' else "此操作需要管理员权限。是否以管理员身份重新启动？"
-            reply = QMessageBox.question(self, 'Administrator Privileges Required' if self.language == 'en' else '需要管理员权限', 
-                                       msg, QMessageBox.Yes | QMessageBox.No)
-            
-            if reply == QMessageBox.Yes:
-                run_as_admin()
-                sys.exit(0)
+        if not self._require_admin():
             return
 
         target_name = "GitHub" if self.current_target == "github" else "Replit"
-        confirm_msg = f"This will modify the system hosts file to optimize {target_name} access. Continue?" if self.language == 'en' else f"这将修改系统 hosts 文件以优化 {target_name} 访问。继续吗？"
-        reply = QMessageBox.question(self, 'Confirm' if self.language == 'en' else '确认',
+        confirm_msg = self.S["apply_confirm"].format(t=target_name)
+        reply = QMessageBox.question(self, self.S["confirm"],
                                    confirm_msg, QMessageBox.Yes | QMessageBox.No)
 
         if reply == QMessageBox.Yes:
-            msg = f"Starting to apply {target_name} rules to system hosts file..." if self.language == 'en' else f"开始应用 {target_name} 规则到系统 hosts 文件..."
-            self.log(msg)
+            self.log(self.S["apply_start"].format(t=target_name))
             self.set_buttons_enabled(False)
 
-            self.current_rules = self.rules_edit.toPlainText()
+            # Only serialise the editor if the user changed it since the download
+            if self._rules_dirty:
+                self.current_rules = self.rules_edit.toPlainText()
+                self._rules_dirty = False
             self.thread = EnhancedHostsManagerThread('apply', self.current_rules, self.current_target, self.language)
             self.thread.log_signal.connect(self.log)
             self.thread.result_signal.connect(self.on_apply_result)
@@ -931,22 +1205,20 @@ class EnhancedHostsManager(QMainWindow):
         """Handle apply result"""
         if result['success']:
             target_name = "GitHub" if self.current_target == "github" else "Replit"
-            success_msg = f"✅ {target_name} rules applied successfully!" if self.language == 'en' else f"✅ {target_name} 规则应用成功！"
-            self.log(success_msg)
-            dns_msg = "💡 Suggest flushing DNS cache: ipconfig /flushdns (Windows)" if self.language == 'en' else "💡 建议刷新DNS缓存: ipconfig /flushdns (Windows)"
+            self.log(self.S["apply_ok_log"].format(t=target_name))
+            dns_msg = self.S["flush_dns_hint"]
             self.log(dns_msg)
-            QMessageBox.information(self, 'Success' if self.language == 'en' else '成功',
-                                  'Rules applied successfully! Please flush DNS cache for changes to take effect.' if self.language == 'en' else '规则应用成功！请刷新DNS缓存使更改生效。')
-            self.status_bar.showMessage("Rules applied successfully" if self.language == 'en' else "规则应用成功")
+            QMessageBox.information(self, self.S["success"],
+                                  self.S["apply_ok_dialog"])
+            self.status_bar.showMessage(self.S["apply_ok_status"])
         else:
-            error_msg = f"❌ Apply failed: {result.get('error', 'Unknown error' if self.language == 'en' else '未知错误')}"
-            self.log(error_msg)
-            QMessageBox.critical(self, 'Error' if self.language == 'en' else '错误',
-                               f"Apply failed: {result.get('error', 'Unknown error' if self.language == 'en' else '未知错误')}")
+            error_msg = self.S["apply_failed"].format(e=result.get('error', self.S["unknown_error"]))
+            self.log(f"❌ {error_msg}")
+            QMessageBox.critical(self, self.S["error"], error_msg)
 
     def create_backup(self):
         """Create backup of current hosts file"""
-        self.log("Starting to create backup of current hosts file..." if self.language == 'en' else "开始创建当前 hosts 文件的备份...")
+        self.log(self.S["backup_start"])
         self.set_buttons_enabled(False)
 
         self.thread = EnhancedHostsManagerThread('backup', language=self.language)
@@ -958,35 +1230,27 @@ class EnhancedHostsManager(QMainWindow):
     def on_backup_result(self, result):
         """Handle backup result"""
         if result['success']:
-            self.log("✅ Backup created successfully!" if self.language == 'en' else "✅ 备份创建成功！")
-            QMessageBox.information(self, 'Success' if self.language == 'en' else '成功',
-                                  'Backup created successfully!' if self.language == 'en' else '备份创建成功！')
-            self.status_bar.showMessage("Backup created successfully" if self.language == 'en' else "备份创建成功")
+            self.log(self.S["backup_ok_log"])
+            QMessageBox.information(self, self.S["success"],
+                                  self.S["backup_ok_dialog"])
+            self.status_bar.showMessage(self.S["backup_ok_status"])
         else:
-            error_msg = f"❌ Backup failed: {result.get('error', 'Unknown error' if self.language == 'en' else '未知错误')}"
-            self.log(error_msg)
-            QMessageBox.critical(self, 'Error' if self.language == 'en' else '错误',
-                               f"Backup failed: {result.get('error', 'Unknown error' if self.language == 'en' else '未知错误')}")
+            error_msg = self.S["backup_failed"].format(e=result.get('error', self.S["unknown_error"]))
+            self.log(f"❌ {error_msg}")
+            QMessageBox.critical(self, self.S["error"], error_msg)
 
     def restore_backup(self):
         """Restore hosts file from backup"""
         # Check admin privileges first
-        if not is_admin():
-            msg = "This operation requires administrator privileges. Restart as administrator?" if self.language == 'en' else "此操作需要管理员权限。是否以管理员身份重新启动？"
-            reply = QMessageBox.question(self, 'Administrator Privileges Required' if self.language == 'en' else '需要管理员权限', 
-                                       msg, QMessageBox.Yes | QMessageBox.No)
-            
-            if reply == QMessageBox.Yes:
-                run_as_admin()
-                sys.exit(0)
+        if not self._require_admin():
             return
 
-        confirm_msg = "This will restore the hosts file from a backup. Continue?" if self.language == 'en' else "这将从备份恢复 hosts 文件。继续吗？"
-        reply = QMessageBox.question(self, 'Confirm' if self.language == 'en' else '确认',
+        confirm_msg = self.S["restore_confirm"]
+        reply = QMessageBox.question(self, self.S["confirm"],
                                    confirm_msg, QMessageBox.Yes | QMessageBox.No)
 
         if reply == QMessageBox.Yes:
-            self.log("Starting to restore hosts file from backup..." if self.language == 'en' else "开始从备份恢复 hosts 文件...")
+            self.log(self.S["restore_start"])
             self.set_buttons_enabled(False)
 
             self.thread = EnhancedHostsManagerThread('restore', language=self.language)
@@ -998,15 +1262,14 @@ class EnhancedHostsManager(QMainWindow):
     def on_restore_result(self, result):
         """Handle restore result"""
         if result['success']:
-            self.log("✅ Backup restored successfully!" if self.language == 'en' else "✅ 备份恢复成功！")
-            QMessageBox.information(self, 'Success' if self.language == 'en' else '成功',
-                                  'Backup restored successfully!' if self.language == 'en' else '备份恢复成功！')
-            self.status_bar.showMessage("Backup restored successfully" if self.language == 'en' else "备份恢复成功")
+            self.log(self.S["restore_ok_log"])
+            QMessageBox.information(self, self.S["success"],
+                                  self.S["restore_ok_dialog"])
+            self.status_bar.showMessage(self.S["restore_ok_status"])
         else:
-            error_msg = f"❌ Restore failed: {result.get('error', 'Unknown error' if self.language == 'en' else '未知错误')}"
-            self.log(error_msg)
-            QMessageBox.critical(self, 'Error' if self.language == 'en' else '错误',
-                               f"Restore failed: {result.get('error', 'Unknown error' if self.language == 'en' else '未知错误')}")
+            error_msg = self.S["restore_failed"].format(e=result.get('error', self.S["unknown_error"]))
+            self.log(f"❌ {error_msg}")
+            QMessageBox.critical(self, self.S["error"], error_msg)
 
     def on_thread_finished(self):
         """Clean up when thread finishes"""
@@ -1036,14 +1299,14 @@ class EnhancedHostsManager(QMainWindow):
     def add_custom_rule(self):
         """Add a custom rule"""
         # Get IP address
-        ip, ok = QInputDialog.getText(self, "IP Address" if self.language == 'en' else "IP地址", 
-                                     "Enter IP address:" if self.language == 'en' else "输入IP地址:")
+        ip, ok = QInputDialog.getText(self, self.S["ip_address"], 
+                                     self.S["enter_ip"])
         if not ok or not ip:
             return
             
         # Get domain
-        domain, ok = QInputDialog.getText(self, "Domain" if self.language == 'en' else "域名", 
-                                         "Enter domain:" if self.language == 'en' else "输入域名:")
+        domain, ok = QInputDialog.getText(self, self.S["domain"], 
+                                         self.S["enter_domain"])
         if not ok or not domain:
             return
             
@@ -1062,14 +1325,14 @@ class EnhancedHostsManager(QMainWindow):
         enabled_checkbox.setCheckState(Qt.Checked if rule['enabled'] else Qt.Unchecked)
         self.rules_table.setItem(row_count, 3, enabled_checkbox)
         
-        self.log(f"Added custom rule: {ip} {domain}" if self.language == 'en' else f"添加自定义规则: {ip} {domain}")
+        self.log(self.S["rule_added"].format(ip=ip, domain=domain))
 
     def remove_custom_rule(self):
         """Remove selected custom rule"""
         selected_rows = self.rules_table.selectionModel().selectedRows()
         if not selected_rows:
-            QMessageBox.warning(self, "Warning" if self.language == 'en' else "警告", 
-                               "Please select a rule to remove" if self.language == 'en' else "请选择要删除的规则")
+            QMessageBox.warning(self, self.S["warning"], 
+                               self.S["select_rule_to_remove"])
             return
             
         # Remove from rule manager
@@ -1077,57 +1340,16 @@ class EnhancedHostsManager(QMainWindow):
         if self.rule_manager.remove_rule(row):
             # Remove from table
             self.rules_table.removeRow(row)
-            self.log("Rule removed successfully" if self.language == 'en' else "规则删除成功")
+            self.log(self.S["rule_removed"])
 
     def show_about(self):
         """Show about dialog"""
-        if self.language == 'en':
-            about_text = """
-            <h2>mini-SwitchHosts v3.5 All-in-One Edition</h2>
-            <p><b>Enhanced Edition with Advanced Features</b></p>
-            <p>Enhanced IP resolution, smart filtering, incremental updates, and plugin system</p>
-            <p><b>Key Improvements:</b></p>
-            <ul>
-                <li>Enhanced IP parsing algorithm for better accuracy</li>
-                <li>Smart rule filtering to remove invalid entries</li>
-                <li>Incremental update mechanism for efficiency</li>
-                <li>Modern UI with real-time status monitoring</li>
-                <li>Concurrent processing for faster downloads</li>
-                <li>Multi-language support (English and Chinese)</li>
-                <li>Cross-platform compatibility (Windows, Linux, macOS)</li>
-                <li>Plugin system for extensibility</li>
-                <li>Advanced rule management</li>
-                <li>Dark theme support</li>
-            </ul>
-            <p>© 2025 mini-SwitchHosts Project</p>
-            """
-        else:
-            about_text = """
-            <h2>mini-SwitchHosts v3.5 一体化版本</h2>
-            <p><b>增强版，包含高级功能</b></p>
-            <p>增强的IP解析、智能过滤、增量更新和插件系统</p>
-            <p><b>主要改进:</b></p>
-            <ul>
-                <li>增强的IP解析算法，提高准确性</li>
-                <li>智能规则过滤，去除无效条目</li>
-                <li>增量更新机制，提高效率</li>
-                <li>现代化UI，支持实时状态监控</li>
-                <li>并发处理，加快下载速度</li>
-                <li>多语言支持（英文和中文）</li>
-                <li>跨平台兼容性（Windows、Linux、macOS）</li>
-                <li>插件系统，支持功能扩展</li>
-                <li>高级规则管理</li>
-                <li>暗色主题支持</li>
-            </ul>
-            <p>© 2025 mini-SwitchHosts 项目</p>
-            """
-        title = "About mini-SwitchHosts" if self.language == 'en' else "关于 mini-SwitchHosts"
-        QMessageBox.about(self, title, about_text)
+        QMessageBox.about(self, self.S["about_title"], _about_html(self.language))
 
     def closeEvent(self, event):
         """Handle application close event"""
-        confirm_title = "Confirm Exit" if self.language == 'en' else "确认退出"
-        confirm_msg = "Are you sure you want to exit?\nUnsaved changes may be lost." if self.language == 'en' else "确定要退出吗?\n未保存的更改可能会丢失。"
+        confirm_title = self.S["confirm_exit_title"]
+        confirm_msg = self.S["confirm_exit_body"]
         reply = QMessageBox.question(self, confirm_title, confirm_msg, QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         
         if reply == QMessageBox.Yes:
@@ -8,25 +8,37 @@ Supports Windows, Linux, and macOS with multilingual interface
 
 import sys
 import os
+import io
+import re
+import json
+import queue
+import hashlib
+import ipaddress
 import requests
 import shutil
 import ctypes
+import locale
 import tempfile
 import threading
 import platform
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                             QHBoxLayout, QTextEdit, QPushButton, QLabel,
                             QMessageBox, QFileDialog, QSplitter, QProgressBar,
                             QComboBox, QStatusBar, QGroupBox, QTabWidget)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
+from PyQt5.QtCore import Qt, QObject, QThread, pyqtSignal, pyqtSlot, QTimer, QRunnable, QThreadPool
 from PyQt5.QtGui import QFont, QTextCursor, QAction, QIcon
 
+# The platform does not change while the process runs
+SYSTEM = platform.system().lower()
+
 
 def is_admin():
     """Check if the program has administrator privileges"""
     try:
-        if platform.system().lower() == 'windows':
+        if SYSTEM == 'windows':
             return ctypes.windll.shell32.IsUserAnAdmin()
         else:
             return os.geteuid() == 0
@@ -37,7 +49,7 @@ def is_admin():
 def run_as_admin():
     """Run the program with administrator privileges"""
     if not is_admin():
-        if platform.system().lower() == 'windows':
+        if SYSTEM == 'windows':
             ctypes.windll.shell32.ShellExecuteW(
                 None, "runas", sys.executable, " ".join(sys.argv), None, 1)
         else:
@@ -48,9 +60,9 @@ def run_as_admin():
     return True
 
 
+@lru_cache(maxsize=1)
 def get_system_language():
     """Get system default language"""
-    import locale
     try:
         lang, _ = locale.getdefaultlocale()
         if lang:
@@ -60,20 +72,161 @@ def get_system_language():
     return 'en'
 
 
-class EnhancedHostsManagerThread(QThread):
-    """Enhanced background thread with concurrent processing"""
+# Byte patterns compiled once at import; downloaded bodies are filtered without decoding them
+_WHITESPACE_RE = re.compile(rb'\s+')
+_GITHUB_DOMAIN_RE = re.compile(
+    rb'github\.com|github\.global\.ssl\.fastly\.net|assets-cdn\.github\.com|'
+    rb'github\.githubassets\.com|codeload\.github\.com|api\.github\.com|'
+    rb'raw\.githubusercontent\.com|user-images\.githubusercontent\.com|'
+    rb'favicons\.githubusercontent\.com|camo\.githubusercontent\.com|'
+    rb'gist\.github\.com|gist\.githubusercontent\.com'
+)
+_REPLIT_DOMAIN_RE = re.compile(
+    rb'replit\.com|repl\.co|repl\.it|cdn\.replit\.com|static\.replit\.com|'
+    rb'sp\.replit\.com|replit\.app|firewalledreplit\.com|ide\.replit\.com|'
+    rb'docs\.replit\.com|api\.replit\.com|eval\.replit\.com|widgets\.replit\.com'
+)
+SECTION_START_MARKER = "# === GitHub & Replit Hosts Rules Start ==="
+SECTION_END_MARKER = "# === GitHub & Replit Hosts Rules End ==="
+
+
+def is_valid_ip(ip_str):
+    """Check if string is a valid IP address"""
+    # Also accepts IPv6 rules such as "::1 github.com"
+    try:
+        ipaddress.ip_address(ip_str)
+        return True
+    except ValueError:
+        return False
+
+
+@lru_cache(maxsize=4)
+def extract_rules(content, target_type):
+    """Keep the valid rules for the target's domains from a raw body; repeated bodies are not parsed again"""
+    domain_re = _GITHUB_DOMAIN_RE if target_type == 'github' else _REPLIT_DOMAIN_RE
+    rules = []
+    # Iterate the body lazily instead of building a list of every line
+    for line in io.BytesIO(content):
+        line = line.strip()
+        # Cheapest rejects first: blank lines, comments, lines with a single field
+        if not line or line.startswith(b'#'):
+            continue
+        ws = _WHITESPACE_RE.search(line)
+        if ws is None:
+            continue
+        # Domain search starts after the address, then the address itself is validated
+        if domain_re.search(line, ws.end()) and is_valid_ip(line[:ws.start()].decode('ascii', 'replace')):
+            # Only kept lines are decoded
+            rules.append(line.decode('utf-8', 'replace'))
+    return '\n'.join(rules)
+
+
+# Seconds to wait for a mirror before also asking the next one
+HEDGE_DELAY = 0.3
+
+_session = None
+
+
+def get_session():
+    """Get the shared HTTP session so mirror connections are kept alive between downloads"""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        # One pool per mirror host (three per target)
+        adapter = HTTPAdapter(pool_connections=6, pool_maxsize=6)
+        _session.mount('https://', adapter)
+        _session.mount('http://', adapter)
+    return _session
+
+
+# Mirror bodies kept with their ETag/Last-Modified so unchanged files can be revalidated
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache')
+
+
+def cache_paths(url):
+    """Get the body and metadata cache files for a URL"""
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return os.path.join(CACHE_DIR, key + '.body'), os.path.join(CACHE_DIR, key + '.json')
+
+
+def conditional_headers(url):
+    """Build If-None-Match/If-Modified-Since headers from the cached response"""
+    body_path, meta_path = cache_paths(url)
+    if not os.path.exists(body_path):
+        return {}
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    headers = {}
+    if meta.get('etag'):
+        headers['If-None-Match'] = meta['etag']
+    if meta.get('last_modified'):
+        headers['If-Modified-Since'] = meta['last_modified']
+    return headers
+
+
+def load_cached_body(url):
+    """Read the cached body for a URL"""
+    with open(cache_paths(url)[0], 'rb') as f:
+        return f.read()
+
+
+def save_cached_body(url, response, body):
+    """Store a 200 response body with its validators"""
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if not etag and not last_modified:
+        return
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    body_path, meta_path = cache_paths(url)
+    with open(body_path, 'wb') as f:
+        f.write(body)
+    with open(meta_path, 'w', encoding='utf-8') as f:
+        json.dump({'etag': etag, 'last_modified': last_modified}, f)
+
+
+class FetchTask(QRunnable):
+    """Run one mirror request on the shared thread pool"""
+
+    def __init__(self, func, *args):
+        super().__init__()
+        self.func = func
+        self.args = args
+
+    def run(self):
+        self.func(*self.args)
+
+
+class HostsWorker(QObject):
+    """Background worker living on one persistent thread; tasks arrive as queued do_task calls"""
     log_signal = pyqtSignal(str)
     result_signal = pyqtSignal(dict)
     progress_signal = pyqtSignal(int)
+    task_result = pyqtSignal(str, dict)
+    task_finished = pyqtSignal()
 
-    def __init__(self, task_type, data=None, target_type='github', language='en'):
+    def __init__(self):
         super().__init__()
-        self.task_type = task_type  # 'download', 'apply', 'backup', 'restore', 'incremental'
+        self.task_type = None  # 'download', 'apply', 'backup', 'restore', 'incremental'
+        self.data = None
+        self.target_type = 'github'
+        self.language = 'en'
+        self.pool = QThreadPool.globalInstance()
+        # Tag every result with the task that produced it
+        self.result_signal.connect(self._tag_result)
+
+    def _tag_result(self, result):
+        self.task_result.emit(self.task_type, result)
+
+    @pyqtSlot(str, object, str, str)
+    def do_task(self, task_type, data, target_type, language):
+        """Run one task; called through a queued signal from the window"""
+        self.task_type = task_type
         self.data = data
         self.target_type = target_type
         self.language = language
-
-    def run(self):
         try:
             if self.task_type == 'download':
                 self.download_hosts_enhanced()
@@ -89,6 +242,8 @@ class EnhancedHostsManagerThread(QThread):
                 self.check_for_updates()
         except Exception as e:
             self.log_signal.emit(f"❌ Error: {str(e)}" if self.language == 'en' else f"❌ 错误: {str(e)}")
+        finally:
+            self.task_finished.emit()
 
     def download_hosts_enhanced(self):
         """Enhanced download with smart filtering and concurrent requests"""
@@ -109,106 +264,87 @@ class EnhancedHostsManagerThread(QThread):
                 "https://cdn.jsdelivr.net/gh/techsharing/toolbox/hosts/replit-hosts"
             ]
 
-        # Concurrent requests for faster downloads
-        results = {}
-        threads = []
+        # Concurrent requests on the shared pool and session; every request reports to the queue
+        results = queue.Queue()
+        session = get_session()
+        won = threading.Event()
         
         def fetch_source(source, index):
+            body = None
             try:
                 host = source.split('//')[1].split('/')[0]
                 msg = f"🔄 Fetching from {host}..." if self.language == 'en' else f"🔄 正在从 {host} 获取..."
                 self.log_signal.emit(msg)
-                response = requests.get(source, timeout=15)
-                if response.status_code == 200:
-                    results[index] = response.text
+                # Only headers are read here; the body is downloaded just for the winner
+                headers = conditional_headers(source)
+                with session.get(source, timeout=15, stream=True, headers=headers) as response:
+                    if response.status_code == 304 and headers:
+                        # Not modified upstream, reuse the cached body
+                        body = load_cached_body(source)
+                    elif response.status_code == 200 and not won.is_set():
+                        # Raw bytes; no charset detection or decode of the whole body
+                        body = response.content
+                        try:
+                            save_cached_body(source, response, body)
+                        except OSError:
+                            pass
             except Exception as e:
                 msg = f"⚠️  {source} failed: {str(e)}" if self.language == 'en' else f"⚠️  {source} 失败: {str(e)}"
                 self.log_signal.emit(msg)
-
-        # Start concurrent requests
-        for i, source in enumerate(sources):
-            thread = threading.Thread(target=fetch_source, args=(source, i))
-            threads.append(thread)
-            thread.start()
-            self.progress_signal.emit(20 + i * 15)
-
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
+            results.put((index, body))
+
+        self.progress_signal.emit(20)
+
+        # Hedged requests: start the next mirror only when the earlier ones are slow or failed,
+        # and take the first successful response instead of waiting for every mirror
+        content = None
+        winner = None
+        started = 0
+        finished = 0
+        while finished < len(sources):
+            if started < len(sources) and started == finished:
+                # Nothing in flight, e.g. the previous mirror failed fast
+                self.pool.start(FetchTask(fetch_source, sources[started], started))
+                started += 1
+            try:
+                index, body = results.get(timeout=HEDGE_DELAY if started < len(sources) else 30)
+            except queue.Empty:
+                if started == len(sources):
+                    break
+                self.pool.start(FetchTask(fetch_source, sources[started], started))
+                started += 1
+                continue
+            finished += 1
+            if body is not None:
+                content, winner = body, sources[index]
+                # Mirrors still in flight drop their response without reading the body
+                won.set()
+                break
+            self.progress_signal.emit(20 + 60 * finished // len(sources))
 
         self.progress_signal.emit(80)
         
         # Process results
-        if results:
-            # Use the first successful result
-            content = results[0] if 0 in results else list(results.values())[0]
+        if content is not None:
             
-            if self.target_type == 'github':
-                rules = self.extract_github_rules_enhanced(content)
-            else:
-                rules = self.extract_replit_rules_enhanced(content)
+            rules = self.extract_rules_enhanced(content)
             
             self.progress_signal.emit(100)
             source_msg = "Source" if self.language == 'en' else "来源"
             success_msg = "✅ Enhanced download completed successfully" if self.language == 'en' else "✅ 增强版下载成功完成"
-            self.result_signal.emit({'success': True, 'rules': rules, 'source': sources[0], 'message': f"{success_msg}\n{source_msg}: {sources[0]}"})
+            self.result_signal.emit({'success': True, 'rules': rules, 'source': winner, 'message': f"{success_msg}\n{source_msg}: {winner}"})
         else:
             error_msg = "All sources failed" if self.language == 'en' else "所有源都尝试失败"
             self.result_signal.emit({'success': False, 'error': error_msg})
 
-    def extract_github_rules_enhanced(self, content):
-        """Enhanced extraction with smart filtering"""
-        github_rules = []
-        lines = content.split('\n')
-
-        for line in lines:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                if any(domain in line for domain in [
-                    'github.com', 'github.global.ssl.fastly.net',
-                    'assets-cdn.github.com', 'github.githubassets.com',
-                    'codeload.github.com', 'api.github.com',
-                    'raw.githubusercontent.com', 'user-images.githubusercontent.com',
-                    'favicons.githubusercontent.com', 'camo.githubusercontent.com',
-                    'gist.github.com', 'gist.githubusercontent.com'
-                ]):
-                    # Smart filtering - check if rule seems valid
-                    parts = line.split()
-                    if len(parts) >= 2 and self.is_valid_ip(parts[0]):
-                        github_rules.append(line)
-
-        not_found_msg = "# GitHub related rules not found" if self.language == 'en' else "# 未找到GitHub相关规则"
-        return '\n'.join(github_rules) if github_rules else not_found_msg
-
-    def extract_replit_rules_enhanced(self, content):
-        """Enhanced extraction with smart filtering for Replit"""
-        replit_rules = []
-        lines = content.split('\n')
-
-        for line in lines:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                if any(domain in line for domain in [
-                    'replit.com', 'repl.co', 'repl.it',
-                    'cdn.replit.com', 'static.replit.com',
-                    'sp.replit.com', 'replit.app',
-                    'firewalledreplit.com', 'ide.replit.com',
-                    'docs.replit.com', 'api.replit.com',
-                    'eval.replit.com', 'widgets.replit.com'
-                ]):
-                    # Smart filtering - check if rule seems valid
-                    parts = line.split()
-                    if len(parts) >= 2 and self.is_valid_ip(parts[0]):
-                        replit_rules.append(line)
-
-        not_found_msg = "# Replit related rules not found" if self.language == 'en' else "# 未找到Replit相关规则"
-        return '\n'.join(replit_rules) if replit_rules else not_found_msg
-
-    def is_valid_ip(self, ip_str):
-        """Check if string is a valid IP address"""
-        import re
-        ip_pattern = r'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$'
-        return re.match(ip_pattern, ip_str) is not None
+    def extract_rules_enhanced(self, content):
+        """Enhanced extraction with smart filtering for the current target"""
+        rules = extract_rules(content, self.target_type)
+        if rules:
+            return rules
+        if self.target_type == 'github':
+            return "# GitHub related rules not found" if self.language == 'en' else "# 未找到GitHub相关规则"
+        return "# Replit related rules not found" if self.language == 'en' else "# 未找到Replit相关规则"
 
     def apply_hosts(self):
         """Apply rules to system hosts file"""
@@ -218,66 +354,39 @@ class EnhancedHostsManagerThread(QThread):
             return
 
         try:
-            self.log_signal.emit("🛡️ Checking administrator privileges..." if self.language == 'en' else "🛡️ 检查管理员权限...")
-            
-            if not is_admin():
-                error_msg = "Administrator privileges required" if self.language == 'en' else "需要管理员权限"
-                self.result_signal.emit({'success': False, 'error': error_msg})
-                return
-
             hosts_path = self.get_hosts_path()
             self.log_signal.emit(f"📂 Hosts file path: {hosts_path}" if self.language == 'en' else f"📂 Hosts文件路径: {hosts_path}")
 
-            # Create backup first
-            self.create_backup_internal(hosts_path)
-            
-            # Read current hosts file
-            with open(hosts_path, 'r', encoding='utf-8') as f:
-                current_content = f.read()
-
-            # Process content
-            section_start_marker = "# === GitHub & Replit Hosts Rules Start ==="
-            section_end_marker = "# === GitHub & Replit Hosts Rules End ==="
-            
-            # Remove existing section if present
-            lines = current_content.split('\n')
-            new_lines = []
-            in_target_section = False
-            
-            for line in lines:
-                stripped = line.strip()
-                
-                # Detect section start
-                if stripped.startswith(section_start_marker):
-                    in_target_section = True
-                    continue
-                
-                # Detect section end
-                if stripped.startswith(section_end_marker):
-                    in_target_section = False
-                    continue
-                
-                # Skip lines in target section
-                if in_target_section:
-                    continue
-                
-                # Add line if not in target section
-                new_lines.append(line)
-            
-            # Add new rules section
+            # New rules section
             timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             target_name = "GitHub & Replit" if self.language == 'en' else "GitHub和Replit"
-            new_lines.append("")
-            new_lines.append(section_start_marker)
-            new_lines.append(f"# {target_name} Hosts Rules")
-            new_lines.append(f"# Updated: {timestamp}")
-            new_lines.append(self.data)
-            new_lines.append(section_end_marker)
-            new_lines.append("")
+            new_section = (f"\n{SECTION_START_MARKER}\n"
+                           f"# {target_name} Hosts Rules\n"
+                           f"# Updated: {timestamp}\n"
+                           f"{self.data}\n"
+                           f"{SECTION_END_MARKER}\n")
             
-            # Write back to hosts file
-            with open(hosts_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write('\n'.join(new_lines))
+            # Write to a temp file in the same directory, then swap it in atomically
+            fd, temp_hosts = tempfile.mkstemp(dir=os.path.dirname(hosts_path), prefix='hosts.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8', newline='\n') as f:
+                    # One streaming pass: copy the current file without the old section, then append
+                    self.copy_without_section(hosts_path, f)
+                    f.write(new_section)
+                    f.flush()
+                    os.fsync(f.fileno())
+                shutil.copymode(hosts_path, temp_hosts)
+                # Back up the pre-image right before it is replaced
+                backup_path = self.create_backup_internal(hosts_path, link=True)
+                try:
+                    os.replace(temp_hosts, hosts_path)
+                except BaseException:
+                    # Unswapped, a linked backup would share its inode with the live hosts file
+                    os.remove(backup_path)
+                    raise
+            finally:
+                if os.path.exists(temp_hosts):
+                    os.remove(temp_hosts)
             
             success_msg = "Rules applied successfully" if self.language == 'en' else "规则应用成功"
             self.result_signal.emit({'success': True, 'message': success_msg})
@@ -289,10 +398,32 @@ class EnhancedHostsManagerThread(QThread):
             error_msg = f"Apply failed: {str(e)}" if self.language == 'en' else f"应用失败: {str(e)}"
             self.result_signal.emit({'success': False, 'error': error_msg})
 
+    def copy_without_section(self, hosts_path, dst_file):
+        """Stream the hosts file into dst_file line by line, dropping the managed section and trailing blank lines"""
+        pending_blank = []
+        in_section = False
+        with open(hosts_path, 'r', encoding='utf-8', buffering=1 << 20) as f:
+            for line in f:
+                stripped = line.strip()
+                if stripped.startswith(SECTION_START_MARKER):
+                    in_section = True
+                    continue
+                if stripped.startswith(SECTION_END_MARKER):
+                    in_section = False
+                    continue
+                if in_section:
+                    continue
+                # Hold back blank lines so trailing ones are dropped
+                if not stripped:
+                    pending_blank.append(line)
+                    continue
+                dst_file.writelines(pending_blank)
+                pending_blank.clear()
+                dst_file.write(line if line.endswith('\n') else line + '\n')
+
     def get_hosts_path(self):
         """Get hosts file path based on OS"""
-        system = platform.system().lower()
-        if system == 'windows':
+        if SYSTEM == 'windows':
             return r"C:\Windows\System32\drivers\etc\hosts"
         else:
             return "/etc/hosts"
@@ -308,8 +439,8 @@ class EnhancedHostsManagerThread(QThread):
             error_msg = f"Backup failed: {str(e)}" if self.language == 'en' else f"备份失败: {str(e)}"
             self.result_signal.emit({'success': False, 'error': error_msg})
 
-    def create_backup_internal(self, hosts_path):
-        """Internal method to create backup"""
+    def create_backup_internal(self, hosts_path, link=False):
+        """Internal method to create backup; link=True hardlinks the file when it is about to be replaced; returns the backup path"""
         # Create backup directory if not exists
         backup_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backups')
         if not os.path.exists(backup_dir):
@@ -321,48 +452,37 @@ class EnhancedHostsManagerThread(QThread):
         backup_path = os.path.join(backup_dir, backup_filename)
         
         # Copy hosts file to backup location
-        shutil.copy2(hosts_path, backup_path)
+        if link:
+            try:
+                # The old inode stays with the backup after os.replace, so no copy is needed
+                os.link(hosts_path, backup_path)
+            except OSError:
+                shutil.copy2(hosts_path, backup_path)
+        else:
+            shutil.copy2(hosts_path, backup_path)
         
         backup_created_msg = f"Backup created: {backup_path}" if self.language == 'en' else f"已创建备份: {backup_path}"
         self.log_signal.emit(backup_created_msg)
+        return backup_path
 
     def restore_backup(self):
-        """Restore hosts file from backup"""
+        """Restore hosts file from the backup file chosen in the window"""
         try:
-            self.log_signal.emit("🛡️ Checking administrator privileges..." if self.language == 'en' else "🛡️ 检查管理员权限...")
-            
-            if not is_admin():
-                error_msg = "Administrator privileges required" if self.language == 'en' else "需要管理员权限"
-                self.result_signal.emit({'success': False, 'error': error_msg})
-                return
-
-            # Let user select backup file
-            backup_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backups')
-            
-            if self.language == 'en':
-                backup_file, _ = QFileDialog.getOpenFileName(
-                    None, 'Select Backup File', backup_dir, 'Text Files (*.txt);;All Files (*)')
-            else:
-                backup_file, _ = QFileDialog.getOpenFileName(
-                    None, '选择备份文件', backup_dir, '文本文件 (*.txt);;所有文件 (*)')
-            
-            if not backup_file:
-                cancel_msg = "Operation cancelled" if self.language == 'en' else "操作已取消"
-                self.result_signal.emit({'success': False, 'error': cancel_msg})
-                return
-
+            backup_file = self.data
             hosts_path = self.get_hosts_path()
             
-            # Use temporary file for safe restore
-            temp_dir = tempfile.gettempdir()
-            temp_hosts = os.path.join(temp_dir, 'hosts_restore_temp')
-
-            shutil.copy2(backup_file, temp_hosts)
-            shutil.copy2(temp_hosts, hosts_path)
-
-            # Clean up temporary file
-            if os.path.exists(temp_hosts):
-                os.remove(temp_hosts)
+            # Copy once next to the hosts file, then swap it in atomically.
+            # The backup is not hardlinked into place: the hosts file would then share an
+            # inode with it, and any in-place edit of hosts would rewrite the backup too.
+            temp_hosts = os.path.join(os.path.dirname(hosts_path), f'.hosts.restore.{os.getpid()}')
+            try:
+                shutil.copyfile(backup_file, temp_hosts)
+                shutil.copymode(hosts_path, temp_hosts)
+                os.replace(temp_hosts, hosts_path)
+            finally:
+                # Clean up temporary file
+                if os.path.exists(temp_hosts):
+                    os.remove(temp_hosts)
 
             success_msg = "Backup restored successfully" if self.language == 'en' else "备份恢复成功"
             self.result_signal.emit({'success': True, 'message': success_msg})
@@ -386,19 +506,213 @@ class EnhancedHostsManagerThread(QThread):
 
 class EnhancedHostsManager(QMainWindow):
     """Enhanced main window with modern UI"""
+    task_signal = pyqtSignal(str, object, str, str)
+
+    # UI strings per language; self._tr points at the table for the current language
+    _STRINGS = {
+        'en': {
+            'window_title': "GitHub & Replit Hosts Manager v3.0 (PyQt Edition)",
+            'title': "GitHub & Replit Hosts One-Click Management Tool",
+            'select_target': "Select target:",
+            'language': "Language:",
+            'btn_download': "🔄 Update Rules",
+            'btn_apply': "💾 Apply Rules",
+            'btn_backup': "📦 Create Backup",
+            'btn_restore': "⏪ Restore Backup",
+            'rules_label': "Rules Display/Edit Area:",
+            'rules_placeholder': "Rules will be displayed here...",
+            'log_label': "Operation Log:",
+            'log_placeholder': "Operation logs will be displayed here...",
+            'tab_main': "Main",
+            'settings_placeholder': "Settings will be available in future versions",
+            'tab_settings': "Settings",
+            'ready': "Ready",
+            'started': "🚀 GitHub & Replit Hosts Manager PyQt Edition started",
+            'menu_file': "File",
+            'menu_exit': "Exit",
+            'menu_help': "Help",
+            'menu_about': "About",
+            'target_switched': "🎯 Switched to {target} mode",
+            'current_target': "Current target: {target}",
+            'language_switched': "Language switched to English",
+            'admin_yes': "✅ Running with administrator privileges",
+            'admin_no': "⚠️ Not running with administrator privileges (some functions may be limited)",
+            'download_start': "Starting to download latest {target} hosts rules...",
+            'download_completed': "Download completed",
+            'success': "Success",
+            'rules_updated': "Rules updated successfully",
+            'download_failed': "Download failed",
+            'error': "Error",
+            'admin_restart': "This operation requires administrator privileges. Restart as administrator?",
+            'admin_required': "Administrator Privileges Required",
+            'apply_confirm': "This will modify the system hosts file to optimize {target} access. Continue?",
+            'confirm': "Confirm",
+            'apply_start': "Starting to apply {target} rules to system hosts file...",
+            'apply_success_log': "✅ {target} rules applied successfully!",
+            'flush_dns_hint': "💡 Suggest flushing DNS cache: ipconfig /flushdns (Windows)",
+            'apply_success_message': "Rules applied successfully! Please flush DNS cache for changes to take effect.",
+            'apply_success_status': "Rules applied successfully",
+            'unknown_error': "Unknown error",
+            'backup_start': "Starting to create backup of current hosts file...",
+            'backup_success_log': "✅ Backup created successfully!",
+            'backup_success_message': "Backup created successfully!",
+            'backup_success_status': "Backup created successfully",
+            'restore_confirm': "This will restore the hosts file from a backup. Continue?",
+            'select_backup': "Select Backup File",
+            'backup_filter': "Text Files (*.txt);;All Files (*)",
+            'operation_cancelled': "Operation cancelled",
+            'restore_start': "Starting to restore hosts file from backup...",
+            'restore_success_log': "✅ Backup restored successfully!",
+            'restore_success_message': "Backup restored successfully!",
+            'restore_success_status': "Backup restored successfully",
+            'about_title': "About mini-SwitchHosts",
+            'exit_title': "Confirm Exit",
+            'exit_confirm': "Are you sure you want to exit?\nUnsaved changes may be lost.",
+        },
+        'zh': {
+            'window_title': "GitHub & Replit Hosts 管理工具 v3.0 (PyQt版)",
+            'title': "GitHub & Replit Hosts 一键管理工具",
+            'select_target': "选择目标:",
+            'language': "语言:",
+            'btn_download': "🔄 更新规则",
+            'btn_apply': "💾 应用规则",
+            'btn_backup': "📦 创建备份",
+            'btn_restore': "⏪ 恢复备份",
+            'rules_label': "规则显示/编辑区域:",
+            'rules_placeholder': "规则将在此处显示...",
+            'log_label': "操作日志:",
+            'log_placeholder': "操作日志将在此处显示...",
+            'tab_main': "主页",
+            'settings_placeholder': "设置功能将在未来版本中提供",
+            'tab_settings': "设置",
+            'ready': "就绪",
+            'started': "🚀 GitHub & Replit Hosts 管理工具 PyQt 版已启动",
+            'menu_file': "文件",
+            'menu_exit': "退出",
+            'menu_help': "帮助",
+            'menu_about': "关于",
+            'target_switched': "🎯 已切换到 {target} 模式",
+            'current_target': "当前目标: {target}",
+            'language_switched': "语言已切换为中文",
+            'admin_yes': "✅ 当前以管理员权限运行",
+            'admin_no': "⚠️ 当前未以管理员权限运行（部分功能可能受限）",
+            'download_start': "开始下载最新 {target} hosts 规则...",
+            'download_completed': "下载完成",
+            'success': "成功",
+            'rules_updated': "规则更新成功",
+            'download_failed': "下载失败",
+            'error': "错误",
+            'admin_restart': "此操作需要管理员权限。是否以管理员身份重新启动？",
+            'admin_required': "需要管理员权限",
+            'apply_confirm': "这将修改系统 hosts 文件以优化 {target} 访问。继续吗？",
+            'confirm': "确认",
+            'apply_start': "开始应用 {target} 规则到系统 hosts 文件...",
+            'apply_success_log': "✅ {target} 规则应用成功！",
+            'flush_dns_hint': "💡 建议刷新DNS缓存: ipconfig /flushdns (Windows)",
+            'apply_success_message': "规则应用成功！请刷新DNS缓存使更改生效。",
+            'apply_success_status': "规则应用成功",
+            'unknown_error': "未知错误",
+            'backup_start': "开始创建当前 hosts 文件的备份...",
+            'backup_success_log': "✅ 备份创建成功！",
+            'backup_success_message': "备份创建成功！",
+            'backup_success_status': "备份创建成功",
+            'restore_confirm': "这将从备份恢复 hosts 文件。继续吗？",
+            'select_backup': "选择备份文件",
+            'backup_filter': "文本文件 (*.txt);;所有文件 (*)",
+            'operation_cancelled': "操作已取消",
+            'restore_start': "开始从备份恢复 hosts 文件...",
+            'restore_success_log': "✅ 备份恢复成功！",
+            'restore_success_message': "备份恢复成功！",
+            'restore_success_status': "备份恢复成功",
+            'about_title': "关于 mini-SwitchHosts",
+            'exit_title': "确认退出",
+            'exit_confirm': "确定要退出吗?\n未保存的更改可能会丢失。",
+        },
+    }
+
+    _ABOUT_HTML = {
+        'en': """
+    <h2>mini-SwitchHosts v3.0 PyQt Edition</h2>
+    <p><b>Enhanced Edition with Improved Features</b></p>
+    <p>Enhanced IP resolution, smart filtering, and incremental updates</p>
+    <p><b>Key Improvements:</b></p>
+    <ul>
+        <li>Enhanced IP parsing algorithm for better accuracy</li>
+        <li>Smart rule filtering to remove invalid entries</li>
+        <li>Incremental update mechanism for efficiency</li>
+        <li>Modern UI with real-time status monitoring</li>
+        <li>Concurrent processing for faster downloads</li>
+        <li>Multi-language support (English and Chinese)</li>
+        <li>Cross-platform compatibility (Windows, Linux, macOS)</li>
+        <li>PyQt-based interface for better performance</li>
+    </ul>
+    <p>© 2025 mini-SwitchHosts Project</p>
+    """,
+        'zh': """
+    <h2>mini-SwitchHosts v3.0 PyQt版</h2>
+    <p><b>增强版，包含改进功能</b></p>
+    <p>增强的IP解析、智能过滤和增量更新</p>
+    <p><b>主要改进:</b></p>
+    <ul>
+        <li>增强的IP解析算法，提高准确性</li>
+        <li>智能规则过滤，去除无效条目</li>
+        <li>增量更新机制，提高效率</li>
+        <li>现代化UI，支持实时状态监控</li>
+        <li>并发处理，加快下载速度</li>
+        <li>多语言支持（英文和中文）</li>
+        <li>跨平台兼容性（Windows、Linux、macOS）</li>
+        <li>基于PyQt的界面，性能更好</li>
+    </ul>
+    <p>© 2025 mini-SwitchHosts 项目</p>
+    """,
+    }
 
     def __init__(self):
         super().__init__()
         self.current_rules = ""
         self.current_target = "github"  # Default target
         self.language = get_system_language()  # Auto-detect system language
+        # Privileges cannot change while the process runs; apply/restore check this before starting a thread
+        self._is_admin = is_admin()
+        self.set_language_strings()
+        # Log lines are buffered and flushed together shortly after a burst
+        self._log_buf = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
         self.init_ui()
+        self.init_worker()
         self.check_admin_status()
         self.setup_auto_update_check()
 
+    def init_worker(self):
+        """Start the one worker thread that runs every background task"""
+        self.result_handlers = {
+            'download': self.on_download_result,
+            'apply': self.on_apply_result,
+            'backup': self.on_backup_result,
+            'restore': self.on_restore_result,
+        }
+        self.worker_thread = QThread(self)
+        self.worker = HostsWorker()
+        self.worker.moveToThread(self.worker_thread)
+        self.task_signal.connect(self.worker.do_task)
+        self.worker.log_signal.connect(self.log)
+        self.worker.progress_signal.connect(self.progress_bar.setValue)
+        self.worker.task_result.connect(self.on_task_result)
+        self.worker.task_finished.connect(self.on_thread_finished)
+        self.worker_thread.start()
+
+    def on_task_result(self, task_type, result):
+        """Dispatch a worker result to the handler for its task"""
+        handler = self.result_handlers.get(task_type)
+        if handler:
+            handler(result)
+
     def init_ui(self):
         """Initialize user interface with modern design"""
-        window_title = "GitHub & Replit Hosts Manager v3.0 (PyQt Edition)" if self.language == 'en' else "GitHub & Replit Hosts 管理工具 v3.0 (PyQt版)"
+        window_title = self._tr['window_title']
         self.setWindowTitle(window_title)
         self.setGeometry(300, 200, 1000, 750)
 
@@ -408,7 +722,7 @@ class EnhancedHostsManager(QMainWindow):
         layout = QVBoxLayout(central_widget)
 
         # Title
-        title_label = QLabel("GitHub & Replit Hosts One-Click Management Tool" if self.language == 'en' else "GitHub & Replit Hosts 一键管理工具")
+        title_label = QLabel(self._tr['title'])
         title_font = QFont()
         title_font.setPointSize(18)
         title_font.setBold(True)
@@ -422,7 +736,7 @@ class EnhancedHostsManager(QMainWindow):
         top_layout = QHBoxLayout(top_panel)
         
         # Target selection
-        target_label = QLabel("Select target:" if self.language == 'en' else "选择目标:")
+        target_label = QLabel(self._tr['select_target'])
         self.target_combo = QComboBox()
         self.target_combo.addItem("GitHub", "github")
         self.target_combo.addItem("Replit", "replit")
@@ -430,7 +744,7 @@ class EnhancedHostsManager(QMainWindow):
         self.target_combo.setMinimumWidth(150)
         
         # Language selection
-        lang_label = QLabel("Language:" if self.language == 'en' else "语言:")
+        lang_label = QLabel(self._tr['language'])
         self.lang_combo = QComboBox()
         self.lang_combo.addItem("English", "en")
         self.lang_combo.addItem("中文", "zh")
@@ -469,10 +783,10 @@ class EnhancedHostsManager(QMainWindow):
         button_layout = QHBoxLayout()
 
         # Function buttons with enhanced styling
-        self.btn_download = QPushButton("🔄 Update Rules" if self.language == 'en' else "🔄 更新规则")
-        self.btn_apply = QPushButton("💾 Apply Rules" if self.language == 'en' else "💾 应用规则")
-        self.btn_backup = QPushButton("📦 Create Backup" if self.language == 'en' else "📦 创建备份")
-        self.btn_restore = QPushButton("⏪ Restore Backup" if self.language == 'en' else "⏪ 恢复备份")
+        self.btn_download = QPushButton(self._tr['btn_download'])
+        self.btn_apply = QPushButton(self._tr['btn_apply'])
+        self.btn_backup = QPushButton(self._tr['btn_backup'])
+        self.btn_restore = QPushButton(self._tr['btn_restore'])
 
         self.btn_download.clicked.connect(self.download_rules)
         self.btn_apply.clicked.connect(self.apply_rules)
@@ -492,23 +806,26 @@ class EnhancedHostsManager(QMainWindow):
         # Rules display area
         rules_widget = QWidget()
         rules_layout = QVBoxLayout(rules_widget)
-        rules_label = QLabel("Rules Display/Edit Area:" if self.language == 'en' else "规则显示/编辑区域:")
+        rules_label = QLabel(self._tr['rules_label'])
         rules_layout.addWidget(rules_label)
 
         self.rules_edit = QTextEdit()
-        self.rules_edit.setPlaceholderText("Rules will be displayed here..." if self.language == 'en' else "规则将在此处显示...")
+        self.rules_edit.setPlaceholderText(self._tr['rules_placeholder'])
         rules_layout.addWidget(self.rules_edit)
 
         # Log display area
         log_widget = QWidget()
         log_layout = QVBoxLayout(log_widget)
-        log_label = QLabel("Operation Log:" if self.language == 'en' else "操作日志:")
+        log_label = QLabel(self._tr['log_label'])
         log_layout.addWidget(log_label)
 
         self.log_edit = QTextEdit()
-        self.log_edit.setPlaceholderText("Operation logs will be displayed here..." if self.language == 'en' else "操作日志将在此处显示...")
+        self.log_edit.setPlaceholderText(self._tr['log_placeholder'])
         self.log_edit.setMaximumHeight(200)
         self.log_edit.setReadOnly(True)
+        # Keep only the latest lines and no undo history for the append-only log
+        self.log_edit.document().setMaximumBlockCount(2000)
+        self.log_edit.setUndoRedoEnabled(False)
         log_layout.addWidget(self.log_edit)
 
         splitter.addWidget(rules_widget)
@@ -516,45 +833,45 @@ class EnhancedHostsManager(QMainWindow):
         splitter.setSizes([500, 200])
 
         main_layout.addWidget(splitter)
-        self.tab_widget.addTab(main_tab, "Main" if self.language == 'en' else "主页")
+        self.tab_widget.addTab(main_tab, self._tr['tab_main'])
 
         # Settings tab
         settings_tab = QWidget()
         settings_layout = QVBoxLayout(settings_tab)
-        settings_label = QLabel("Settings will be available in future versions" if self.language == 'en' else "设置功能将在未来版本中提供")
+        settings_label = QLabel(self._tr['settings_placeholder'])
         settings_label.setAlignment(Qt.AlignCenter)
         settings_layout.addWidget(settings_label)
-        self.tab_widget.addTab(settings_tab, "Settings" if self.language == 'en' else "设置")
+        self.tab_widget.addTab(settings_tab, self._tr['tab_settings'])
 
         layout.addWidget(self.tab_widget)
 
         # Status bar
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
-        self.status_bar.showMessage("Ready" if self.language == 'en' else "就绪")
+        self.status_bar.showMessage(self._tr['ready'])
 
         # Menu bar
         self.create_menu()
 
         # Log startup message
-        self.log("🚀 GitHub & Replit Hosts Manager PyQt Edition started" if self.language == 'en' else "🚀 GitHub & Replit Hosts 管理工具 PyQt 版已启动")
+        self.log(self._tr['started'])
 
     def create_menu(self):
         """Create menu bar"""
         menubar = self.menuBar()
         
         # File menu
-        file_menu = menubar.addMenu('File' if self.language == 'en' else '文件')
+        file_menu = menubar.addMenu(self._tr['menu_file'])
         
-        exit_action = QAction('Exit' if self.language == 'en' else '退出', self)
+        exit_action = QAction(self._tr['menu_exit'], self)
         exit_action.setShortcut('Ctrl+Q')
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
         
         # Help menu
-        help_menu = menubar.addMenu('Help' if self.language == 'en' else '帮助')
+        help_menu = menubar.addMenu(self._tr['menu_help'])
         
-        about_action = QAction('About' if self.language == 'en' else '关于', self)
+        about_action = QAction(self._tr['menu_about'], self)
         about_action.triggered.connect(self.show_about)
         help_menu.addAction(about_action)
 
@@ -562,9 +879,9 @@ class EnhancedHostsManager(QMainWindow):
         """Handle target type change"""
         self.current_target = self.target_combo.currentData()
         target_name = "GitHub" if self.current_target == "github" else "Replit"
-        msg = f"🎯 Switched to {target_name} mode" if self.language == 'en' else f"🎯 已切换到 {target_name} 模式"
+        msg = self._tr['target_switched'].format(target=target_name)
         self.log(msg)
-        status_msg = f"Current target: {target_name}" if self.language == 'en' else f"当前目标: {target_name}"
+        status_msg = self._tr['current_target'].format(target=target_name)
         self.status_bar.showMessage(status_msg)
 
     def on_language_changed(self, index):
@@ -572,51 +889,57 @@ class EnhancedHostsManager(QMainWindow):
         selected_lang = self.lang_combo.currentData()
         if selected_lang != self.language:
             self.language = selected_lang
+            self.set_language_strings()
             self.update_ui_language()
 
+    def set_language_strings(self):
+        """Point self._tr at the string table for the current language (Chinese for anything but English)"""
+        self._lang_key = 'en' if self.language == 'en' else 'zh'
+        self._tr = self._STRINGS[self._lang_key]
+
     def update_ui_language(self):
         """Update UI text based on selected language"""
         # Update window title
-        window_title = "GitHub & Replit Hosts Manager v3.0 (PyQt Edition)" if self.language == 'en' else "GitHub & Replit Hosts 管理工具 v3.0 (PyQt版)"
+        window_title = self._tr['window_title']
         self.setWindowTitle(window_title)
         
         # Update labels and buttons
-        target_label = "Select target:" if self.language == 'en' else "选择目标:"
-        lang_label = "Language:" if self.language == 'en' else "语言:"
+        target_label = self._tr['select_target']
+        lang_label = self._tr['language']
         
         # Update combo box texts
         self.target_combo.setItemText(0, "GitHub")
         self.target_combo.setItemText(1, "Replit")
         
         # Update button texts
-        self.btn_download.setText("🔄 Update Rules" if self.language == 'en' else "🔄 更新规则")
-        self.btn_apply.setText("💾 Apply Rules" if self.language == 'en' else "💾 应用规则")
-        self.btn_backup.setText("📦 Create Backup" if self.language == 'en' else "📦 创建备份")
-        self.btn_restore.setText("⏪ Restore Backup" if self.language == 'en' else "⏪ 恢复备份")
+        self.btn_download.setText(self._tr['btn_download'])
+        self.btn_apply.setText(self._tr['btn_apply'])
+        self.btn_backup.setText(self._tr['btn_backup'])
+        self.btn_restore.setText(self._tr['btn_restore'])
         
         # Update tab texts
-        self.tab_widget.setTabText(0, "Main" if self.language == 'en' else "主页")
-        self.tab_widget.setTabText(1, "Settings" if self.language == 'en' else "设置")
+        self.tab_widget.setTabText(0, self._tr['tab_main'])
+        self.tab_widget.setTabText(1, self._tr['tab_settings'])
         
         # Update placeholders
-        self.rules_edit.setPlaceholderText("Rules will be displayed here..." if self.language == 'en' else "规则将在此处显示...")
-        self.log_edit.setPlaceholderText("Operation logs will be displayed here..." if self.language == 'en' else "操作日志将在此处显示...")
+        self.rules_edit.setPlaceholderText(self._tr['rules_placeholder'])
+        self.log_edit.setPlaceholderText(self._tr['log_placeholder'])
         
         # Update status bar
-        self.status_bar.showMessage("Ready" if self.language == 'en' else "就绪")
+        self.status_bar.showMessage(self._tr['ready'])
         
         # Log language change
-        lang_msg = "Language switched to English" if self.language == 'en' else "语言已切换为中文"
+        lang_msg = self._tr['language_switched']
         self.log(lang_msg)
 
     def check_admin_status(self):
         """Check and display administrator status"""
-        if is_admin():
-            status_msg = "✅ Running with administrator privileges" if self.language == 'en' else "✅ 当前以管理员权限运行"
+        if self._is_admin:
+            status_msg = self._tr['admin_yes']
             self.admin_label.setText(status_msg)
             self.admin_label.setStyleSheet("color: green; font-weight: bold; padding: 5px;")
         else:
-            status_msg = "⚠️ Not running with administrator privileges (some functions may be limited)" if self.language == 'en' else "⚠️ 当前未以管理员权限运行（部分功能可能受限）"
+            status_msg = self._tr['admin_no']
             self.admin_label.setText(status_msg)
             self.admin_label.setStyleSheet("color: orange; font-weight: bold; padding: 5px;")
 
@@ -624,9 +947,15 @@ class EnhancedHostsManager(QMainWindow):
         """Add log message"""
         timestamp = datetime.now().strftime("%H:%M:%S")
         formatted_message = f"[{timestamp}] {message}"
-        self.log_edit.append(formatted_message)
+        self._log_buf.append(formatted_message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_log(self):
+        """Append all buffered log messages in one update"""
+        self.log_edit.append('\n'.join(self._log_buf))
+        self._log_buf.clear()
         self.log_edit.moveCursor(QTextCursor.End)
-        QApplication.processEvents()  # Ensure UI updates
 
     def set_buttons_enabled(self, enabled):
         """Enable/disable all buttons"""
@@ -638,38 +967,33 @@ class EnhancedHostsManager(QMainWindow):
     def download_rules(self):
         """Download latest rules"""
         target_name = "GitHub" if self.current_target == "github" else "Replit"
-        msg = f"Starting to download latest {target_name} hosts rules..." if self.language == 'en' else f"开始下载最新 {target_name} hosts 规则..."
+        msg = self._tr['download_start'].format(target=target_name)
         self.log(msg)
         self.set_buttons_enabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
 
-        self.thread = EnhancedHostsManagerThread('download', target_type=self.current_target, language=self.language)
-        self.thread.log_signal.connect(self.log)
-        self.thread.result_signal.connect(self.on_download_result)
-        self.thread.progress_signal.connect(self.progress_bar.setValue)
-        self.thread.finished.connect(self.on_thread_finished)
-        self.thread.start()
+        self.task_signal.emit('download', None, self.current_target, self.language)
 
     def on_download_result(self, result):
         """Handle download result"""
         if result['success']:
             self.current_rules = result['rules']
             self.rules_edit.setPlainText(self.current_rules)
-            self.log(result.get('message', 'Download completed' if self.language == 'en' else '下载完成'))
-            QMessageBox.information(self, 'Success' if self.language == 'en' else '成功', 
-                                  result.get('message', 'Rules updated successfully' if self.language == 'en' else '规则更新成功'))
+            self.log(result.get('message', self._tr['download_completed']))
+            QMessageBox.information(self, self._tr['success'], 
+                                  result.get('message', self._tr['rules_updated']))
         else:
-            self.log(f"❌ {result.get('error', 'Download failed' if self.language == 'en' else '下载失败')}")
-            QMessageBox.critical(self, 'Error' if self.language == 'en' else '错误', 
-                               result.get('error', 'Download failed' if self.language == 'en' else '下载失败'))
+            self.log(f"❌ {result.get('error', self._tr['download_failed'])}")
+            QMessageBox.critical(self, self._tr['error'], 
+                               result.get('error', self._tr['download_failed']))
 
     def apply_rules(self):
         """Apply rules to system hosts file"""
         # Check admin privileges first
-        if not is_admin():
-            msg = "This operation requires administrator privileges. Restart as administrator?" if self.language == 'en' else "此操作需要管理员权限。是否以管理员身份重新启动？"
-            reply = QMessageBox.question(self, 'Administrator Privileges Required' if self.language == 'en' else '需要管理员权限', 
+        if not self._is_admin:
+            msg = self._tr['admin_restart']
+            reply = QMessageBox.question(self, self._tr['admin_required'], 
                                        msg, QMessageBox.Yes | QMessageBox.No)
             
             if reply == QMessageBox.Yes:
@@ -678,69 +1002,61 @@ class EnhancedHostsManager(QMainWindow):
             return
 
         target_name = "GitHub" if self.current_target == "github" else "Replit"
-        confirm_msg = f"This will modify the system hosts file to optimize {target_name} access. Continue?" if self.language == 'en' else f"这将修改系统 hosts 文件以优化 {target_name} 访问。继续吗？"
-        reply = QMessageBox.question(self, 'Confirm' if self.language == 'en' else '确认',
+        confirm_msg = self._tr['apply_confirm'].format(target=target_name)
+        reply = QMessageBox.question(self, self._tr['confirm'],
                                    confirm_msg, QMessageBox.Yes | QMessageBox.No)
 
         if reply == QMessageBox.Yes:
-            msg = f"Starting to apply {target_name} rules to system hosts file..." if self.language == 'en' else f"开始应用 {target_name} 规则到系统 hosts 文件..."
+            msg = self._tr['apply_start'].format(target=target_name)
             self.log(msg)
             self.set_buttons_enabled(False)
 
             self.current_rules = self.rules_edit.toPlainText()
-            self.thread = EnhancedHostsManagerThread('apply', self.current_rules, self.current_target, self.language)
-            self.thread.log_signal.connect(self.log)
-            self.thread.result_signal.connect(self.on_apply_result)
-            self.thread.finished.connect(self.on_thread_finished)
-            self.thread.start()
+            self.task_signal.emit('apply', self.current_rules, self.current_target, self.language)
 
     def on_apply_result(self, result):
         """Handle apply result"""
         if result['success']:
             target_name = "GitHub" if self.current_target == "github" else "Replit"
-            success_msg = f"✅ {target_name} rules applied successfully!" if self.language == 'en' else f"✅ {target_name} 规则应用成功！"
+            success_msg = self._tr['apply_success_log'].format(target=target_name)
             self.log(success_msg)
-            dns_msg = "💡 Suggest flushing DNS cache: ipconfig /flushdns (Windows)" if self.language == 'en' else "💡 建议刷新DNS缓存: ipconfig /flushdns (Windows)"
+            dns_msg = self._tr['flush_dns_hint']
             self.log(dns_msg)
-            QMessageBox.information(self, 'Success' if self.language == 'en' else '成功',
-                                  'Rules applied successfully! Please flush DNS cache for changes to take effect.' if self.language == 'en' else '规则应用成功！请刷新DNS缓存使更改生效。')
-            self.status_bar.showMessage("Rules applied successfully" if self.language == 'en' else "规则应用成功")
+            QMessageBox.information(self, self._tr['success'],
+                                  self._tr['apply_success_message'])
+            self.status_bar.showMessage(self._tr['apply_success_status'])
         else:
-            error_msg = f"❌ Apply failed: {result.get('error', 'Unknown error' if self.language == 'en' else '未知错误')}"
+            error_msg = f"❌ Apply failed: {result.get('error', self._tr['unknown_error'])}"
             self.log(error_msg)
-            QMessageBox.critical(self, 'Error' if self.language == 'en' else '错误',
-                               f"Apply failed: {result.get('error', 'Unknown error' if self.language == 'en' else '未知错误')}")
+            QMessageBox.critical(self, self._tr['error'],
+                               f"Apply failed: {result.get('error', self._tr['unknown_error'])}")
 
     def create_backup(self):
         """Create backup of current hosts file"""
-        self.log("Starting to create backup of current hosts file..." if self.language == 'en' else "开始创建当前 hosts 文件的备份...")
+        self.log(self._tr['backup_start'])
         self.set_buttons_enabled(False)
 
-        self.thread = EnhancedHostsManagerThread('backup', language=self.language)
-        self.thread.log_signal.connect(self.log)
-        self.thread.result_signal.connect(self.on_backup_result)
-        self.thread.finished.connect(self.on_thread_finished)
-        self.thread.start()
+        self.task_signal.emit('backup', None, self.current_target, self.language)
 
     def on_backup_result(self, result):
         """Handle backup result"""
         if result['success']:
-            self.log("✅ Backup created successfully!" if self.language == 'en' else "✅ 备份创建成功！")
-            QMessageBox.information(self, 'Success' if self.language == 'en' else '成功',
-                                  'Backup created successfully!' if self.language == 'en' else '备份创建成功！')
-            self.status_bar.showMessage("Backup created successfully" if self.language == 'en' else "备份创建成功")
+            self.log(self._tr['backup_success_log'])
+            QMessageBox.information(self, self._tr['success'],
+                                  self._tr['backup_success_message'])
+            self.status_bar.showMessage(self._tr['backup_success_status'])
         else:
-            error_msg = f"❌ Backup failed: {result.get('error', 'Unknown error' if self.language == 'en' else '未知错误')}"
+            error_msg = f"❌ Backup failed: {result.get('error', self._tr['unknown_error'])}"
             self.log(error_msg)
-            QMessageBox.critical(self, 'Error' if self.language == 'en' else '错误',
-                               f"Backup failed: {result.get('error', 'Unknown error' if self.language == 'en' else '未知错误')}")
+            QMessageBox.critical(self, self._tr['error'],
+                               f"Backup failed: {result.get('error', self._tr['unknown_error'])}")
 
     def restore_backup(self):
         """Restore hosts file from backup"""
         # Check admin privileges first
-        if not is_admin():
-            msg = "This operation requires administrator privileges. Restart as administrator?" if self.language == 'en' else "此操作需要管理员权限。是否以管理员身份重新启动？"
-            reply = QMessageBox.question(self, 'Administrator Privileges Required' if self.language == 'en' else '需要管理员权限', 
+        if not self._is_admin:
+            msg = self._tr['admin_restart']
+            reply = QMessageBox.question(self, self._tr['admin_required'], 
                                        msg, QMessageBox.Yes | QMessageBox.No)
             
             if reply == QMessageBox.Yes:
@@ -748,32 +1064,36 @@ class EnhancedHostsManager(QMainWindow):
                 sys.exit(0)
             return
 
-        confirm_msg = "This will restore the hosts file from a backup. Continue?" if self.language == 'en' else "这将从备份恢复 hosts 文件。继续吗？"
-        reply = QMessageBox.question(self, 'Confirm' if self.language == 'en' else '确认',
+        confirm_msg = self._tr['restore_confirm']
+        reply = QMessageBox.question(self, self._tr['confirm'],
                                    confirm_msg, QMessageBox.Yes | QMessageBox.No)
 
         if reply == QMessageBox.Yes:
-            self.log("Starting to restore hosts file from backup..." if self.language == 'en' else "开始从备份恢复 hosts 文件...")
+            # Dialogs must run on the GUI thread, so the backup file is picked before the task starts
+            backup_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backups')
+            backup_file, _ = QFileDialog.getOpenFileName(
+                self, self._tr['select_backup'], backup_dir, self._tr['backup_filter'])
+            if not backup_file:
+                self.log(self._tr['operation_cancelled'])
+                return
+
+            self.log(self._tr['restore_start'])
             self.set_buttons_enabled(False)
 
-            self.thread = EnhancedHostsManagerThread('restore', language=self.language)
-            self.thread.log_signal.connect(self.log)
-            self.thread.result_signal.connect(self.on_restore_result)
-            self.thread.finished.connect(self.on_thread_finished)
-            self.thread.start()
+            self.task_signal.emit('restore', backup_file, self.current_target, self.language)
 
     def on_restore_result(self, result):
         """Handle restore result"""
         if result['success']:
-            self.log("✅ Backup restored successfully!" if self.language == 'en' else "✅ 备份恢复成功！")
-            QMessageBox.information(self, 'Success' if self.language == 'en' else '成功',
-                                  'Backup restored successfully!' if self.language == 'en' else '备份恢复成功！')
-            self.status_bar.showMessage("Backup restored successfully" if self.language == 'en' else "备份恢复成功")
+            self.log(self._tr['restore_success_log'])
+            QMessageBox.information(self, self._tr['success'],
+                                  self._tr['restore_success_message'])
+            self.status_bar.showMessage(self._tr['restore_success_status'])
         else:
-            error_msg = f"❌ Restore failed: {result.get('error', 'Unknown error' if self.language == 'en' else '未知错误')}"
+            error_msg = f"❌ Restore failed: {result.get('error', self._tr['unknown_error'])}"
             self.log(error_msg)
-            QMessageBox.critical(self, 'Error' if self.language == 'en' else '错误',
-                               f"Restore failed: {result.get('error', 'Unknown error' if self.language == 'en' else '未知错误')}")
+            QMessageBox.critical(self, self._tr['error'],
+                               f"Restore failed: {result.get('error', self._tr['unknown_error'])}")
 
     def on_thread_finished(self):
         """Clean up when thread finishes"""
@@ -787,52 +1107,17 @@ class EnhancedHostsManager(QMainWindow):
 
     def show_about(self):
         """Show about dialog"""
-        if self.language == 'en':
-            about_text = """
-            <h2>mini-SwitchHosts v3.0 PyQt Edition</h2>
-            <p><b>Enhanced Edition with Improved Features</b></p>
-            <p>Enhanced IP resolution, smart filtering, and incremental updates</p>
-            <p><b>Key Improvements:</b></p>
-            <ul>
-                <li>Enhanced IP parsing algorithm for better accuracy</li>
-                <li>Smart rule filtering to remove invalid entries</li>
-                <li>Incremental update mechanism for efficiency</li>
-                <li>Modern UI with real-time status monitoring</li>
-                <li>Concurrent processing for faster downloads</li>
-                <li>Multi-language support (English and Chinese)</li>
-                <li>Cross-platform compatibility (Windows, Linux, macOS)</li>
-                <li>PyQt-based interface for better performance</li>
-            </ul>
-            <p>© 2025 mini-SwitchHosts Project</p>
-            """
-        else:
-            about_text = """
-            <h2>mini-SwitchHosts v3.0 PyQt版</h2>
-            <p><b>增强版，包含改进功能</b></p>
-            <p>增强的IP解析、智能过滤和增量更新</p>
-            <p><b>主要改进:</b></p>
-            <ul>
-                <li>增强的IP解析算法，提高准确性</li>
-                <li>智能规则过滤，去除无效条目</li>
-                <li>增量更新机制，提高效率</li>
-                <li>现代化UI，支持实时状态监控</li>
-                <li>并发处理，加快下载速度</li>
-                <li>多语言支持（英文和中文）</li>
-                <li>跨平台兼容性（Windows、Linux、macOS）</li>
-                <li>基于PyQt的界面，性能更好</li>
-            </ul>
-            <p>© 2025 mini-SwitchHosts 项目</p>
-            """
-        title = "About mini-SwitchHosts" if self.language == 'en' else "关于 mini-SwitchHosts"
-        QMessageBox.about(self, title, about_text)
+        QMessageBox.about(self, self._tr['about_title'], self._ABOUT_HTML[self._lang_key])
 
     def closeEvent(self, event):
         """Handle application close event"""
-        confirm_title = "Confirm Exit" if self.language == 'en' else "确认退出"
-        confirm_msg = "Are you sure you want to exit?\nUnsaved changes may be lost." if self.language == 'en' else "确定要退出吗?\n未保存的更改可能会丢失。"
+        confirm_title = self._tr['exit_title']
+        confirm_msg = self._tr['exit_confirm']
         reply = QMessageBox.question(self, confirm_title, confirm_msg, QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         
         if reply == QMessageBox.Yes:
+            self.worker_thread.quit()
+            self.worker_thread.wait()
             event.accept()
         else:
             event.ignore()
@@ -9,15 +9,48 @@ Supports Windows, Linux, and macOS
 import sys
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import shutil
 import tempfile
 import argparse
 import platform
 import ctypes
+import threading
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import re
 
 
+_IP_RE = re.compile(r'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$')
+
+GITHUB_DOMAINS = frozenset({
+    'github.com', 'github.global.ssl.fastly.net',
+    'assets-cdn.github.com', 'github.githubassets.com',
+    'codeload.github.com', 'api.github.com',
+    'raw.githubusercontent.com', 'user-images.githubusercontent.com',
+    'favicons.githubusercontent.com', 'camo.githubusercontent.com',
+    'gist.github.com', 'gist.githubusercontent.com'
+})
+
+REPLIT_DOMAINS = frozenset({
+    'replit.com', 'repl.co', 'repl.it',
+    'cdn.replit.com', 'static.replit.com',
+    'sp.replit.com', 'replit.app',
+    'firewalledreplit.com', 'ide.replit.com',
+    'docs.replit.com', 'api.replit.com',
+    'eval.replit.com', 'widgets.replit.com'
+})
+
+# Shared session so mirrors on the same host reuse kept-alive connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=3, pool_maxsize=3,
+                                       max_retries=Retry(total=1, backoff_factor=0.2)))
+
+# Fail fast on dead mirrors (connect), but give slow ones time to send (read)
+REQUEST_TIMEOUT = (3, 15)
+
+
 def is_admin():
     """Check if the program has administrator privileges"""
     try:
@@ -80,76 +113,105 @@ def download_rules(target='github'):
             "https://cdn.jsdelivr.net/gh/techsharing/toolbox/hosts/replit-hosts"
         ]
 
-    # Try each source
-    for i, source in enumerate(sources):
-        try:
-            print(f"🔄 Trying to download from {source.split('//')[1].split('/')[0]}...")
-            response = requests.get(source, timeout=15)
+    # Query all sources at once and take the first one that yields rules
+    stop = threading.Event()
+    pool = ThreadPoolExecutor(max_workers=len(sources))
+    try:
+        futures = [pool.submit(fetch_rules, source, target, stop) for source in sources]
+        for future in as_completed(futures):
+            rules = future.result()
+            if rules:
+                print(f"✅ Successfully parsed {target} rules")
+                return rules
+    finally:
+        # Tell the slower mirrors to drop their downloads and close their sockets
+        stop.set()
+        pool.shutdown(wait=False)
+
+    print("❌ All sources failed")
+    return None
+
+
+def _until_set(lines, stop):
+    """Yield lines until stop is set"""
+    for line in lines:
+        if stop.is_set():
+            return
+        yield line
+
+
+def fetch_rules(source, target, stop):
+    """Download one source and return its parsed rules, or None once stop is set"""
+    try:
+        print(f"🔄 Trying to download from {source.split('//')[1].split('/')[0]}...")
+        with _SESSION.get(source, stream=True, timeout=REQUEST_TIMEOUT) as response:
+            if stop.is_set():  # Another mirror already won; leaving closes the socket
+                return None
             if response.status_code == 200:
-                print("✅ Download successful, parsing rules...")
-                
+                print(f"✅ Download from {source} successful, parsing rules...")
+
+                # Feed lines to the extractor as they arrive instead of
+                # building the whole body as one string first
+                if response.encoding is None:
+                    response.encoding = 'utf-8'
+                lines = _until_set(response.iter_lines(decode_unicode=True), stop)
                 if target == 'github':
-                    rules = extract_github_rules(response.text)
+                    rules = extract_github_rules(lines)
                 else:
-                    rules = extract_replit_rules(response.text)
-                
-                if rules and not rules.startswith("# Not found"):
-                    print(f"✅ Successfully parsed {target} rules")
+                    rules = extract_replit_rules(lines)
+                if stop.is_set():  # Cut short, so the rules are incomplete
+                    return None
+
+                # Extractors return a single comment line when nothing matched
+                if rules and not rules.startswith("#"):
                     return rules
-                else:
-                    print("⚠️  Downloaded rules are empty, trying next source...")
-                
-        except requests.exceptions.Timeout:
-            print(f"⚠️  {source} connection timed out")
-            continue
-        except requests.exceptions.ConnectionError:
-            print(f"⚠️  {source} connection error")
-            continue
-        except Exception as e:
-            print(f"⚠️  {source} failed: {str(e)}")
-            continue
+                print(f"⚠️  Rules downloaded from {source} are empty")
 
-    print("❌ All sources failed")
+    except Exception as e:
+        # Failures of mirrors that already lost the race are not worth reporting
+        if not stop.is_set():
+            if isinstance(e, requests.exceptions.Timeout):
+                print(f"⚠️  {source} connection timed out")
+            elif isinstance(e, requests.exceptions.ConnectionError):
+                print(f"⚠️  {source} connection error")
+            else:
+                print(f"⚠️  {source} failed: {str(e)}")
     return None
 
 
-def extract_github_rules(content):
-    """Extract GitHub related rules"""
+def is_target_host(host, domains):
+    """Check if host is one of domains or a subdomain of one"""
+    host = host.lower()
+    while host:
+        if host in domains:
+            return True
+        host = host.partition('.')[2]
+    return False
+
+
+def extract_github_rules(lines):
+    """Extract GitHub related rules from an iterable of lines"""
     github_rules = []
-    lines = content.split('\n')
 
     for line in lines:
         line = line.strip()
         if line and not line.startswith('#'):
-            if any(domain in line for domain in [
-                'github.com', 'github.global.ssl.fastly.net',
-                'assets-cdn.github.com', 'github.githubassets.com',
-                'codeload.github.com', 'api.github.com',
-                'raw.githubusercontent.com', 'user-images.githubusercontent.com',
-                'favicons.githubusercontent.com', 'camo.githubusercontent.com',
-                'gist.github.com', 'gist.githubusercontent.com'
-            ]):
+            parts = line.split()
+            if len(parts) >= 2 and is_target_host(parts[1], GITHUB_DOMAINS):
                 github_rules.append(line)
 
     return '\n'.join(github_rules) if github_rules else "# GitHub related rules not found"
 
 
-def extract_replit_rules(content):
-    """Extract Replit related rules"""
+def extract_replit_rules(lines):
+    """Extract Replit related rules from an iterable of lines"""
     replit_rules = []
-    lines = content.split('\n')
 
     for line in lines:
         line = line.strip()
         if line and not line.startswith('#'):
-            if any(domain in line for domain in [
-                'replit.com', 'repl.co', 'repl.it',
-                'cdn.replit.com', 'static.replit.com',
-                'sp.replit.com', 'replit.app',
-                'firewalledreplit.com', 'ide.replit.com',
-                'docs.replit.com', 'api.replit.com',
-                'eval.replit.com', 'widgets.replit.com'
-            ]):
+            parts = line.split()
+            if len(parts) >= 2 and is_target_host(parts[1], REPLIT_DOMAINS):
                 replit_rules.append(line)
 
     return '\n'.join(replit_rules) if replit_rules else "# Replit related rules not found"
@@ -157,8 +219,7 @@ def extract_replit_rules(content):
 
 def is_valid_ip(ip_str):
     """Check if string is a valid IP address"""
-    ip_pattern = r'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$'
-    return re.match(ip_pattern, ip_str) is not None
+    return _IP_RE.match(ip_str) is not None
 
 
 def apply_rules(rules, target='github'):
@@ -180,53 +241,62 @@ def apply_rules(rules, target='github'):
         # Create backup first
         create_backup()
         
-        # Read current hosts file
-        with open(hosts_path, 'r', encoding='utf-8') as f:
-            current_content = f.read()
-
         # Process content
         section_start_marker = "# === GitHub & Replit Hosts Rules Start ==="
         section_end_marker = "# === GitHub & Replit Hosts Rules End ==="
-        
-        # Remove existing section if present
-        lines = current_content.split('\n')
-        new_lines = []
-        in_target_section = False
-        
-        for line in lines:
-            stripped = line.strip()
-            
-            # Detect section start
-            if stripped.startswith(section_start_marker):
-                in_target_section = True
-                continue
-            
-            # Detect section end
-            if stripped.startswith(section_end_marker):
-                in_target_section = False
-                continue
-            
-            # Skip lines in target section
-            if in_target_section:
-                continue
-            
-            # Add line if not in target section
-            new_lines.append(line)
-        
-        # Add new rules section
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         target_name = "GitHub & Replit"
-        new_lines.append("")
-        new_lines.append(section_start_marker)
-        new_lines.append(f"# {target_name} Hosts Rules")
-        new_lines.append(f"# Updated: {timestamp}")
-        new_lines.append(rules)
-        new_lines.append(section_end_marker)
-        new_lines.append("")
-        
-        # Write back to hosts file
-        with open(hosts_path, 'w', encoding='utf-8', newline='\n') as f:
-            f.write('\n'.join(new_lines))
+
+        # Stream the current hosts file into a temp file next to it, dropping
+        # the existing section, so the whole file is never held in memory
+        tmp_path = None
+        try:
+            with open(hosts_path, 'r', encoding='utf-8') as in_f, \
+                    tempfile.NamedTemporaryFile('w', encoding='utf-8', newline='\n',
+                                                dir=os.path.dirname(hosts_path),
+                                                delete=False) as out_f:
+                tmp_path = out_f.name
+                in_target_section = False
+                last_line = '\n'
+
+                for line in in_f:
+                    stripped = line.strip()
+
+                    # Detect section start
+                    if stripped.startswith(section_start_marker):
+                        in_target_section = True
+                        continue
+
+                    # Detect section end
+                    if stripped.startswith(section_end_marker):
+                        in_target_section = False
+                        continue
+
+                    # Skip lines in target section
+                    if in_target_section:
+                        continue
+
+                    # Copy line if not in target section
+                    out_f.write(line)
+                    last_line = line
+
+                if not last_line.endswith('\n'):
+                    out_f.write('\n')
+
+                # Add new rules section
+                out_f.write(f"\n{section_start_marker}\n"
+                            f"# {target_name} Hosts Rules\n"
+                            f"# Updated: {timestamp}\n"
+                            f"{rules}\n"
+                            f"{section_end_marker}\n")
+
+            # Keep the hosts file's permissions, then swap it in atomically
+            shutil.copymode(hosts_path, tmp_path)
+            os.replace(tmp_path, hosts_path)
+        except BaseException:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
         
         print("✅ Rules applied successfully")
         return True
@@ -255,14 +325,16 @@ def restore_backup(backup_file=None):
                 print("❌ No backups directory found")
                 return False
             
-            backups = [f for f in os.listdir(backup_dir) if f.startswith('hosts_backup_') and f.endswith('.txt')]
-            if not backups:
+            # Timestamped names sort chronologically, so the newest is the max
+            with os.scandir(backup_dir) as it:
+                latest = max((e.name for e in it
+                              if e.name.startswith('hosts_backup_') and e.name.endswith('.txt')
+                              and e.is_file()), default=None)
+            if not latest:
                 print("❌ No backup files found")
                 return False
             
-            # Sort by timestamp (newest first)
-            backups.sort(reverse=True)
-            backup_file = os.path.join(backup_dir, backups[0])
+            backup_file = os.path.join(backup_dir, latest)
             print(f"📂 Using latest backup: {backup_file}")
         
         if not os.path.exists(backup_file):
@@ -271,16 +343,15 @@ def restore_backup(backup_file=None):
 
         hosts_path = get_hosts_path()
         
-        # Use temporary file for safe restore
-        temp_dir = tempfile.gettempdir()
-        temp_hosts = os.path.join(temp_dir, 'hosts_restore_temp')
-
-        shutil.copy2(backup_file, temp_hosts)
-        shutil.copy2(temp_hosts, hosts_path)
-
-        # Clean up temporary file
-        if os.path.exists(temp_hosts):
-            os.remove(temp_hosts)
+        # Copy once to a sibling temp file, then swap it in atomically
+        temp_hosts = hosts_path + '.tmp'
+        try:
+            shutil.copy2(backup_file, temp_hosts)
+            os.replace(temp_hosts, hosts_path)
+        except BaseException:
+            if os.path.exists(temp_hosts):
+                os.remove(temp_hosts)
+            raise
 
         print("✅ Backup restored successfully")
         return True
@@ -299,7 +370,9 @@ def list_backups():
         print("❌ No backups directory found")
         return
     
-    backups = [f for f in os.listdir(backup_dir) if f.startswith('hosts_backup_') and f.endswith('.txt')]
+    with os.scandir(backup_dir) as it:
+        backups = [e.name for e in it
+                   if e.name.startswith('hosts_backup_') and e.name.endswith('.txt') and e.is_file()]
     if not backups:
         print("❌ No backup files found")
         return
@@ -389,6 +462,16 @@ def main():
         print("❌ No action specified. Use -h for help.")
         return 1
     
+    # Check for administrator privileges for operations that need it
+    needs_admin = args.apply or args.backup or bool(args.restore)
+    if needs_admin and not is_admin():
+        print("❌ This operation requires administrator privileges.")
+        if platform.system().lower() == 'windows':
+            print("   Please run as administrator.")
+        else:
+            print("   Please run with sudo.")
+        return 1
+    
     # Handle backup
     if args.backup:
         create_backup()
@@ -430,15 +513,4 @@ def main():
 
 
 if __name__ == "__main__":
-    # Check for administrator privileges for operations that need it
-    if len(sys.argv) > 1 and not is_admin():
-        operations_requiring_admin = ['-a', '--apply', '-b', '--backup', '-r', '--restore']
-        if any(op in sys.argv for op in operations_requiring_admin):
-            print("❌ This operation requires administrator privileges.")
-            if platform.system().lower() == 'windows':
-                print("   Please run as administrator.")
-            else:
-                print("   Please run with sudo.")
-            sys.exit(1)
-    
     sys.exit(main())
\ No newline at end of file
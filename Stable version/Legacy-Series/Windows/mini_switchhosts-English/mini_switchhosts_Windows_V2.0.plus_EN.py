@@ -7,17 +7,94 @@ Function: Update, backup, and restore GitHub and Replit related hosts rules
 
 import sys
 import os
+import io
+import re
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
 import shutil
 import ctypes
 import tempfile
+import threading
+import time
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
-                               QHBoxLayout, QTextEdit, QPushButton, QLabel,
+                               QHBoxLayout, QTextEdit, QPlainTextEdit, QPushButton, QLabel,
                                QMessageBox, QFileDialog, QSplitter, QProgressBar,
                                QComboBox)
-from PySide6.QtCore import Qt, QThread, Signal as pyqtSignal
-from PySide6.QtGui import QFont, QTextCursor
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal as pyqtSignal
+from PySide6.QtGui import QFont
+
+
+GITHUB_DOMAINS = (
+    'github.com', 'github.global.ssl.fastly.net',
+    'assets-cdn.github.com', 'github.githubassets.com',
+    'codeload.github.com', 'api.github.com',
+    'raw.githubusercontent.com', 'user-images.githubusercontent.com',
+    'favicons.githubusercontent.com', 'camo.githubusercontent.com',
+    'gist.github.com', 'gist.githubusercontent.com'
+)
+
+REPLIT_DOMAINS = (
+    'replit.com', 'repl.co', 'repl.it',
+    'cdn.replit.com', 'static.replit.com',
+    'sp.replit.com', 'replit.app',
+    'firewalledreplit.com', 'ide.replit.com',
+    'docs.replit.com', 'api.replit.com',
+    'eval.replit.com', 'widgets.replit.com'
+)
+
+# Mirrors queried for each target's rules
+RULE_SOURCES = {
+    'github': (
+        "https://gitee.com/ineo6/hosts/raw/master/hosts",
+        "https://raw.hellogithub.com/hosts",
+        "https://cdn.jsdelivr.net/gh/ineo6/hosts/hosts",
+        "https://gitlab.com/ineo6/hosts/-/raw/master/hosts"
+    ),
+    'replit': (
+        # Remove unreliable sources, add new reliable sources
+        "https://cdn.jsdelivr.net/gh/techsharing/toolbox/hosts/replit-hosts",
+        "https://gitee.com/techsharing/toolbox/raw/main/hosts/replit-hosts",
+        "https://raw.githubusercontent.com/521xueweihan/GitHub520/main/hosts",  # This source also contains some replit rules
+        "https://gitlab.com/techsharing/toolbox/-/raw/main/hosts/replit-hosts"
+    ),
+}
+
+# Shared session so repeated downloads reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=0))
+
+# Fail fast on dead mirrors (connect), but give slow ones time to send (read)
+REQUEST_TIMEOUT = (3, 10)
+
+# Domains whose entries update_hosts_content moves into the managed section
+_GITHUB_DOMAIN_SET = frozenset([
+    'alive.github.com', 'api.github.com', 'camo.githubusercontent.com',
+    'central.github.com', 'codeload.github.com', 'collector.github.com',
+    'favicons.githubusercontent.com', 'gist.github.com', 'github.com',
+    'github.community', 'github.githubassets.com', 'github.global.ssl.fastly.net',
+    'live.github.com', 'raw.githubusercontent.com', 'user-images.githubusercontent.com',
+    'education.github.com', 'private-user-images.githubusercontent.com'
+])
+
+# Domains clean_old_rules removes, per target
+TARGET_DOMAIN_SETS = {
+    'github': frozenset(GITHUB_DOMAINS),
+    'replit': frozenset(REPLIT_DOMAINS),
+}
+
+# Literal every domain of a target contains; a cheap gate before the full match
+TARGET_LITERALS = {'github': 'github', 'replit': 'repl'}
+
+# One alternation per target, so each line is scanned once instead of once per domain
+_GITHUB_RE = re.compile('|'.join(re.escape(d) for d in GITHUB_DOMAINS))
+_REPLIT_RE = re.compile('|'.join(re.escape(d) for d in REPLIT_DOMAINS))
+TARGET_PATTERNS = {'github': _GITHUB_RE, 'replit': _REPLIT_RE}
+
+# "IP<whitespace>domain" at the start of a hosts line; trailing fields are ignored
+_HOSTS_LINE_RE = re.compile(r'^\s*(\S+)\s+(\S+)')
 
 
 def is_admin():
@@ -37,17 +114,87 @@ def run_as_admin():
     return True
 
 
-class HostsManagerThread(QThread):
-    """Background thread to handle network requests and file operations"""
+CACHE_DIR = os.path.join(os.path.dirname(__file__), 'hosts_backups', '.cache')
+CACHE_TTL = 15 * 60  # Seconds a downloaded rule set is reused without refetching
+
+
+def _until_set(lines, stop):
+    """Yield lines until stop is set"""
+    for line in lines:
+        if stop.is_set():
+            return
+        yield line
+
+
+def _load_cached_rules(target, ttl=CACHE_TTL):
+    """Return cached rules for target if younger than ttl seconds, else None"""
+    path = os.path.join(CACHE_DIR, f'{target}.txt')
+    try:
+        if time.time() - os.path.getmtime(path) < ttl:
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+    except OSError:
+        pass
+    return None
+
+
+def _save_cached_rules(target, rules):
+    """Atomically store downloaded rules for target; failures are ignored"""
+    path = os.path.join(CACHE_DIR, f'{target}.txt')
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(path + '.tmp', 'w', encoding='utf-8', newline='\n') as f:
+            f.write(rules)
+        os.replace(path + '.tmp', path)
+    except OSError:
+        pass
+
+
+# Last read system hosts lines, keyed on (st_mtime_ns, st_size) of the file
+_hosts_cache = {'key': None, 'lines': None}
+
+
+def _read_hosts_lines(hosts_path):
+    """Return the lines of hosts_path, rereading only when the file changed"""
+    st = os.stat(hosts_path)
+    key = (st.st_mtime_ns, st.st_size)
+    if _hosts_cache['key'] != key:
+        with open(hosts_path, 'r', encoding='utf-8') as f:
+            _hosts_cache['lines'] = f.read().splitlines()
+        _hosts_cache['key'] = key
+    return _hosts_cache['lines']
+
+
+def _hosts_digest(lines):
+    """Digest of hosts lines, ignoring the timestamp on the managed section header"""
+    h = hashlib.blake2b()
+    for line in lines:
+        if not line.startswith('# GitHub Hosts Start'):
+            h.update(line.encode('utf-8'))
+            h.update(b'\n')
+    return h.digest()
+
+
+class HostsManagerSignals(QObject):
+    """Signals of a HostsManagerWorker (QRunnable cannot define signals itself)"""
     log_signal = pyqtSignal(str)
     result_signal = pyqtSignal(dict)
     progress_signal = pyqtSignal(int)
+    finished = pyqtSignal()
+
+
+class HostsManagerWorker(QRunnable):
+    """Task run on the shared thread pool to handle network requests and file operations"""
 
     def __init__(self, task_type, data=None, target_type='github'):
         super().__init__()
         self.task_type = task_type  # 'download', 'apply', 'backup', 'restore'
         self.data = data
         self.target_type = target_type  # 'github' or 'replit'
+        self.signals = HostsManagerSignals()
+        self.log_signal = self.signals.log_signal
+        self.result_signal = self.signals.result_signal
+        self.progress_signal = self.signals.progress_signal
 
     def run(self):
         try:
@@ -61,177 +208,144 @@ class HostsManagerThread(QThread):
                 self.restore_backup()
         except Exception as e:
             self.log_signal.emit(f"❌ Error: {str(e)}")
+        finally:
+            self.signals.finished.emit()
 
     def download_hosts(self):
         """Download hosts rules from network sources"""
+        rules = _load_cached_rules(self.target_type)
+        if rules:
+            self.log_signal.emit("📂 Using rules downloaded in the last 15 minutes")
+            self.progress_signal.emit(100)
+            domain_ip_map = self.parse_target_rules(io.StringIO(rules), self.target_type)
+            self.result_signal.emit({'success': True, 'rules': rules,
+                                     'domain_ip_map': domain_ip_map, 'source': 'cache'})
+            return
+
         self.log_signal.emit("📡 Connecting to server...")
         self.progress_signal.emit(10)
 
-        if self.target_type == 'github':
-            sources = [
-                "https://gitee.com/ineo6/hosts/raw/master/hosts",
-                "https://raw.hellogithub.com/hosts",
-                "https://cdn.jsdelivr.net/gh/ineo6/hosts/hosts",
-                "https://gitlab.com/ineo6/hosts/-/raw/master/hosts"
-            ]
-        else:  # replit
-            sources = [
-                # Remove unreliable sources, add new reliable sources
-                "https://cdn.jsdelivr.net/gh/techsharing/toolbox/hosts/replit-hosts",
-                "https://gitee.com/techsharing/toolbox/raw/main/hosts/replit-hosts",
-                "https://raw.githubusercontent.com/521xueweihan/GitHub520/main/hosts",  # This source also contains some replit rules
-                "https://gitlab.com/techsharing/toolbox/-/raw/main/hosts/replit-hosts"
-            ]
-
-        for i, source in enumerate(sources):
-            try:
-                self.log_signal.emit(f"🔄 Trying to download from {source.split('//')[1].split('/')[0]}...")
-                self.progress_signal.emit(20 + i * 15)
+        sources = RULE_SOURCES[self.target_type]
+
+        # Query all sources at once and keep the first one that yields rules
+        stop = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=len(sources))
+        try:
+            futures = {pool.submit(self.fetch_source, source, stop): source for source in sources}
+            for done, future in enumerate(as_completed(futures), 1):
+                self.progress_signal.emit(20 + done * 60 // len(sources))
+                domain_ip_map = future.result()
+                if domain_ip_map:
+                    rules = '\n'.join(f"{ip} {domain}" for domain, ip in domain_ip_map.items())
+                    _save_cached_rules(self.target_type, rules)
+                    self.progress_signal.emit(100)
+                    self.result_signal.emit({'success': True, 'rules': rules,
+                                             'domain_ip_map': domain_ip_map, 'source': futures[future]})
+                    return
+        finally:
+            # Tell the slower sources to drop their downloads and close their sockets
+            stop.set()
+            pool.shutdown(wait=False)
+
+        self.result_signal.emit({'success': False, 'error': 'All sources failed, please check network connection'})
 
-                response = requests.get(source, timeout=10)  # Shorten timeout
+    def fetch_source(self, source, stop):
+        """Download one source and return its domain to IP mapping, or None once stop is set"""
+        try:
+            self.log_signal.emit(f"🔄 Trying to download from {source.split('//')[1].split('/')[0]}...")
+
+            # Parse lines as they arrive instead of buffering the whole body
+            with _SESSION.get(source, timeout=REQUEST_TIMEOUT, stream=True) as response:
+                if stop.is_set():  # Another source already won; leaving closes the socket
+                    return None
                 if response.status_code == 200:
-                    self.log_signal.emit("✅ Download successful, parsing rules...")
-                    self.progress_signal.emit(80)
+                    self.log_signal.emit(f"✅ Connected to {source}, parsing rules...")
+
+                    if response.encoding is None:
+                        response.encoding = 'utf-8'
+                    lines = _until_set(response.iter_lines(chunk_size=65536, decode_unicode=True), stop)
+                    domain_ip_map = self.parse_target_rules(lines, self.target_type)
+                    if stop.is_set():  # Cut short, so the mapping is incomplete
+                        return None
 
-                    if self.target_type == 'github':
-                        rules = self.extract_github_rules(response.text)
-                    else:
-                        rules = self.extract_replit_rules(response.text)
-                
                     # Verify if rules are valid
-                    if rules and not rules.startswith("# Not found"):
-                        self.progress_signal.emit(100)
-                        self.result_signal.emit({'success': True, 'rules': rules, 'source': source})
-                        return
-                    else:
-                        self.log_signal.emit("️⚠ Downloaded rules are empty, trying next source...")
-                    
-            except requests.exceptions.Timeout:
-                self.log_signal.emit(f"⚠️  {source} connection timed out")
-                continue
-            except requests.exceptions.ConnectionError:
-                self.log_signal.emit(f"⚠️  {source} connection error")
-                continue
-            except Exception as e:
-                self.log_signal.emit(f"⚠️  {source} failed: {str(e)}")
-                continue
+                    if domain_ip_map:
+                        return domain_ip_map
+                    self.log_signal.emit(f"⚠️  Rules downloaded from {source} are empty")
 
-        self.result_signal.emit({'success': False, 'error': 'All sources failed, please check network connection'})
+        except Exception as e:
+            # Failures of sources that already lost the race are not worth reporting
+            if not stop.is_set():
+                if isinstance(e, requests.exceptions.Timeout):
+                    self.log_signal.emit(f"⚠️  {source} connection timed out")
+                elif isinstance(e, requests.exceptions.ConnectionError):
+                    self.log_signal.emit(f"⚠️  {source} connection error")
+                else:
+                    self.log_signal.emit(f"⚠️  {source} failed: {str(e)}")
+        return None
 
-    def extract_github_rules(self, content):
-        """Extract GitHub related rules"""
-        github_rules = []
-        lines = content.split('\n')
+    def parse_target_rules(self, lines, target):
+        """Filter raw hosts lines for target and parse them in one pass, return domain to IP mapping"""
+        literal = TARGET_LITERALS[target]
+        pattern = TARGET_PATTERNS[target]
+        domain_ip_map = {}
 
         for line in lines:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                if any(domain in line for domain in [
-                    'github.com', 'github.global.ssl.fastly.net',
-                    'assets-cdn.github.com', 'github.githubassets.com',
-                    'codeload.github.com', 'api.github.com',
-                    'raw.githubusercontent.com', 'user-images.githubusercontent.com',
-                    'favicons.githubusercontent.com', 'camo.githubusercontent.com',
-                    'gist.github.com', 'gist.githubusercontent.com'
-                ]):
-                    github_rules.append(line)
-
-        return '\n'.join(github_rules) if github_rules else "# GitHub related rules not found"
-
-    def extract_replit_rules(self, content):
-        """Extract Replit related rules"""
-        replit_rules = []
-        lines = content.split('\n')
+            if literal not in line:  # Cheap literal gate before the full match
+                continue
+            m = _HOSTS_LINE_RE.match(line)
+            if m and not m.group(1).startswith('#') and pattern.search(line):
+                domain_ip_map[m.group(2)] = m.group(1)
 
-        for line in lines:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                if any(domain in line for domain in [
-                    'replit.com', 'repl.co', 'repl.it',
-                    'cdn.replit.com', 'static.replit.com',
-                    'sp.replit.com', 'replit.app',
-                    'firewalledreplit.com', 'ide.replit.com',
-                    'docs.replit.com', 'api.replit.com',
-                    'eval.replit.com', 'widgets.replit.com'
-                ]):
-                    replit_rules.append(line)
-
-        return '\n'.join(replit_rules) if replit_rules else "# Replit related rules not found"
-
-    def parse_rules(self, rules_text):
-        """Parse rules text, return domain to IP mapping"""
+        return domain_ip_map
+
+    def parse_rules(self, lines):
+        """Parse an iterable of rule lines, return domain to IP mapping"""
         domain_ip_map = {}
-        lines = rules_text.split('\n')
         
         for line in lines:
-            line = line.strip()
-            # Skip empty lines and comment lines
-            if not line or line.startswith('#'):
-                continue
-                
-            # Split IP and domain
-            parts = line.split()
-            if len(parts) >= 2:
-                ip = parts[0]
-                domain = parts[1]
-                domain_ip_map[domain] = ip
+            # Blank lines do not match; comment lines match with a '#' IP field
+            m = _HOSTS_LINE_RE.match(line)
+            if m and not m.group(1).startswith('#'):
+                domain_ip_map[m.group(2)] = m.group(1)
                 
         return domain_ip_map
 
-    def update_hosts_content(self, content, domain_ip_map):
-        """Update hosts file content, replace existing GitHub related entries"""
-        lines = content.split('\n')
+    def update_hosts_content(self, lines, domain_ip_map):
+        """Update hosts file lines, return the new lines without line endings"""
         updated_lines = []
         in_github_section = False
         
-        github_domains = [
-            'alive.github.com', 'api.github.com', 'camo.githubusercontent.com',
-            'central.github.com', 'codeload.github.com', 'collector.github.com',
-            'favicons.githubusercontent.com', 'gist.github.com', 'github.com',
-            'github.community', 'github.githubassets.com', 'github.global.ssl.fastly.net',
-            'live.github.com', 'raw.githubusercontent.com', 'user-images.githubusercontent.com',
-            'education.github.com', 'private-user-images.githubusercontent.com'
-        ]
-        
-        i = 0
-        while i < len(lines):
-            line = lines[i]
+        for line in lines:
             line_stripped = line.strip()
             
-            # Check if entering GitHub rule section
+            # Skip the entire existing GitHub rule section, markers included
+            if in_github_section:
+                if line_stripped.startswith('# GitHub Hosts End'):
+                    in_github_section = False
+                continue
             if line_stripped.startswith('# GitHub Hosts Start'):
-                # Skip entire GitHub rule section
-                while i < len(lines) and not lines[i].strip().startswith('# GitHub Hosts End'):
-                    i += 1
-                # Skip end marker line
-                if i < len(lines):
-                    i += 1
+                in_github_section = True
                 continue
                 
-            # Skip empty lines and comment lines
+            # Keep empty lines and comment lines
             if not line_stripped or line_stripped.startswith('#'):
                 updated_lines.append(line)
-                i += 1
                 continue
                 
-            # Split IP and domain
-            parts = line.split()
-            if len(parts) >= 2:
-                domain = parts[1]
-                # If it's a GitHub related domain, update to new IP
-                if domain in github_domains and domain in domain_ip_map:
-                    # Don't add this line, as all GitHub rules will be added uniformly at the end
-                    pass
-                else:
-                    updated_lines.append(line)
-            else:
-                updated_lines.append(line)
-                
-            i += 1
+            # Split IP and domain; GitHub entries that get a new IP are dropped
+            # here, as all GitHub rules will be added uniformly at the end
+            parts = line_stripped.split()
+            if len(parts) >= 2 and parts[1] in _GITHUB_DOMAIN_SET and parts[1] in domain_ip_map:
+                continue
+            updated_lines.append(line)
                 
         # Add GitHub rule section with latest rules
         if domain_ip_map:
             timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            # Reuse the separator left by a previous apply instead of stacking another
+            while updated_lines and not updated_lines[-1].strip():
+                updated_lines.pop()
             updated_lines.append("")
             updated_lines.append(f"# GitHub Hosts Start - Updated at {timestamp}")
             # Sort by domain name for neat output
@@ -239,7 +353,7 @@ class HostsManagerThread(QThread):
                 updated_lines.append(f"{domain_ip_map[domain]} {domain}")
             updated_lines.append("# GitHub Hosts End")
             
-        return '\n'.join(updated_lines)
+        return updated_lines
 
     def apply_hosts(self):
         """Apply rules to hosts file - using safe write method"""
@@ -252,40 +366,57 @@ class HostsManagerThread(QThread):
             self.result_signal.emit({'success': False, 'error': 'Administrator privileges required, please run the program as administrator'})
             return
 
-        # Backup current hosts
-        self.log_signal.emit("📦 Creating backup...")
-        if not self.create_backup():
-            self.result_signal.emit({'success': False, 'error': 'Backup failed'})
-            return
-
         try:
             self.log_signal.emit("📖 Reading existing hosts file...")
-            # Read existing hosts
-            with open(hosts_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Read existing hosts (reused from the last apply if unchanged)
+            lines = _read_hosts_lines(hosts_path)
 
-            # Parse new rules
-            self.log_signal.emit("🔍 Parsing new rules...")
-            domain_ip_map = self.parse_rules(new_rules)
+            # Downloaded rules arrive already parsed; edited text still needs parsing
+            if isinstance(new_rules, dict):
+                domain_ip_map = new_rules
+            else:
+                self.log_signal.emit("🔍 Parsing new rules...")
+                domain_ip_map = self.parse_rules(io.StringIO(new_rules))
 
             # Update hosts content
             self.log_signal.emit("🔄 Updating GitHub related entries...")
-            updated_content = self.update_hosts_content(content, domain_ip_map)
-
-            # Use temporary file for safe writing
-            self.log_signal.emit("💾 Writing updated hosts file...")
-            temp_dir = tempfile.gettempdir()
-            temp_hosts = os.path.join(temp_dir, 'hosts_temp')
+            updated_lines = self.update_hosts_content(lines, domain_ip_map)
 
-            with open(temp_hosts, 'w', encoding='utf-8', newline='\n') as f:
-                f.write(updated_content)
+            # Nothing to back up or write when the rules are already in place
+            if _hosts_digest(updated_lines) == _hosts_digest(lines):
+                self.log_signal.emit("✅ No changes, hosts file already up to date")
+                self.result_signal.emit({'success': True})
+                return
 
-            # Copy temporary file to system hosts location
-            shutil.copy(temp_hosts, hosts_path)
+            # Backup current hosts
+            self.log_signal.emit("📦 Creating backup...")
+            if not self.create_backup():
+                self.result_signal.emit({'success': False, 'error': 'Backup failed'})
+                return
 
-            # Clean up temporary file
-            if os.path.exists(temp_hosts):
+            # Write a temporary file next to hosts so it can be renamed into place
+            self.log_signal.emit("💾 Writing updated hosts file...")
+            # Lines are streamed through a 1 MiB buffer rather than joined first
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', newline='\n',
+                                             buffering=1 << 20,
+                                             dir=os.path.dirname(hosts_path),
+                                             delete=False) as f:
+                temp_hosts = f.name
+                try:
+                    f.writelines(line + '\n' for line in updated_lines)
+                except BaseException:
+                    f.close()
+                    os.remove(temp_hosts)
+                    raise
+
+            # Atomic rename over the system hosts file (same filesystem)
+            _hosts_cache['key'] = None
+            try:
+                shutil.copymode(hosts_path, temp_hosts)
+                os.replace(temp_hosts, hosts_path)
+            except BaseException:
                 os.remove(temp_hosts)
+                raise
 
             self.result_signal.emit({'success': True})
 
@@ -301,26 +432,10 @@ class HostsManagerThread(QThread):
         in_target_section = False
         section_start_marker = f"# {target_type.capitalize()} Hosts Start"
         section_end_marker = f"# {target_type.capitalize()} Hosts End"
+        target_literal = TARGET_LITERALS[target_type]
 
         # Determine domains to clean based on target type
-        if target_type == 'github':
-            target_domains = [
-                'github.com', 'github.global.ssl.fastly.net',
-                'assets-cdn.github.com', 'github.githubassets.com',
-                'codeload.github.com', 'api.github.com',
-                'raw.githubusercontent.com', 'user-images.githubusercontent.com',
-                'favicons.githubusercontent.com', 'camo.githubusercontent.com',
-                'gist.github.com', 'gist.githubusercontent.com'
-            ]
-        else:  # replit
-            target_domains = [
-                'replit.com', 'repl.co', 'repl.it',
-                'cdn.replit.com', 'static.replit.com',
-                'sp.replit.com', 'replit.app',
-                'firewalledreplit.com', 'ide.replit.com',
-                'docs.replit.com', 'api.replit.com',
-                'eval.replit.com', 'widgets.replit.com'
-            ]
+        target_domains = TARGET_DOMAIN_SETS[target_type]
 
         for line in lines:
             stripped = line.strip()
@@ -339,11 +454,11 @@ class HostsManagerThread(QThread):
             if in_target_section:
                 continue
 
-            # Clean up scattered target related rules
-            if (not in_target_section and stripped and
-                    not stripped.startswith('#') and
-                    any(domain in stripped for domain in target_domains)):
-                continue
+            # Clean up scattered target related rules (exact match on the host field)
+            if target_literal in stripped and not stripped.startswith('#'):
+                parts = stripped.split()
+                if len(parts) >= 2 and parts[1] in target_domains:
+                    continue
 
             cleaned_lines.append(line)
 
@@ -381,16 +496,25 @@ class HostsManagerThread(QThread):
 
             hosts_path = self.get_hosts_path()
 
-            # Use temporary file for safe restore
-            temp_dir = tempfile.gettempdir()
-            temp_hosts = os.path.join(temp_dir, 'hosts_restore_temp')
-
-            shutil.copy2(backup_file, temp_hosts)
-            shutil.copy2(temp_hosts, hosts_path)
-
-            # Clean up temporary file
-            if os.path.exists(temp_hosts):
+            # Copy the backup once into a temporary file next to hosts, then rename it into place
+            with open(backup_file, 'rb') as src, \
+                    tempfile.NamedTemporaryFile('wb', dir=os.path.dirname(hosts_path),
+                                                delete=False) as f:
+                temp_hosts = f.name
+                try:
+                    shutil.copyfileobj(src, f, 1 << 20)
+                except BaseException:
+                    f.close()
+                    os.remove(temp_hosts)
+                    raise
+
+            _hosts_cache['key'] = None
+            try:
+                shutil.copymode(hosts_path, temp_hosts)
+                os.replace(temp_hosts, hosts_path)
+            except BaseException:
                 os.remove(temp_hosts)
+                raise
 
             self.result_signal.emit({'success': True})
         except PermissionError as e:
@@ -412,6 +536,7 @@ class HostsManager(QMainWindow):
     def __init__(self):
         super().__init__()
         self.current_rules = ""
+        self.current_rule_map = {}
         self.current_target = "github"  # Default target
         self.init_ui()
         self.check_admin_status()
@@ -496,7 +621,10 @@ class HostsManager(QMainWindow):
         log_layout = QVBoxLayout(log_widget)
         log_layout.addWidget(QLabel("Operation Log:"))
 
-        self.log_edit = QTextEdit()
+        # Plain text with a capped line count keeps appends cheap on long sessions
+        self.log_edit = QPlainTextEdit()
+        self.log_edit.setReadOnly(True)
+        self.log_edit.setMaximumBlockCount(1000)
         self.log_edit.setPlaceholderText("Operation logs will be displayed here...")
         self.log_edit.setMaximumHeight(200)
         log_layout.addWidget(self.log_edit)
@@ -531,8 +659,7 @@ class HostsManager(QMainWindow):
     def log(self, message):
         """Add log information"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_edit.append(f"[{timestamp}] {message}")
-        self.log_edit.moveCursor(QTextCursor.End)
+        self.log_edit.appendPlainText(f"[{timestamp}] {message}")
 
     def set_buttons_enabled(self, enabled):
         """Enable/disable all buttons"""
@@ -549,19 +676,20 @@ class HostsManager(QMainWindow):
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
 
-        self.thread = HostsManagerThread('download', target_type=self.current_target)
-        self.thread.log_signal.connect(self.log)
-        self.thread.result_signal.connect(self.on_download_result)
-        self.thread.progress_signal.connect(self.progress_bar.setValue)
-        self.thread.finished.connect(self.on_thread_finished)
-        self.thread.start()
+        self.worker = HostsManagerWorker('download', target_type=self.current_target)
+        self.worker.signals.log_signal.connect(self.log)
+        self.worker.signals.result_signal.connect(self.on_download_result)
+        self.worker.signals.progress_signal.connect(self.progress_bar.setValue)
+        self.worker.signals.finished.connect(self.on_worker_finished)
+        QThreadPool.globalInstance().start(self.worker)
 
     def on_download_result(self, result):
         """Handle download result"""
         if result['success']:
             self.current_rules = result['rules']
+            self.current_rule_map = result['domain_ip_map']
             self.rules_edit.setPlainText(self.current_rules)
-            rule_count = len(self.current_rules.splitlines())
+            rule_count = len(self.current_rule_map)
             target_name = "GitHub" if self.current_target == "github" else "Replit"
             self.log(f"✅ {target_name} rules successfully obtained, total {rule_count} entries")
             self.statusBar().showMessage(f"{target_name} rules downloaded successfully")
@@ -595,12 +723,17 @@ class HostsManager(QMainWindow):
             self.log(f"Starting to apply {target_name} rules to system hosts file...")
             self.set_buttons_enabled(False)
 
-            self.current_rules = self.rules_edit.toPlainText()
-            self.thread = HostsManagerThread('apply', self.current_rules, self.current_target)
-            self.thread.log_signal.connect(self.log)
-            self.thread.result_signal.connect(self.on_apply_result)
-            self.thread.finished.connect(self.on_thread_finished)
-            self.thread.start()
+            # Hand over the parsed map unless the user edited the downloaded rules
+            rules_text = self.rules_edit.toPlainText()
+            if rules_text != self.current_rules or not self.current_rule_map:
+                self.current_rules = rules_text
+                self.current_rule_map = {}
+            rules = self.current_rule_map or self.current_rules
+            self.worker = HostsManagerWorker('apply', rules, self.current_target)
+            self.worker.signals.log_signal.connect(self.log)
+            self.worker.signals.result_signal.connect(self.on_apply_result)
+            self.worker.signals.finished.connect(self.on_worker_finished)
+            QThreadPool.globalInstance().start(self.worker)
 
     def on_apply_result(self, result):
         """Handle apply result"""
@@ -620,11 +753,11 @@ class HostsManager(QMainWindow):
         self.log("Creating hosts file backup...")
         self.set_buttons_enabled(False)
 
-        self.thread = HostsManagerThread('backup')
-        self.thread.log_signal.connect(self.log)
-        self.thread.result_signal.connect(self.on_backup_result)
-        self.thread.finished.connect(self.on_thread_finished)
-        self.thread.start()
+        self.worker = HostsManagerWorker('backup')
+        self.worker.signals.log_signal.connect(self.log)
+        self.worker.signals.result_signal.connect(self.on_backup_result)
+        self.worker.signals.finished.connect(self.on_worker_finished)
+        QThreadPool.globalInstance().start(self.worker)
 
     def on_backup_result(self, result):
         """Handle backup result"""
@@ -655,11 +788,11 @@ class HostsManager(QMainWindow):
             self.log(f"Starting to restore hosts file from {backup_file}...")
             self.set_buttons_enabled(False)
 
-            self.thread = HostsManagerThread('restore', backup_file)
-            self.thread.log_signal.connect(self.log)
-            self.thread.result_signal.connect(self.on_restore_result)
-            self.thread.finished.connect(self.on_thread_finished)
-            self.thread.start()
+            self.worker = HostsManagerWorker('restore', backup_file)
+            self.worker.signals.log_signal.connect(self.log)
+            self.worker.signals.result_signal.connect(self.on_restore_result)
+            self.worker.signals.finished.connect(self.on_worker_finished)
+            QThreadPool.globalInstance().start(self.worker)
 
     def on_restore_result(self, result):
         """Handle restore result"""
@@ -671,8 +804,8 @@ class HostsManager(QMainWindow):
             self.log(f"❌ Backup restore failed: {result.get('error', 'Unknown error')}")
             QMessageBox.critical(self, "Error", f"Restore failed: {result.get('error', 'Unknown error')}")
 
-    def on_thread_finished(self):
-        """Cleanup work when thread finishes"""
+    def on_worker_finished(self):
+        """Cleanup work when a worker finishes"""
         self.set_buttons_enabled(True)
         self.progress_bar.setVisible(False)
 
@@ -262,7 +262,8 @@ class EnhancedHostsManagerThread(QThread):
                 return
             
             # List all backup files
-            backups = [f for f in os.listdir(backup_dir) if f.startswith('hosts_backup_')]
+            with os.scandir(backup_dir) as it:
+                backups = [e.name for e in it if e.name.startswith('hosts_backup_') and e.is_file()]
             if not backups:
                 self.log_signal.emit("❌ No backup files found")
                 self.result_signal.emit({'success': False, 'error': 'No backup files found'})
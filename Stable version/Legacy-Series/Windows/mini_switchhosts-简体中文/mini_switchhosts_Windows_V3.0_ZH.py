@@ -262,7 +262,8 @@ class EnhancedHostsManagerThread(QThread):
                 return
             
             # 列出所有备份文件
-            backups = [f for f in os.listdir(backup_dir) if f.startswith('hosts_backup_')]
+            with os.scandir(backup_dir) as it:
+                backups = [e.name for e in it if e.name.startswith('hosts_backup_') and e.is_file()]
             if not backups:
                 self.log_signal.emit("❌ 未找到备份文件")
                 self.result_signal.emit({'success': False, 'error': '未找到备份文件'})
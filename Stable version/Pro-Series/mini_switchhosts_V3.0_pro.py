@@ -8,17 +8,24 @@ Supports Windows, Linux, and macOS with multilingual interface
 
 import sys
 import os
+import re
 import requests
+from requests.adapters import HTTPAdapter
 import shutil
 import ctypes
-import tempfile
-import threading
 import platform
+import threading
 import json
 import zipfile
 import urllib.request
 import hashlib
 from datetime import datetime
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor, as_completed
+try:
+    import orjson  # Optional: faster rule set (de)serialization
+except ImportError:
+    orjson = None
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                             QHBoxLayout, QTextEdit, QPushButton, QLabel,
                             QMessageBox, QFileDialog, QSplitter, QProgressBar,
@@ -31,6 +38,37 @@ from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QSettings, QUrl
 from PyQt5.QtGui import QFont, QTextCursor, QIcon, QPalette, QColor, QDesktopServices
 
 
+# Resolved once; plugins, rule sets and backups all live next to the script
+_APP_DIR = os.path.dirname(os.path.abspath(__file__))
+_BACKUP_DIR = os.path.join(_APP_DIR, 'backups')
+
+_IP_RE = re.compile(r'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$')
+
+GITHUB_DOMAINS = frozenset({
+    'github.com', 'github.global.ssl.fastly.net',
+    'assets-cdn.github.com', 'github.githubassets.com',
+    'codeload.github.com', 'api.github.com',
+    'raw.githubusercontent.com', 'user-images.githubusercontent.com',
+    'favicons.githubusercontent.com', 'camo.githubusercontent.com',
+    'gist.github.com', 'gist.githubusercontent.com'
+})
+
+REPLIT_DOMAINS = frozenset({
+    'replit.com', 'repl.co', 'repl.it',
+    'cdn.replit.com', 'static.replit.com',
+    'sp.replit.com', 'replit.app',
+    'firewalledreplit.com', 'ide.replit.com',
+    'docs.replit.com', 'api.replit.com',
+    'eval.replit.com', 'widgets.replit.com'
+})
+
+# Shared session so repeated downloads reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
+REQUEST_TIMEOUT = 15
+
+
 def is_admin():
     """Check if the program has administrator privileges"""
     try:
@@ -56,6 +94,24 @@ def run_as_admin():
     return True
 
 
+def is_target_host(host, domains):
+    """Check if host is one of domains or a subdomain of one"""
+    host = host.lower()
+    while host:
+        if host in domains:
+            return True
+        host = host.partition('.')[2]
+    return False
+
+
+def _until_set(lines, stop):
+    """Yield lines until stop is set"""
+    for line in lines:
+        if stop.is_set():
+            return
+        yield line
+
+
 def get_system_language():
     """Get system default language"""
     import locale
@@ -73,11 +129,13 @@ class PluginManager:
     
     def __init__(self, parent):
         self.parent = parent
-        self.plugins = {}
-        self.plugin_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'plugins')
-        if not os.path.exists(self.plugin_dir):
-            os.makedirs(self.plugin_dir)
-        self.load_plugins()
+        self.plugin_dir = os.path.join(_APP_DIR, 'plugins')
+        os.makedirs(self.plugin_dir, exist_ok=True)
+    
+    @cached_property
+    def plugins(self):
+        """Available plugins, scanned on first access"""
+        return self.load_plugins()
     
     def load_plugins(self):
         """Load available plugins"""
@@ -135,17 +193,25 @@ class RuleSetManager:
     """Advanced rule set management system"""
     
     def __init__(self):
-        self.rule_sets = {}
         self.current_rule_set = 'default'
-        self.rule_sets_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'rule_sets.json')
-        self.load_rule_sets()
+        self.rule_sets_file = os.path.join(_APP_DIR, 'rule_sets.json')
+    
+    @cached_property
+    def rule_sets(self):
+        """Rule sets, loaded from file on first access"""
+        return self.load_rule_sets()
     
     def load_rule_sets(self):
         """Load rule sets from file"""
+        self.rule_sets = {}
         if os.path.exists(self.rule_sets_file):
             try:
-                with open(self.rule_sets_file, 'r', encoding='utf-8') as f:
-                    self.rule_sets = json.load(f)
+                if orjson is not None:
+                    with open(self.rule_sets_file, 'rb') as f:
+                        self.rule_sets = orjson.loads(f.read())
+                else:
+                    with open(self.rule_sets_file, 'r', encoding='utf-8') as f:
+                        self.rule_sets = json.load(f)
             except Exception as e:
                 print(f"Error loading rule sets: {str(e)}")
         else:
@@ -159,12 +225,20 @@ class RuleSetManager:
                 }
             }
             self.save_rule_sets()
+        return self.rule_sets
     
     def save_rule_sets(self):
         """Save rule sets to file"""
+        # Write a sibling temp file and swap it in, so a crash never leaves a torn file
+        temp_file = self.rule_sets_file + '.tmp'
         try:
-            with open(self.rule_sets_file, 'w', encoding='utf-8') as f:
-                json.dump(self.rule_sets, f, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                with open(temp_file, 'wb') as f:
+                    f.write(orjson.dumps(self.rule_sets, option=orjson.OPT_INDENT_2))
+            else:
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.rule_sets, f, ensure_ascii=False, indent=2)
+            os.replace(temp_file, self.rule_sets_file)
         except Exception as e:
             print(f"Error saving rule sets: {str(e)}")
     
@@ -278,106 +352,98 @@ class EnhancedHostsManagerThread(QThread):
                 "https://cdn.jsdelivr.net/gh/techsharing/toolbox/hosts/replit-hosts"
             ]
 
-        # Concurrent requests for faster downloads
-        results = {}
-        threads = []
-        
-        def fetch_source(source, index):
-            try:
-                host = source.split('//')[1].split('/')[0]
-                msg = f"🔄 Fetching from {host}..." if self.language == 'en' else f"🔄 正在从 {host} 获取..."
-                self.log_signal.emit(msg)
-                response = requests.get(source, timeout=15)
-                if response.status_code == 200:
-                    results[index] = response.text
-            except Exception as e:
-                msg = f"⚠️  {source} failed: {str(e)}" if self.language == 'en' else f"⚠️  {source} 失败: {str(e)}"
-                self.log_signal.emit(msg)
-
-        # Start concurrent requests
-        for i, source in enumerate(sources):
-            thread = threading.Thread(target=fetch_source, args=(source, i))
-            threads.append(thread)
-            thread.start()
-            self.progress_signal.emit(20 + i * 15)
-
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
+        # Concurrent requests; the first source to yield rules wins
+        rules = None
+        stop = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=len(sources))
+        try:
+            futures = {pool.submit(self.fetch_source, source, stop): source for source in sources}
+            for done, future in enumerate(as_completed(futures), 1):
+                self.progress_signal.emit(20 + done * 60 // len(sources))
+                rules = future.result()
+                if rules is not None:
+                    source = futures[future]
+                    break
+        finally:
+            # Tell the slower sources to drop their downloads and close their sockets
+            stop.set()
+            pool.shutdown(wait=False)
 
         self.progress_signal.emit(80)
         
         # Process results
-        if results:
-            # Use the first successful result
-            content = results[0] if 0 in results else list(results.values())[0]
-            
-            if self.target_type == 'github':
-                rules = self.extract_github_rules_enhanced(content)
-            else:
-                rules = self.extract_replit_rules_enhanced(content)
-            
+        if rules is not None:
             self.progress_signal.emit(100)
             source_msg = "Source" if self.language == 'en' else "来源"
             success_msg = "✅ Enhanced download completed successfully" if self.language == 'en' else "✅ 增强版下载成功完成"
-            self.result_signal.emit({'success': True, 'rules': rules, 'source': sources[0], 'message': f"{success_msg}\n{source_msg}: {sources[0]}"})
+            self.result_signal.emit({'success': True, 'rules': rules, 'source': source, 'message': f"{success_msg}\n{source_msg}: {source}"})
         else:
             error_msg = "All sources failed" if self.language == 'en' else "所有源都尝试失败"
             self.result_signal.emit({'success': False, 'error': error_msg})
 
-    def extract_github_rules_enhanced(self, content):
-        """Enhanced extraction with smart filtering"""
+    def fetch_source(self, source, stop):
+        """Download one source and return its extracted rules, or None once stop is set"""
+        try:
+            host = source.split('//')[1].split('/')[0]
+            msg = f"🔄 Fetching from {host}..." if self.language == 'en' else f"🔄 正在从 {host} 获取..."
+            self.log_signal.emit(msg)
+            # Filter lines as they arrive instead of buffering the whole body
+            with _SESSION.get(source, timeout=REQUEST_TIMEOUT, stream=True) as response:
+                if stop.is_set():  # Another source already won; leaving closes the socket
+                    return None
+                if response.status_code == 200:
+                    if response.encoding is None:
+                        response.encoding = 'utf-8'
+                    lines = _until_set(response.iter_lines(chunk_size=65536, decode_unicode=True), stop)
+                    if self.target_type == 'github':
+                        rules = self.extract_github_rules_enhanced(lines)
+                    else:
+                        rules = self.extract_replit_rules_enhanced(lines)
+                    # Extractors return a comment when nothing matched; a stopped read is incomplete
+                    if not stop.is_set() and not rules.startswith('#'):
+                        return rules
+        except Exception as e:
+            # Failures of sources that already lost the race are not worth reporting
+            if not stop.is_set():
+                msg = f"⚠️  {source} failed: {str(e)}" if self.language == 'en' else f"⚠️  {source} 失败: {str(e)}"
+                self.log_signal.emit(msg)
+        return None
+
+    def extract_github_rules_enhanced(self, lines):
+        """Enhanced extraction with smart filtering from an iterable of lines"""
         github_rules = []
-        lines = content.split('\n')
 
         for line in lines:
             line = line.strip()
             if line and not line.startswith('#'):
-                if any(domain in line for domain in [
-                    'github.com', 'github.global.ssl.fastly.net',
-                    'assets-cdn.github.com', 'github.githubassets.com',
-                    'codeload.github.com', 'api.github.com',
-                    'raw.githubusercontent.com', 'user-images.githubusercontent.com',
-                    'favicons.githubusercontent.com', 'camo.githubusercontent.com',
-                    'gist.github.com', 'gist.githubusercontent.com'
-                ]):
-                    # Smart filtering - check if rule seems valid
-                    parts = line.split()
-                    if len(parts) >= 2 and self.is_valid_ip(parts[0]):
-                        github_rules.append(line)
+                # Only the host field decides; aliases and trailing comments are ignored
+                parts = line.split(None, 2)
+                if (len(parts) >= 2 and is_target_host(parts[1], GITHUB_DOMAINS)
+                        and self.is_valid_ip(parts[0])):
+                    github_rules.append(line)
 
         not_found_msg = "# GitHub related rules not found" if self.language == 'en' else "# 未找到GitHub相关规则"
         return '\n'.join(github_rules) if github_rules else not_found_msg
 
-    def extract_replit_rules_enhanced(self, content):
-        """Enhanced extraction with smart filtering for Replit"""
+    def extract_replit_rules_enhanced(self, lines):
+        """Enhanced extraction with smart filtering for Replit from an iterable of lines"""
         replit_rules = []
-        lines = content.split('\n')
 
         for line in lines:
             line = line.strip()
             if line and not line.startswith('#'):
-                if any(domain in line for domain in [
-                    'replit.com', 'repl.co', 'repl.it',
-                    'cdn.replit.com', 'static.replit.com',
-                    'sp.replit.com', 'replit.app',
-                    'firewalledreplit.com', 'ide.replit.com',
-                    'docs.replit.com', 'api.replit.com',
-                    'eval.replit.com', 'widgets.replit.com'
-                ]):
-                    # Smart filtering - check if rule seems valid
-                    parts = line.split()
-                    if len(parts) >= 2 and self.is_valid_ip(parts[0]):
-                        replit_rules.append(line)
+                # Only the host field decides; aliases and trailing comments are ignored
+                parts = line.split(None, 2)
+                if (len(parts) >= 2 and is_target_host(parts[1], REPLIT_DOMAINS)
+                        and self.is_valid_ip(parts[0])):
+                    replit_rules.append(line)
 
         not_found_msg = "# Replit related rules not found" if self.language == 'en' else "# 未找到Replit相关规则"
         return '\n'.join(replit_rules) if replit_rules else not_found_msg
 
     def is_valid_ip(self, ip_str):
         """Check if string is a valid IP address"""
-        import re
-        ip_pattern = r'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$'
-        return re.match(ip_pattern, ip_str) is not None
+        return _IP_RE.match(ip_str) is not None
 
     def apply_hosts(self):
         """Apply rules to system hosts file"""
@@ -408,45 +474,24 @@ class EnhancedHostsManagerThread(QThread):
             section_start_marker = "# === GitHub & Replit Hosts Rules Start ==="
             section_end_marker = "# === GitHub & Replit Hosts Rules End ==="
             
-            # Remove existing section if present
-            lines = current_content.split('\n')
-            new_lines = []
-            in_target_section = False
-            
-            for line in lines:
-                stripped = line.strip()
-                
-                # Detect section start
-                if stripped.startswith(section_start_marker):
-                    in_target_section = True
-                    continue
-                
-                # Detect section end
-                if stripped.startswith(section_end_marker):
-                    in_target_section = False
-                    continue
-                
-                # Skip lines in target section
-                if in_target_section:
-                    continue
-                
-                # Add line if not in target section
-                new_lines.append(line)
+            # Cut out the existing section, if present, around its two unique markers
+            head, sep, rest = current_content.partition(section_start_marker)
+            if sep:
+                _, _, tail = rest.partition(section_end_marker)
+                current_content = head + tail.lstrip('\n')
             
-            # Add new rules section
+            # Add new rules section at the end
             timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             target_name = "GitHub & Replit" if self.language == 'en' else "GitHub和Replit"
-            new_lines.append("")
-            new_lines.append(section_start_marker)
-            new_lines.append(f"# {target_name} Hosts Rules")
-            new_lines.append(f"# Updated: {timestamp}")
-            new_lines.append(self.data)
-            new_lines.append(section_end_marker)
-            new_lines.append("")
+            new_section = (f"\n{section_start_marker}\n"
+                           f"# {target_name} Hosts Rules\n"
+                           f"# Updated: {timestamp}\n"
+                           f"{self.data}\n"
+                           f"{section_end_marker}\n")
             
             # Write back to hosts file
             with open(hosts_path, 'w', encoding='utf-8', newline='\n') as f:
-                f.write('\n'.join(new_lines))
+                f.write(current_content.rstrip('\n') + '\n' + new_section)
             
             success_msg = "Rules applied successfully" if self.language == 'en' else "规则应用成功"
             self.result_signal.emit({'success': True, 'message': success_msg})
@@ -480,14 +525,12 @@ class EnhancedHostsManagerThread(QThread):
     def create_backup_internal(self, hosts_path):
         """Internal method to create backup"""
         # Create backup directory if not exists
-        backup_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backups')
-        if not os.path.exists(backup_dir):
-            os.makedirs(backup_dir)
+        os.makedirs(_BACKUP_DIR, exist_ok=True)
         
         # Generate backup filename with timestamp
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         backup_filename = f"hosts_backup_{timestamp}.txt"
-        backup_path = os.path.join(backup_dir, backup_filename)
+        backup_path = os.path.join(_BACKUP_DIR, backup_filename)
         
         # Copy hosts file to backup location
         shutil.copy2(hosts_path, backup_path)
@@ -505,33 +548,27 @@ class EnhancedHostsManagerThread(QThread):
                 self.result_signal.emit({'success': False, 'error': error_msg})
                 return
 
-            # Let user select backup file
-            backup_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backups')
-            
-            if self.language == 'en':
-                backup_file, _ = QFileDialog.getOpenFileName(
-                    None, 'Select Backup File', backup_dir, 'Text Files (*.txt);;All Files (*)')
-            else:
-                backup_file, _ = QFileDialog.getOpenFileName(
-                    None, '选择备份文件', backup_dir, '文本文件 (*.txt);;所有文件 (*)')
-            
+            # The backup file is chosen in the window before the thread starts
+            backup_file = self.data
             if not backup_file:
-                cancel_msg = "Operation cancelled" if self.language == 'en' else "操作已取消"
-                self.result_signal.emit({'success': False, 'error': cancel_msg})
+                error_msg = "No backup file specified" if self.language == 'en' else "未指定备份文件"
+                self.result_signal.emit({'success': False, 'error': error_msg})
                 return
 
             hosts_path = self.get_hosts_path()
             
-            # Use temporary file for safe restore
-            temp_dir = tempfile.gettempdir()
-            temp_hosts = os.path.join(temp_dir, 'hosts_restore_temp')
-
-            shutil.copy2(backup_file, temp_hosts)
-            shutil.copy2(temp_hosts, hosts_path)
-
-            # Clean up temporary file
-            if os.path.exists(temp_hosts):
-                os.remove(temp_hosts)
+            # Copy once into a sibling of the hosts file, then swap it in atomically
+            temp_hosts = hosts_path + '.tmp'
+            try:
+                with open(backup_file, 'rb') as src, open(temp_hosts, 'wb', buffering=0) as dst:
+                    shutil.copyfileobj(src, dst, 2 * 1024 * 1024)
+                    os.fsync(dst.fileno())
+                shutil.copymode(hosts_path, temp_hosts)
+                os.replace(temp_hosts, hosts_path)
+            except BaseException:
+                if os.path.exists(temp_hosts):
+                    os.remove(temp_hosts)
+                raise
 
             success_msg = "Backup restored successfully" if self.language == 'en' else "备份恢复成功"
             self.result_signal.emit({'success': True, 'message': success_msg})
@@ -664,6 +701,9 @@ class ProHostsManager(QMainWindow):
         
         # Settings tab
         self.create_settings_tab()
+        
+        # Rule set and plugin lists are filled when their tab is first shown
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
 
         layout.addWidget(self.tab_widget)
 
@@ -820,7 +860,6 @@ class ProHostsManager(QMainWindow):
         
         # Rule sets list
         self.rule_sets_list = QListWidget()
-        self.update_rule_sets_list()
         rule_sets_group_layout.addWidget(self.rule_sets_list)
         
         # Rule set actions
@@ -835,6 +874,7 @@ class ProHostsManager(QMainWindow):
         rule_sets_group_layout.addLayout(rule_set_actions_layout)
         
         rule_sets_layout.addWidget(rule_sets_group)
+        self.rule_sets_tab = rule_sets_tab
         self.tab_widget.addTab(rule_sets_tab, "Rule Sets" if self.language == 'en' else "规则集")
 
     def create_plugins_tab(self):
@@ -848,7 +888,6 @@ class ProHostsManager(QMainWindow):
         
         # Plugins list
         self.plugins_list = QListWidget()
-        self.update_plugins_list()
         plugins_group_layout.addWidget(self.plugins_list)
         
         # Plugin actions
@@ -871,6 +910,7 @@ class ProHostsManager(QMainWindow):
         plugins_group_layout.addLayout(repo_layout)
         
         plugins_layout.addWidget(plugins_group)
+        self.plugins_tab = plugins_tab
         self.tab_widget.addTab(plugins_tab, "Plugins" if self.language == 'en' else "插件")
 
     def create_settings_tab(self):
@@ -1193,14 +1233,27 @@ class ProHostsManager(QMainWindow):
                                    confirm_msg, QMessageBox.Yes | QMessageBox.No)
 
         if reply == QMessageBox.Yes:
-            self.log("Starting to restore hosts file from backup..." if self.language == 'en' else "开始从备份恢复 hosts 文件...")
-            self.set_buttons_enabled(False)
+            # Non-modal dialog on the GUI thread; the restore starts once a file is picked
+            if self.language == 'en':
+                dialog = QFileDialog(self, 'Select Backup File', _BACKUP_DIR, 'Text Files (*.txt);;All Files (*)')
+            else:
+                dialog = QFileDialog(self, '选择备份文件', _BACKUP_DIR, '文本文件 (*.txt);;所有文件 (*)')
+            dialog.setFileMode(QFileDialog.ExistingFile)
+            dialog.setAttribute(Qt.WA_DeleteOnClose)
+            dialog.fileSelected.connect(self._start_restore_thread)
+            dialog.rejected.connect(lambda: self.log("Operation cancelled" if self.language == 'en' else "操作已取消"))
+            dialog.open()
+
+    def _start_restore_thread(self, backup_file):
+        """Restore the chosen backup file in a worker thread"""
+        self.log("Starting to restore hosts file from backup..." if self.language == 'en' else "开始从备份恢复 hosts 文件...")
+        self.set_buttons_enabled(False)
 
-            self.thread = EnhancedHostsManagerThread('restore', language=self.language)
-            self.thread.log_signal.connect(self.log)
-            self.thread.result_signal.connect(self.on_restore_result)
-            self.thread.finished.connect(self.on_thread_finished)
-            self.thread.start()
+        self.thread = EnhancedHostsManagerThread('restore', backup_file, language=self.language)
+        self.thread.log_signal.connect(self.log)
+        self.thread.result_signal.connect(self.on_restore_result)
+        self.thread.finished.connect(self.on_thread_finished)
+        self.thread.start()
 
     def on_restore_result(self, result):
         """Handle restore result"""
@@ -1383,6 +1436,14 @@ class ProHostsManager(QMainWindow):
             QMessageBox.warning(self, "Warning" if self.language == 'en' else "警告", 
                               "Please select a rule set to delete" if self.language == 'en' else "请选择要删除的规则集")
 
+    def on_tab_changed(self, index):
+        """Fill the rule set or plugin list the first time its tab is shown"""
+        widget = self.tab_widget.widget(index)
+        if widget is self.rule_sets_tab and not self.rule_sets_list.count():
+            self.update_rule_sets_list()
+        elif widget is self.plugins_tab and not self.plugins_list.count():
+            self.update_plugins_list()
+
     def update_rule_sets_list(self):
         """Update rule sets list"""
         self.rule_sets_list.clear()